@@ -23,6 +23,11 @@ class FeedbackBase(BaseModel):
 
 class FeedbackSubmission(FeedbackBase):
     user: Optional[str] = "Anonymous"
+    # Tourist site and service provider the feedback is about, when known
+    site: Optional[str] = None
+    provider_id: Optional[str] = None
+    # Language of the comment; scored by that language's lexicon when one exists
+    language: str = "en"
 
 class Feedback(FeedbackBase):
     id: str
@@ -43,8 +48,11 @@ class SentimentAnalysis(BaseModel):
     sentiment: SentimentLabel
     score: float
     confidence: float
-    subjectivity: float
+    # None when cascade mode labelled the text from VADER alone
+    subjectivity: Optional[float] = None
     vader_scores: Dict[str, float]
+    # Language the text was scored in (English when no scorer exists for the requested one)
+    language: Optional[str] = None
     timestamp: str
     keywords: Optional[List[str]] = None
 
@@ -1,12 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any, List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, AsyncIterator, Optional
+import asyncio
 import json
+import os
 
 
 from ..services.blockchain_service import BlockchainService
+from ..utils.ndjson import dump_line
 
 router = APIRouter()
-blockchain_service = BlockchainService()
+blockchain_service = BlockchainService(
+    block_interval=float(os.getenv("BLOCKCHAIN_BLOCK_INTERVAL", "1.0")),
+    confirm_batch_size=int(os.getenv("BLOCKCHAIN_CONFIRM_BATCH_SIZE", "500")),
+    seed=int(os.getenv("BLOCKCHAIN_SEED", "42")),
+    chain_id=int(os.getenv("BLOCKCHAIN_CHAIN_ID", "1337")),
+    mempool_size=int(os.getenv("BLOCKCHAIN_MEMPOOL_SIZE", "10000")),
+    mempool_max_age=float(os.getenv("BLOCKCHAIN_MEMPOOL_MAX_AGE", "3600")),
+    certificate_batch_max=int(os.getenv("BLOCKCHAIN_CERTIFICATE_BATCH_MAX", "10000"))
+)
+
+@router.on_event("startup")
+async def start_confirmer():
+    blockchain_service.confirmer.start()
+
+@router.on_event("shutdown")
+async def stop_confirmer():
+    await blockchain_service.confirmer.stop()
 
 @router.get("/contracts")
 async def get_deployed_contracts():
@@ -32,6 +52,25 @@ async def get_contract_details(contract_address: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching contract details: {str(e)}")
 
+@router.get("/contracts/{contract_address}/transactions")
+async def get_contract_transactions(
+    contract_address: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500)
+):
+    """
+    Get a contract's transaction history, newest first; pass ``next_cursor`` back as ``cursor`` for the next page
+    """
+    try:
+        page = blockchain_service.get_contract_transactions(contract_address, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching contract transactions: {str(e)}")
+    if page is None:
+        raise HTTPException(status_code=404, detail="Contract not found")
+    return page
+
 @router.post("/contracts/deploy")
 async def deploy_contract(contract_data: Dict[str, Any]):
     """
@@ -44,6 +83,10 @@ async def deploy_contract(contract_data: Dict[str, Any]):
             owner_address=contract_data.get("owner_address", "")
         )
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deploying contract: {str(e)}")
 
@@ -68,12 +111,96 @@ async def create_transaction(transaction_data: Dict[str, Any]):
             from_address=transaction_data.get("from_address", ""),
             to_address=transaction_data.get("to_address", ""),
             value=transaction_data.get("value", 0),
-            data=transaction_data.get("data", {})
+            data=transaction_data.get("data", {}),
+            gas_price=transaction_data.get("gas_price")
         )
         return transaction
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating transaction: {str(e)}")
 
+@router.get("/transactions/confirmations")
+async def stream_confirmations(
+    timeout: float = Query(30, gt=0, le=300, description="Seconds to keep the stream open"),
+    max_events: Optional[int] = Query(None, ge=1, description="Close the stream after this many confirmations")
+):
+    """
+    Subscribe to transaction confirmations as a newline-delimited JSON stream
+    """
+    subscriber = blockchain_service.confirmer.subscribe()
+
+    async def events() -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        sent = 0
+        try:
+            while max_events is None or sent < max_events:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(subscriber.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                sent += 1
+                yield dump_line(event)
+        finally:
+            blockchain_service.confirmer.unsubscribe(subscriber)
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+@router.get("/transactions/confirmer")
+async def get_confirmer_stats():
+    """
+    Get pending transaction count, confirmation throughput and latency, and
+    whether the background confirmer is still running
+    """
+    try:
+        return blockchain_service.confirmer.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching confirmer stats: {str(e)}")
+
+@router.get("/transactions/{tx_hash}")
+async def get_transaction(tx_hash: str):
+    """
+    Get a transaction and its confirmation status
+    """
+    transaction = blockchain_service.get_transaction(tx_hash)
+    if transaction is None:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    return transaction
+
+@router.get("/transactions/{tx_hash}/wait")
+async def wait_for_transaction(tx_hash: str, timeout: float = Query(10, gt=0, le=60)):
+    """
+    Wait (up to ``timeout`` seconds) for a transaction to be confirmed
+    """
+    try:
+        return await blockchain_service.wait_for_transaction(tx_hash, timeout)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error waiting for transaction: {str(e)}")
+
+@router.get("/addresses/{address}/transactions")
+async def get_address_transactions(
+    address: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500)
+):
+    """
+    Get the transactions sent or received by an address, newest first; pass ``next_cursor`` back as ``cursor``
+    """
+    try:
+        return blockchain_service.get_address_transactions(address, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching address transactions: {str(e)}")
+
 @router.get("/network")
 async def get_network_info():
     """
@@ -107,6 +234,26 @@ async def get_recent_blocks(limit: int = 10):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching blocks: {str(e)}")
 
+@router.get("/blocks/{block_number}")
+async def get_block(block_number: int):
+    """
+    Get one block with its transaction hashes
+    """
+    block = blockchain_service.get_block(block_number)
+    if block is None:
+        raise HTTPException(status_code=404, detail="Block not found")
+    return block
+
+@router.get("/chain/verify")
+async def verify_chain():
+    """
+    Check the hash links and Merkle roots of the local chain
+    """
+    try:
+        return dict(blockchain_service.chain.get_stats(), valid=blockchain_service.chain.verify())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error verifying chain: {str(e)}")
+
 @router.post("/verify-guide")
 async def verify_guide(guide_data: Dict[str, Any]):
     """
@@ -115,6 +262,10 @@ async def verify_guide(guide_data: Dict[str, Any]):
     try:
         verification = blockchain_service.verify_guide(guide_data)
         return verification
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error verifying guide: {str(e)}")
 
@@ -137,9 +288,54 @@ async def issue_digital_certificate(certificate_data: Dict[str, Any]):
     try:
         certificate = blockchain_service.issue_digital_certificate(certificate_data)
         return certificate
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error issuing certificate: {str(e)}")
 
+@router.post("/certificates/batch")
+async def issue_certificate_batch(batch_data: Dict[str, Any]):
+    """
+    Issue certificates to many recipients under one Merkle root anchored in a single transaction;
+    each certificate comes with its inclusion proof
+    """
+    try:
+        return blockchain_service.issue_certificate_batch(batch_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error issuing certificate batch: {str(e)}")
+
+@router.get("/certificates/batches/{batch_id}")
+async def get_certificate_batch(batch_id: str):
+    """
+    Get a certificate batch's Merkle root and the status of its anchoring transaction
+    """
+    batch = blockchain_service.get_certificate_batch(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Certificate batch not found")
+    return batch
+
+@router.post("/certificates/verify")
+async def verify_certificate_proof(proof_data: Dict[str, Any]):
+    """
+    Verify a batched certificate with its inclusion proof against the anchored Merkle root
+    """
+    certificate = proof_data.get("certificate")
+    proof = proof_data.get("proof")
+    if not isinstance(certificate, dict) or not isinstance(proof, list):
+        raise HTTPException(status_code=400, detail="certificate (object) and proof (list) are required")
+    try:
+        return blockchain_service.verify_certificate_proof(certificate, proof, proof_data.get("merkle_root"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error verifying certificate proof: {str(e)}")
+
 @router.get("/certificates/{certificate_id}")
 async def validate_certificate(certificate_id: str):
     """
@@ -1,30 +1,171 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator, BinaryIO, Literal
+import asyncio
+import os
 
 from ..services.sentiment_service import SentimentService
+from ..services.sentiment_engine import SentimentBatchEngine
+from ..services.sentiment_jobs import SentimentJobQueue, batch_job, FINISHED_STATUSES
+from ..services.sentiment_backfill import SentimentBackfill, DEFAULT_CHECKPOINT_DIR
+from ..services.social_ingestion import SocialIngestionPipeline, build_source, DEFAULT_SOURCE_DIR
+from ..utils.ndjson import iter_ndjson, dump_line, spool_stream
+from ..utils.spike_detector import SpikeDetector
+from ..utils.language_scorers import LanguageRegistry, DEFAULT_LEXICON_DIR, normalize_language
 
 
 from ..models.feedback_model import SentimentAnalysis, FeedbackSubmission
 
 router = APIRouter()
-sentiment_service = SentimentService()
+# Load and freeze the NLP models in this process so forked workers share them
+PRELOAD_MODELS = os.getenv("SENTIMENT_PRELOAD_MODELS", "false").lower() in ("1", "true", "yes")
+sentiment_service = SentimentService(
+    cache_size=int(os.getenv("SENTIMENT_CACHE_SIZE", "10000")),
+    cache_ttl=float(os.getenv("SENTIMENT_CACHE_TTL", "3600")),
+    duplicate_threshold=float(os.getenv("SENTIMENT_DUPLICATE_THRESHOLD", "0.8")),
+    cascade=os.getenv("SENTIMENT_CASCADE", "false").lower() in ("1", "true", "yes"),
+    cascade_band=(
+        float(os.getenv("SENTIMENT_CASCADE_LOW", "-0.5")),
+        float(os.getenv("SENTIMENT_CASCADE_HIGH", "0.5"))
+    ),
+    spike_detector=SpikeDetector(
+        threshold=float(os.getenv("SENTIMENT_SPIKE_THRESHOLD", "3.0")),
+        slack=float(os.getenv("SENTIMENT_SPIKE_SLACK", "0.1")),
+        cooldown_seconds=float(os.getenv("SENTIMENT_SPIKE_COOLDOWN", "300"))
+    ),
+    languages=LanguageRegistry(
+        lexicon_dir=os.getenv("SENTIMENT_LEXICON_DIR", DEFAULT_LEXICON_DIR),
+        max_bytes=int(float(os.getenv("SENTIMENT_LEXICON_MEMORY_MB", "64")) * 1024 * 1024)
+    )
+)
+batch_engine = SentimentBatchEngine(
+    sentiment_service,
+    chunk_size=int(os.getenv("SENTIMENT_BATCH_CHUNK_SIZE", "200")),
+    max_workers=int(os.getenv("SENTIMENT_POOL_WORKERS", "0")) or None,  # 0 = one worker per CPU
+    preload=PRELOAD_MODELS
+)
+if PRELOAD_MODELS:
+    # At import time, so a server that imports the app before forking its workers shares them too
+    sentiment_service.models.preload(sentiment_service.analyze_single_text)
+job_queue = SentimentJobQueue(
+    max_concurrent=int(os.getenv("SENTIMENT_JOB_CONCURRENCY", "2")),
+    result_ttl=float(os.getenv("SENTIMENT_JOB_TTL", "3600")),
+    max_pending=int(os.getenv("SENTIMENT_JOB_MAX_PENDING", "100"))
+)
+backfill = SentimentBackfill(
+    sentiment_service,
+    batch_engine,
+    checkpoint_dir=os.getenv("SENTIMENT_BACKFILL_DIR", DEFAULT_CHECKPOINT_DIR),
+    chunk_size=int(os.getenv("SENTIMENT_BACKFILL_CHUNK_SIZE", "500"))
+)
+# Defaults for social media ingestion jobs (each request may override the batching)
+INGEST_SOURCE_DIR = os.getenv("SENTIMENT_INGEST_SOURCE_DIR", DEFAULT_SOURCE_DIR)
+INGEST_BATCH_SIZE = int(os.getenv("SENTIMENT_INGEST_BATCH_SIZE", "100"))
+INGEST_MAX_WAIT_MS = float(os.getenv("SENTIMENT_INGEST_MAX_WAIT_MS", "500"))
+INGEST_QUEUE_SIZE = int(os.getenv("SENTIMENT_INGEST_QUEUE_SIZE", "1000"))
+INGEST_MAX_IN_FLIGHT = int(os.getenv("SENTIMENT_INGEST_MAX_IN_FLIGHT", "2"))
+INGEST_MAX_RESULTS = int(os.getenv("SENTIMENT_INGEST_MAX_RESULTS", "10000"))
 
 class AnalyzeTextRequest(BaseModel):
     text: str
     language: str = "en"
 
+class KeywordUpdateRequest(BaseModel):
+    group: str
+    terms: List[str]
+
+class CascadeConfigRequest(BaseModel):
+    enabled: Optional[bool] = None
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+class BackfillRequest(BaseModel):
+    # Continue from the last checkpoint when the settings and feedback still match it
+    resume: bool = True
+
+class SocialMediaJobRequest(BaseModel):
+    platform: str
+    query: str
+
+class SocialIngestRequest(BaseModel):
+    source: Literal["fixture", "file"] = "fixture"
+    platform: Optional[str] = None
+    # Only posts containing this text are analyzed
+    query: Optional[str] = None
+    language: str = "en"
+    # File source: an NDJSON file inside SENTIMENT_INGEST_SOURCE_DIR, optionally followed as it grows
+    path: Optional[str] = None
+    follow: bool = False
+    # Fixture source: how many times to replay the sample posts, and the delay between posts
+    repeat: int = 1
+    interval_ms: float = 0
+    batch_size: Optional[int] = None
+    max_wait_ms: Optional[float] = None
+    max_in_flight: Optional[int] = None
+
 class BatchAnalysisRequest(BaseModel):
     texts: List[str]
     language: str = "en"
+    chunk_size: Optional[int] = None
+    # Optional per-text languages (overriding ``language``); texts are grouped by language
+    languages: Optional[List[str]] = None
+    # "full" runs the complete per-text analysis, "bulk" the faster vectorized approximation
+    mode: Literal["full", "bulk"] = "full"
+
+def _check_languages(request: BatchAnalysisRequest):
+    normalize_language(request.language)
+    if request.languages is None:
+        return
+    if len(request.languages) != len(request.texts):
+        raise ValueError("languages must have one entry per text")
+    if request.mode == "bulk":
+        raise ValueError("bulk mode only scores English; use mode \"full\" with languages")
+    for language in request.languages:
+        normalize_language(language)
+
+@router.on_event("startup")
+async def start_batch_engine():
+    # Fork the pool workers first; they warm up in their own processes
+    batch_engine.start()
+    # Warm the in-process models in the background so startup does not wait on NLP
+    asyncio.get_running_loop().run_in_executor(None, sentiment_service.warmup)
+
+@router.on_event("shutdown")
+async def stop_batch_engine():
+    await job_queue.shutdown()
+    batch_engine.shutdown()
+
+@router.get("/ready")
+async def get_readiness():
+    """
+    Report whether the NLP models and batch workers have finished warming up
+    """
+    models = sentiment_service.models.get_status()
+    engine = batch_engine.get_stats()
+    ready = models["ready"] and engine["ready"]
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "models": models, "batch_engine": engine}
+    )
+
+@router.get("/memory")
+async def get_memory_usage():
+    """
+    Get RSS/PSS/USS of the API process and each batch worker
+    """
+    try:
+        return batch_engine.get_memory()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching memory usage: {str(e)}")
 
 @router.get("/analysis", response_model=Dict[str, Any])
-async def get_sentiment_analysis():
+async def get_sentiment_analysis(collapse_duplicates: bool = False):
     """
     Get overall sentiment analysis
     """
     try:
-        analysis = sentiment_service.get_overall_sentiment()
+        analysis = sentiment_service.get_overall_sentiment(collapse_duplicates)
         return analysis
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error performing sentiment analysis: {str(e)}")
@@ -37,6 +178,8 @@ async def analyze_text(request: AnalyzeTextRequest):
     try:
         result = sentiment_service.analyze_single_text(request.text, request.language)
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing text: {str(e)}")
 
@@ -46,11 +189,117 @@ async def analyze_batch(request: BatchAnalysisRequest):
     Analyze sentiment for multiple texts
     """
     try:
-        results = sentiment_service.analyze_batch_texts(request.texts, request.language)
+        _check_languages(request)
+        if request.mode == "bulk":
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, sentiment_service.analyze_bulk, request.texts
+            )
+        elif request.languages is not None:
+            results = await batch_engine.analyze_grouped(request.texts, request.languages, request.chunk_size)
+        else:
+            results = await batch_engine.analyze_batch(request.texts, request.language, request.chunk_size)
         return {"results": results}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing batch texts: {str(e)}")
 
+async def _analyze_micro_batch(items: List[Dict[str, Any]], chunk_size: int) -> List[Dict[str, Any]]:
+    """Analyze one micro-batch of stream items, grouped by language, in input order"""
+    positions = [position for position, item in enumerate(items) if "error" not in item]
+    results = await batch_engine.analyze_grouped(
+        [items[position]["text"] for position in positions],
+        [items[position]["language"] for position in positions],
+        chunk_size
+    )
+
+    output = [
+        {"line": item["line"], "id": item.get("id"), "error": item["error"]} if "error" in item else None
+        for item in items
+    ]
+    for position, result in zip(positions, results):
+        output[position] = {"line": items[position]["line"], "id": items[position].get("id"), **result}
+    return output
+
+def _parse_stream_item(line: int, value: Any, error: str, language: str) -> Dict[str, Any]:
+    """Turn one decoded NDJSON line into a stream item (or an error item)"""
+    if error:
+        return {"line": line, "error": error}
+    if isinstance(value, str):
+        return {"line": line, "text": value, "language": language}
+    if isinstance(value, dict) and isinstance(value.get("text"), str):
+        try:
+            normalize_language(value.get("language") or language)
+        except ValueError as e:
+            return {"line": line, "id": value.get("id"), "error": str(e)}
+        return {
+            "line": line,
+            "id": value.get("id"),
+            "text": value["text"],
+            "language": value.get("language") or language
+        }
+    return {"line": line, "id": value.get("id") if isinstance(value, dict) else None,
+            "error": "expected a JSON string or an object with a \"text\" field"}
+
+async def _stream_analysis(upload: BinaryIO, language: str, batch_size: int,
+                           max_in_flight: int) -> AsyncIterator[str]:
+    """Read NDJSON texts from the spooled upload and yield NDJSON results.
+
+    Up to ``max_in_flight`` micro-batches are analyzed at once; results are
+    written in input order as soon as the oldest batch completes, so memory
+    use is bounded by the micro-batch window rather than the upload size.
+    """
+    chunk_size = max(1, batch_size // batch_engine.max_workers)
+    in_flight: List[asyncio.Task] = []
+    batch: List[Dict[str, Any]] = []
+
+    try:
+        for line, value, error in iter_ndjson(upload):
+            batch.append(_parse_stream_item(line, value, error, language))
+            if len(batch) < batch_size:
+                continue
+            in_flight.append(asyncio.ensure_future(_analyze_micro_batch(batch, chunk_size)))
+            batch = []
+            if len(in_flight) >= max_in_flight:
+                yield "".join(dump_line(result) for result in await in_flight.pop(0))
+
+        if batch:
+            in_flight.append(asyncio.ensure_future(_analyze_micro_batch(batch, chunk_size)))
+        while in_flight:
+            yield "".join(dump_line(result) for result in await in_flight.pop(0))
+    finally:
+        for task in in_flight:
+            task.cancel()
+        upload.close()
+
+@router.post("/analyze-stream")
+async def analyze_stream(
+    request: Request,
+    language: str = Query("en", description="Default language for lines that do not set one"),
+    batch_size: int = Query(200, ge=1, le=5000, description="Texts per micro-batch"),
+    max_in_flight: int = Query(2, ge=1, le=16, description="Micro-batches analyzed concurrently")
+):
+    """
+    Stream sentiment analysis for newline-delimited JSON input.
+
+    Each request line is either a JSON string or an object with ``text`` and
+    optional ``id`` / ``language``. Results are written back as NDJSON in input
+    order, one line per input line, as each micro-batch completes.
+    """
+    try:
+        normalize_language(language)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        upload = await spool_stream(request.stream())
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error reading request body: {str(e)}")
+
+    return StreamingResponse(
+        _stream_analysis(upload, language, batch_size, max_in_flight),
+        media_type="application/x-ndjson"
+    )
+
 @router.get("/feedback-trends")
 async def get_feedback_trends(days: int = 30):
     """
@@ -62,6 +311,95 @@ async def get_feedback_trends(days: int = 30):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sentiment trends: {str(e)}")
 
+@router.get("/feedback-trends/rollups")
+async def get_feedback_rollups(period: str = Query("week", pattern="^(week|month)$")):
+    """
+    Get weekly or monthly sentiment totals for days older than the daily window
+    """
+    try:
+        return sentiment_service.get_sentiment_rollups(period)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching sentiment rollups: {str(e)}")
+
+@router.get("/topics")
+async def get_feedback_topics(
+    limit: int = Query(10, ge=1, le=100),
+    category: Optional[str] = None,
+    days: Optional[int] = Query(None, ge=1, description="Only count feedback from the last N days")
+):
+    """
+    Get the most discussed topics across all feedback
+    """
+    try:
+        return {
+            "topics": sentiment_service.get_feedback_topics(limit, category, days),
+            "stats": sentiment_service.topic_tracker.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching feedback topics: {str(e)}")
+
+@router.get("/aspects")
+async def get_aspect_sentiment(
+    category: Optional[str] = None,
+    all_time: bool = Query(False, description="All feedback instead of the rolling window")
+):
+    """
+    Get sentence-level sentiment per aspect (guide, transport, food, ...)
+    """
+    try:
+        return sentiment_service.get_aspect_sentiment(category, window=not all_time)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching aspect sentiment: {str(e)}")
+
+@router.get("/aspects/{aspect}/trend")
+async def get_aspect_trend(aspect: str, days: int = Query(30, ge=1), category: Optional[str] = None):
+    """
+    Get one aspect's daily sentiment trend
+    """
+    try:
+        return sentiment_service.get_aspect_trend(aspect, days, category)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching aspect trend: {str(e)}")
+
+@router.get("/alerts")
+async def get_sentiment_alerts(
+    after: int = Query(0, ge=0, description="Only alerts with a higher ID (for polling)"),
+    limit: int = Query(100, ge=1, le=1000),
+    dimension: Optional[str] = Query(None, pattern="^(site|category|provider)$")
+):
+    """
+    Get negative-sentiment spike alerts per site, category and provider
+    """
+    try:
+        return sentiment_service.get_sentiment_alerts(after, limit, dimension)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching sentiment alerts: {str(e)}")
+
+@router.get("/alerts/{dimension}/{key}")
+async def get_spike_state(dimension: str, key: str):
+    """
+    Get the current EWMA/CUSUM state of one site, category or provider
+    """
+    try:
+        state = sentiment_service.spike_detector.get_state(dimension, key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"No feedback seen for {dimension} {key}")
+    return state
+
+@router.get("/duplicates")
+async def get_duplicate_feedback(limit: int = Query(20, ge=1, le=200)):
+    """
+    Get the largest clusters of near-duplicate feedback
+    """
+    try:
+        return sentiment_service.get_duplicate_clusters(limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching duplicate feedback: {str(e)}")
+
 @router.get("/category-sentiment")
 async def get_category_sentiment():
     """
@@ -79,7 +417,252 @@ async def submit_feedback(feedback: FeedbackSubmission):
     Submit new feedback and get sentiment analysis
     """
     try:
-        result = sentiment_service.process_feedback(feedback)
+        result = sentiment_service.process_feedback(feedback.dict())
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing feedback: {str(e)}")
+
+@router.get("/keywords")
+async def get_keywords():
+    """
+    Get the tourism keyword and aspect vocabularies
+    """
+    try:
+        return sentiment_service.get_keyword_vocabulary()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching keywords: {str(e)}")
+
+@router.post("/keywords")
+async def add_keywords(request: KeywordUpdateRequest):
+    """
+    Add terms to a keyword or aspect vocabulary
+    """
+    try:
+        return sentiment_service.add_keywords(request.group, request.terms)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating keywords: {str(e)}")
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """
+    Get analysis cache hit/miss/eviction counters
+    """
+    try:
+        return sentiment_service.get_cache_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching cache stats: {str(e)}")
+
+@router.get("/languages")
+async def get_language_scorers():
+    """
+    Get the available and loaded language scorers and their memory use
+    """
+    try:
+        return sentiment_service.languages.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching language scorers: {str(e)}")
+
+@router.get("/cascade")
+async def get_cascade_stats():
+    """
+    Get cascade mode settings and how often the TextBlob fallback ran
+    """
+    try:
+        return sentiment_service.get_cascade_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching cascade stats: {str(e)}")
+
+@router.put("/cascade")
+async def configure_cascade(request: CascadeConfigRequest):
+    """
+    Enable or disable cascade mode and set its ambiguous VADER band
+    """
+    try:
+        band = None
+        if request.low is not None or request.high is not None:
+            low, high = sentiment_service.cascade_band
+            band = (request.low if request.low is not None else low,
+                    request.high if request.high is not None else high)
+        return sentiment_service.configure_cascade(request.enabled, band)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error configuring cascade: {str(e)}")
+
+async def _run_social_media_job(job: Dict[str, Any]):
+    """Job body for social media analysis (synchronous, so run off the event loop)"""
+    analysis = await asyncio.get_running_loop().run_in_executor(
+        None, sentiment_service.analyze_social_media_sentiment, job["params"]["platform"], job["params"]["query"]
+    )
+    job["results"] = analysis.pop("sentiment_analysis")
+    job["total"] = job["processed"] = len(job["results"])
+    job["summary"] = analysis
+
+@router.post("/jobs/batch", status_code=202)
+async def submit_batch_job(request: BatchAnalysisRequest):
+    """
+    Queue batch sentiment analysis and return a job ID to poll
+    """
+    try:
+        _check_languages(request)
+        chunk_size = request.chunk_size or batch_engine.chunk_size
+        if request.mode == "bulk":
+            async def analyze(texts):
+                return await asyncio.get_running_loop().run_in_executor(None, sentiment_service.analyze_bulk, texts)
+        elif request.languages is not None:
+            async def analyze(texts, languages):
+                return await batch_engine.analyze_grouped(texts, languages, chunk_size)
+        else:
+            async def analyze(texts):
+                return await batch_engine.analyze_batch(texts, request.language, chunk_size)
+
+        return job_queue.submit(
+            "batch",
+            len(request.texts),
+            batch_job(analyze, request.texts, chunk_size * batch_engine.max_workers, request.languages),
+            {"language": request.language, "mode": request.mode}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error submitting batch job: {str(e)}")
+
+@router.post("/jobs/social-media", status_code=202)
+async def submit_social_media_job(request: SocialMediaJobRequest):
+    """
+    Queue social media sentiment analysis and return a job ID to poll
+    """
+    try:
+        return job_queue.submit("social_media", 0, _run_social_media_job, request.dict())
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error submitting social media job: {str(e)}")
+
+@router.post("/ingest/social", status_code=202)
+async def submit_social_ingestion(request: SocialIngestRequest):
+    """
+    Start a micro-batched sentiment ingestion job over a social media post source
+    """
+    try:
+        if not 1 <= request.repeat <= 100000:
+            raise ValueError("repeat must be between 1 and 100000")
+        source = build_source(
+            request.source,
+            platform=request.platform,
+            path=request.path,
+            follow=request.follow,
+            repeat=request.repeat,
+            interval=request.interval_ms / 1000,
+            source_dir=INGEST_SOURCE_DIR
+        )
+        pipeline = SocialIngestionPipeline(
+            batch_engine,
+            batch_size=request.batch_size or INGEST_BATCH_SIZE,
+            max_wait_seconds=(request.max_wait_ms if request.max_wait_ms is not None else INGEST_MAX_WAIT_MS) / 1000,
+            queue_size=INGEST_QUEUE_SIZE,
+            max_in_flight=request.max_in_flight or INGEST_MAX_IN_FLIGHT,
+            max_results=INGEST_MAX_RESULTS,
+            language=request.language,
+            query=request.query
+        )
+        params = request.dict(exclude_none=True)
+        params.update(batch_size=pipeline.batch_size, max_in_flight=pipeline.max_in_flight)
+        return job_queue.submit("social_ingest", 0, pipeline.work(source), params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error starting social media ingestion: {str(e)}")
+
+@router.get("/ingest/social")
+async def get_social_ingestions():
+    """
+    Get the status and live metrics of social media ingestion jobs
+    """
+    try:
+        return {
+            "ingestions": [
+                job_queue.get_status(job_id) for job_id, job in list(job_queue.jobs.items())
+                if job["kind"] == "social_ingest"
+            ]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching social media ingestions: {str(e)}")
+
+@router.post("/backfill", status_code=202)
+async def submit_backfill(request: BackfillRequest = BackfillRequest()):
+    """
+    Re-score all stored feedback in the background and swap in the new aggregates
+    """
+    if any(job["kind"] == "backfill" and job["status"] not in FINISHED_STATUSES
+           for job in job_queue.jobs.values()):
+        raise HTTPException(status_code=409, detail="A sentiment backfill is already queued or running")
+    try:
+        return job_queue.submit(
+            "backfill",
+            len(sentiment_service.feedback_data),
+            backfill.work(request.resume),
+            {"resume": request.resume, "chunk_size": backfill.chunk_size}
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error submitting backfill: {str(e)}")
+
+@router.get("/jobs")
+async def get_job_stats():
+    """
+    Get sentiment job counts by status
+    """
+    try:
+        return job_queue.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching job stats: {str(e)}")
+
+@router.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """
+    Get a sentiment job's status and progress
+    """
+    try:
+        return job_queue.get_status(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching job status: {str(e)}")
+
+@router.get("/jobs/{job_id}/results")
+async def get_job_results(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """
+    Get a page of a sentiment job's results
+    """
+    try:
+        return job_queue.get_results(job_id, offset, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching job results: {str(e)}")
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """
+    Cancel a queued or running sentiment job
+    """
+    try:
+        return job_queue.cancel(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing feedback: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error cancelling job: {str(e)}")
@@ -1,5 +1,6 @@
 from .analytics_service import AnalyticsService
 from .sentiment_service import SentimentService
+from .sentiment_engine import SentimentBatchEngine
 from .blockchain_service import BlockchainService
 from .providers_service import ProvidersService
 from .marketplace_service import MarketplaceService
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.local_chain import LocalChain
+from ..utils.mempool import Mempool
+
+logger = logging.getLogger(__name__)
+
+# Recent inclusion latencies and block fill ratios kept for the metrics
+METRICS_WINDOW = 1000
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+class TransactionConfirmer:
+    """Confirms submitted transactions in the background, one block per interval.
+
+    ``submit`` only adds a transaction to the mempool as ``pending`` and
+    returns at once. A background task wakes every ``block_interval``
+    seconds, drops transactions that waited too long and packs the
+    best-paying pending ones that fit under the chain's gas limit (at most
+    ``batch_size``) into the next block of the local chain, so request
+    handlers never wait for confirmation. No block is produced while nothing
+    is pending. Clients can poll a transaction's status, await its
+    confirmation with ``wait_for`` or receive every confirmation through a
+    ``subscribe`` queue. A block that fails to confirm is logged and
+    counted, and the task keeps running.
+    """
+
+    def __init__(self, chain: LocalChain, block_interval: float = 1.0, batch_size: int = 500,
+                 mempool: Optional[Mempool] = None,
+                 on_confirmed: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.chain = chain
+        self.block_interval = max(0.01, block_interval)
+        self.batch_size = max(1, batch_size)
+        self.pending = mempool if mempool is not None else Mempool()
+        self.on_confirmed = on_confirmed
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._subscribers: List[asyncio.Queue] = []
+        self._task: Optional[asyncio.Task] = None
+        self.submitted = 0
+        self.confirmed = 0
+        self.dropped = 0
+        self.blocks = 0
+        self.dropped_events = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latencies: deque = deque(maxlen=METRICS_WINDOW)
+        self._fill_ratios: deque = deque(maxlen=METRICS_WINDOW)
+
+    def submit(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a transaction to the mempool and return it, still pending.
+
+        Raises ValueError if it could never fit in a block and RuntimeError
+        if the mempool is full.
+        """
+        if transaction.get("gas", 0) > self.chain.gas_limit:
+            raise ValueError(f"Transaction gas {transaction.get('gas')} exceeds the block gas limit "
+                             f"of {self.chain.gas_limit}")
+        transaction["status"] = "pending"
+        transaction["block_number"] = None
+        self.pending.add(transaction)
+        self.submitted += 1
+        return transaction
+
+    def cancel(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Withdraw a pending transaction that was submitted but never accepted"""
+        transaction = self.pending.remove(tx_hash)
+        if transaction is not None:
+            self.submitted -= 1
+        return transaction
+
+    def start(self):
+        """Start the background confirmer on the running event loop (once)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the background confirmer; pending transactions stay pending"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.block_interval)
+            if not self.pending:
+                continue
+            try:
+                self.confirm_batch()
+            except Exception as e:
+                # One bad block must not stop confirmation for good
+                self._record_error(e)
+                logger.exception("Confirming a block failed")
+
+    def confirm_batch(self) -> List[Dict[str, Any]]:
+        """Drop stale transactions, then seal the most valuable pending ones into one new block"""
+        for transaction in self.pending.evict_stale():
+            transaction["status"] = "dropped"
+            self.dropped += 1
+            self._finish(transaction)
+
+        packed = self.pending.build_block(self.chain.gas_limit, self.batch_size)
+        if not packed:
+            return []
+        now = self.pending.clock()
+        batch = [transaction for transaction, _ in packed]
+        try:
+            block = self.chain.append_block(batch)
+        except Exception:
+            # Nothing was sealed: put the transactions back for the next block
+            for transaction in batch:
+                self.pending.add(transaction)
+            raise
+        for _, arrival in packed:
+            latency = now - arrival
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+            self._latencies.append(latency)
+        self._fill_ratios.append(block["fill_ratio"])
+        self.blocks += 1
+        self.confirmed += len(batch)
+
+        for transaction in batch:
+            transaction["status"] = "confirmed"
+            transaction["confirmed_at"] = block["timestamp"]
+            if self.on_confirmed is not None:
+                try:
+                    self.on_confirmed(transaction)
+                except Exception as e:
+                    # The transaction is in the block either way; still wake its waiters
+                    self._record_error(e)
+                    logger.exception("Confirmation callback failed for %s", transaction["hash"])
+            self._finish(transaction)
+        return batch
+
+    def _record_error(self, error: Exception):
+        self.errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+
+    def _finish(self, transaction: Dict[str, Any]):
+        """Wake the waiters of a transaction that left the mempool and notify subscribers"""
+        for waiter in self._waiters.pop(transaction["hash"], []):
+            if not waiter.done():
+                waiter.set_result(transaction)
+        self._publish(transaction)
+
+    def _publish(self, transaction: Dict[str, Any]):
+        event = {
+            "hash": transaction["hash"],
+            "status": transaction["status"],
+            "block_number": transaction["block_number"],
+            "type": transaction.get("type"),
+            "confirmed_at": transaction.get("confirmed_at")
+        }
+        for subscriber in self._subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except asyncio.QueueFull:
+                # A slow subscriber misses events rather than holding up confirmation
+                self.dropped_events += 1
+
+    async def wait_for(self, tx_hash: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait until a pending transaction is confirmed or dropped; None if it is not pending or times out"""
+        if tx_hash not in self.pending:
+            return None
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(tx_hash, []).append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(tx_hash)
+            if waiters is not None and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[tx_hash]
+
+    def subscribe(self, maxsize: int = 1000) -> asyncio.Queue:
+        """Get a queue that receives every confirmation (and dropped transaction) from now on"""
+        subscriber: asyncio.Queue = asyncio.Queue(maxsize)
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: asyncio.Queue):
+        """Stop delivering confirmations to a queue"""
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get mempool depth, inclusion latency and block fill ratio"""
+        latencies = list(self._latencies)
+        fill_ratios = list(self._fill_ratios)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "pending": len(self.pending),
+            "submitted": self.submitted,
+            "confirmed": self.confirmed,
+            "dropped": self.dropped,
+            "blocks": self.blocks,
+            "latest_block": self.chain.height,
+            "block_gas_limit": self.chain.gas_limit,
+            "mempool": self.pending.get_stats(),
+            "inclusion_latency_seconds": {
+                "average": round(self._latency_total / self.confirmed, 3) if self.confirmed else 0.0,
+                "p50": round(_percentile(latencies, 0.5), 3),
+                "p95": round(_percentile(latencies, 0.95), 3),
+                "max": round(self._latency_max, 3)
+            },
+            "block_fill_ratio": {
+                "last": fill_ratios[-1] if fill_ratios else 0.0,
+                "average": round(sum(fill_ratios) / len(fill_ratios), 4) if fill_ratios else 0.0
+            },
+            "subscribers": len(self._subscribers),
+            "waiters": sum(len(waiters) for waiters in self._waiters.values()),
+            "dropped_events": self.dropped_events,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "block_interval": self.block_interval,
+            "batch_size": self.batch_size
+        }
@@ -1,20 +1,95 @@
 import json
 import os
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Any, Optional
+from datetime import datetime, timedelta, timezone
 import random
 import hashlib
+import statistics
+import time
 from web3 import Web3
 import requests
 
+from .blockchain_confirmer import TransactionConfirmer
+from ..utils.constants import BLOCKCHAIN_CONSTANTS
+from ..utils.local_chain import LocalChain
+from ..utils.mempool import Mempool, MIN_TRANSACTION_GAS
+from ..utils.merkle import merkle_levels, merkle_proof, verify_proof
+from ..utils.transaction_index import TransactionIndex
+
+# Seconds between the seeded mock transactions of the simulator's history
+HISTORY_SPACING = 2 * 3600
+
+# Gas per byte of transaction data (as for non-zero calldata bytes)
+DATA_GAS_PER_BYTE = 16
+
+# Gas of a mock contract deployment (it must fit in one block)
+CONTRACT_DEPLOYMENT_GAS = 250000
+
+# Gas price (gwei) suggested before any block has transactions
+DEFAULT_GAS_PRICE = 25
+
+
+def _check_transaction_fields(from_address: Any, to_address: Any, value: Any, data: Any):
+    """Raise ValueError for transaction fields of the wrong type, before anything is submitted"""
+    for name, address in (("from_address", from_address), ("to_address", to_address)):
+        if not isinstance(address, str):
+            raise ValueError(f"{name} must be a string")
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise ValueError("value must be a non-negative number")
+    if not isinstance(data, dict):
+        raise ValueError("data must be an object")
+
+
+def _certificate_leaf(certificate: Dict[str, Any]) -> bytes:
+    """Canonical bytes of a certificate payload, the Merkle leaf it is issued under"""
+    return json.dumps(certificate, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
 class BlockchainService:
-    def __init__(self):
+    def __init__(self, block_interval: float = 1.0, confirm_batch_size: int = 500,
+                 seed: int = 42, chain_id: int = 1337, clock: Callable[[], float] = time.time,
+                 block_gas_limit: int = BLOCKCHAIN_CONSTANTS["GAS_LIMIT"], mempool_size: int = 10000,
+                 mempool_max_age: float = 3600, certificate_batch_max: int = 10000):
         self.web3_provider_url = os.getenv("WEB3_PROVIDER_URL", "")
         self.contract_address = os.getenv("CONTRACT_ADDRESS", "")
         self.setup_web3()
+        # Mock data comes from a seeded generator, so the same seed and clock give the same chain
+        self.random = random.Random(seed)
+        self.clock = clock
         self.mock_contracts = self.generate_mock_contracts()
         self.mock_transactions = self.generate_mock_transactions()
+        # Lookups by hash, address and contract, plus per-contract running totals
+        self.transaction_index = TransactionIndex()
+        for tx in reversed(self.mock_transactions):
+            self.transaction_index.add(tx)
         self.verification_requests = {}
+        # Merkle-batched certificates: batch_id -> batch, certificate_id -> (batch_id, leaf index)
+        self.certificate_batch_max = certificate_batch_max
+        self.certificate_batches: Dict[str, Dict[str, Any]] = {}
+        self.batched_certificates: Dict[str, Any] = {}
+        history = [tx for tx in reversed(self.mock_transactions) if tx["status"] == "confirmed"]
+        # Local chain simulator: the confirmed mock history, one transaction per block, ends at block 18000000
+        self.chain = LocalChain(
+            chain_id=chain_id,
+            start_block=18000000 - len(history),
+            gas_limit=block_gas_limit,
+            clock=clock,
+            genesis_time=self.clock() - (len(self.mock_transactions) + 1) * HISTORY_SPACING
+        )
+        # (chain height, suggested gas price)
+        self._gas_price_cache = (None, DEFAULT_GAS_PRICE)
+        for tx in history:
+            self.chain.append_block([tx], datetime.fromisoformat(tx["timestamp"]).replace(tzinfo=timezone.utc).timestamp())
+        # Submitted transactions wait in a gas-price-ordered mempool; a background task packs them into blocks
+        self.confirmer = TransactionConfirmer(
+            self.chain,
+            block_interval=block_interval,
+            batch_size=confirm_batch_size,
+            mempool=Mempool(max_size=mempool_size, max_age_seconds=mempool_max_age, clock=clock),
+            on_confirmed=self._on_transaction_confirmed
+        )
+        for tx in reversed(self.mock_transactions):
+            if tx["status"] == "pending":
+                self.confirmer.submit(tx)
     
     def setup_web3(self):
         """Setup Web3 connection"""
@@ -91,25 +166,25 @@ class BlockchainService:
     def generate_mock_transactions(self) -> List[Dict[str, Any]]:
         """Generate mock transaction data"""
         transactions = []
-        base_time = datetime.now()
+        base_time = datetime.utcfromtimestamp(self.clock())
         transaction_types = ["guide_verification", "marketplace_purchase", "booking_payment", "certification_issue"]
         
         for i in range(100):
             transaction_time = base_time - timedelta(hours=i*2)
-            tx_type = random.choice(transaction_types)
+            tx_type = self.random.choice(transaction_types)
             
             transaction = {
                 "hash": f"0x{hashlib.sha256(str(i).encode()).hexdigest()[:64]}",
                 "from": f"0x{hashlib.sha256(f'from{i}'.encode()).hexdigest()[:40]}",
                 "to": f"0x{hashlib.sha256(f'to{i}'.encode()).hexdigest()[:40]}",
-                "value": round(random.uniform(0.01, 2.0), 4),
-                "gas": random.randint(21000, 100000),
-                "gas_price": random.randint(10, 100),
-                "block_number": 18000000 - i * 100,
+                "value": round(self.random.uniform(0.01, 2.0), 4),
+                "gas": self.random.randint(21000, 100000),
+                "gas_price": self.random.randint(10, 100),
+                "block_number": None,
                 "timestamp": transaction_time.isoformat(),
                 "status": "confirmed" if i > 5 else "pending",
                 "type": tx_type,
-                "contract_address": random.choice([c["address"] for c in self.mock_contracts])
+                "contract_address": self.random.choice([c["address"] for c in self.mock_contracts])
             }
             
             transactions.append(transaction)
@@ -142,6 +217,12 @@ class BlockchainService:
     
     def deploy_contract(self, contract_type: str, parameters: Dict[str, Any], owner_address: str) -> Dict[str, Any]:
         """Deploy a new smart contract (mock implementation)"""
+        if not isinstance(contract_type, str):
+            raise ValueError("type must be a string")
+        if not isinstance(owner_address, str):
+            raise ValueError("owner_address must be a string")
+        if not isinstance(parameters, dict):
+            raise ValueError("parameters must be an object")
         contract_id = f"contract_{len(self.mock_contracts) + 1}"
         contract_address = f"0x{hashlib.sha256(contract_id.encode()).hexdigest()[:40]}"
         
@@ -159,68 +240,131 @@ class BlockchainService:
             "last_activity": datetime.utcnow().isoformat()
         }
         
-        self.mock_contracts.append(new_contract)
-        
-        # Simulate deployment process
-        import time
-        time.sleep(2)  # Simulate blockchain confirmation time
-        
-        new_contract["status"] = "active"
-        
-        # Create deployment transaction
+        # Create deployment transaction; the contract turns active once it is confirmed
         deployment_tx = {
             "hash": f"0x{hashlib.sha256(contract_address.encode()).hexdigest()[:64]}",
             "from": owner_address,
             "to": contract_address,
             "value": 0,
-            "gas": 2000000,
-            "gas_price": 25,
-            "block_number": 18000000 + len(self.mock_transactions),
-            "timestamp": datetime.utcnow().isoformat(),
-            "status": "confirmed",
+            "gas": CONTRACT_DEPLOYMENT_GAS,
+            "gas_price": self.suggest_gas_price(),
+            "timestamp": datetime.utcfromtimestamp(self.clock()).isoformat(),
             "type": "contract_deployment",
             "contract_address": contract_address
         }
         
-        self.mock_transactions.insert(0, deployment_tx)
+        self._submit(deployment_tx)
+        self.mock_contracts.append(new_contract)
         
         return {
             "contract": new_contract,
             "transaction": deployment_tx,
-            "gas_used": 1500000,
-            "status": "success",
-            "deployment_cost": "0.0375 ETH"  # 1.5M gas * 25 gwei
+            "gas_used": deployment_tx["gas"],
+            "status": "pending",
+            "deployment_cost": f"{deployment_tx['gas'] * deployment_tx['gas_price'] / 1e9:.6f} ETH"  # gas * gwei
         }
     
     def get_recent_transactions(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent blockchain transactions"""
         return self.mock_transactions[:limit]
     
-    def create_transaction(self, from_address: str, to_address: str, value: float, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new blockchain transaction"""
+    def create_transaction(self, from_address: str, to_address: str, value: float, data: Dict[str, Any],
+                           gas_price: Optional[int] = None) -> Dict[str, Any]:
+        """Submit a new blockchain transaction; it is returned pending and confirmed in the background"""
+        _check_transaction_fields(from_address, to_address, value, data)
+        if gas_price is not None:
+            if isinstance(gas_price, bool) or not isinstance(gas_price, (int, float)):
+                raise ValueError("gas_price must be a number")
+            gas_price = int(gas_price)
+            if gas_price <= 0:
+                raise ValueError("gas_price must be positive")
         new_transaction = {
             "hash": f"0x{hashlib.sha256(str(len(self.mock_transactions)).encode()).hexdigest()[:64]}",
             "from": from_address,
             "to": to_address,
             "value": value,
             "data": data,
-            "gas": random.randint(21000, 100000),
-            "gas_price": random.randint(10, 100),
-            "block_number": 18000000 + len(self.mock_transactions),
-            "timestamp": datetime.utcnow().isoformat(),
-            "status": "pending",
+            "gas": self.estimate_gas(data),
+            "gas_price": gas_price or self.suggest_gas_price(),
+            "timestamp": datetime.utcfromtimestamp(self.clock()).isoformat(),
             "type": data.get("type", "transfer")
         }
         
-        self.mock_transactions.insert(0, new_transaction)
-        
-        # Simulate confirmation
-        import time
-        time.sleep(1)
-        new_transaction["status"] = "confirmed"
+        self._submit(new_transaction)
         
         return new_transaction
     
+    def _submit(self, transaction: Dict[str, Any]):
+        """Send a transaction to the mempool and index it; a transaction that cannot be indexed is withdrawn"""
+        self.confirmer.submit(transaction)
+        try:
+            self.transaction_index.add(transaction)
+        except Exception:
+            self.confirmer.cancel(transaction["hash"])
+            raise
+        self.mock_transactions.insert(0, transaction)
+    
+    def estimate_gas(self, data: Dict[str, Any]) -> int:
+        """Base transaction gas plus a per-byte cost for the transaction data"""
+        payload = json.dumps(data or {}, sort_keys=True, separators=(",", ":"), default=str)
+        return MIN_TRANSACTION_GAS + DATA_GAS_PER_BYTE * len(payload.encode("utf-8"))
+    
+    def suggest_gas_price(self) -> int:
+        """Median gas price of the transactions in the last ten blocks (recomputed once per new block)"""
+        height, price = self._gas_price_cache
+        if height != self.chain.height:
+            recent_gas_prices = [
+                tx["gas_price"]
+                for block in self.chain.recent_blocks(10)
+                for tx in self.chain.block_transactions(block["number"])
+            ]
+            price = int(statistics.median(recent_gas_prices)) if recent_gas_prices else DEFAULT_GAS_PRICE
+            self._gas_price_cache = (self.chain.height, price)
+        return price
+    
+    def get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Get a transaction by hash"""
+        return self.transaction_index.get(tx_hash)
+    
+    def get_address_transactions(self, address: str, cursor: Optional[str] = None,
+                                 limit: int = 50) -> Dict[str, Any]:
+        """Get one page of an address's transaction history, newest first"""
+        page = self.transaction_index.address_history(address, cursor, limit)
+        return {"address": address, **page}
+    
+    def get_contract_transactions(self, contract_address: str, cursor: Optional[str] = None,
+                                  limit: int = 50) -> Optional[Dict[str, Any]]:
+        """Get one page of a contract's transaction history, newest first; None if the contract is unknown"""
+        contract = self.get_contract_details(contract_address)
+        if not contract:
+            return None
+        page = self.transaction_index.contract_history(contract["address"], cursor, limit)
+        return {"contract_address": contract["address"], **page}
+    
+    async def wait_for_transaction(self, tx_hash: str, timeout: float = 10) -> Dict[str, Any]:
+        """Wait up to ``timeout`` seconds for a transaction to be confirmed and return it"""
+        transaction = self.get_transaction(tx_hash)
+        if transaction is None:
+            raise ValueError(f"Transaction {tx_hash} not found")
+        if transaction["status"] == "pending":
+            await self.confirmer.wait_for(tx_hash, timeout)
+        return transaction
+    
+    def _on_transaction_confirmed(self, transaction: Dict[str, Any]):
+        """Apply the effects of a confirmed transaction"""
+        data = transaction.get("data") or {}
+        if transaction.get("type") == "contract_deployment":
+            for contract in self.mock_contracts:
+                if contract["address"] == transaction.get("contract_address"):
+                    contract["status"] = "active"
+                    contract["last_activity"] = transaction["confirmed_at"]
+        elif data.get("type") == "guide_verification":
+            verification = self.verification_requests.get(data.get("verification_id"))
+            if verification is not None:
+                verification["verified"] = True
+                verification["block_number"] = transaction["block_number"]
+                verification["transaction_status"] = "confirmed"
+    
     def get_network_info(self) -> Dict[str, Any]:
         """Get blockchain network information"""
         if self.connected and self.web3:
@@ -239,14 +383,20 @@ class BlockchainService:
             except Exception as e:
                 print(f"Error getting network info: {e}")
         
-        # Fallback to mock data
+        # Fallback to the local chain simulator
+        latest = self.chain.latest
+        stats = self.chain.get_stats()
         return {
-            "network": "Ethereum Mainnet",
-            "chain_id": 1,
-            "block_height": 18000000 + len(self.mock_transactions),
-            "gas_price": random.randint(20, 50),
+            "network": "Local chain simulator",
+            "chain_id": self.chain.chain_id,
+            "block_height": self.chain.height,
+            "latest_block_hash": latest["hash"],
+            "gas_price": self.suggest_gas_price(),
+            "block_gas_limit": self.chain.gas_limit,
             "connected": self.connected,
-            "last_block_time": datetime.utcnow().isoformat(),
+            "last_block_time": latest["timestamp"],
+            "average_block_seconds": stats["average_block_seconds"],
+            "pending_transactions": len(self.confirmer.pending),
             "sync_status": "synced"
         }
     
@@ -285,24 +435,11 @@ class BlockchainService:
     
     def get_recent_blocks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent blocks from blockchain"""
-        blocks = []
-        base_block = 18000000 + len(self.mock_transactions)
-        
-        for i in range(limit):
-            block_time = datetime.now() - timedelta(minutes=i*2)
-            blocks.append({
-                "number": base_block - i,
-                "hash": f"0x{hashlib.sha256(str(base_block - i).encode()).hexdigest()[:64]}",
-                "timestamp": block_time.isoformat(),
-                "transaction_count": random.randint(50, 200),
-                "gas_used": random.randint(1000000, 15000000),
-                "gas_limit": 30000000,
-                "miner": f"0x{hashlib.sha256(f'miner{i}'.encode()).hexdigest()[:40]}",
-                "difficulty": random.randint(1000000000, 2000000000),
-                "total_difficulty": "58750003716598352816469"
-            })
-        
-        return blocks
+        return self.chain.recent_blocks(limit)
+    
+    def get_block(self, block_number: int) -> Optional[Dict[str, Any]]:
+        """Get one block with its transaction hashes"""
+        return self.chain.get_block(block_number, full=True)
     
     def verify_guide(self, guide_data: Dict[str, Any]) -> Dict[str, Any]:
         """Verify a tour guide using blockchain"""
@@ -317,7 +454,8 @@ class BlockchainService:
             "license_number": guide_data.get("license", ""),
             "specialties": guide_data.get("specialties", []),
             "experience_years": guide_data.get("experience", 0),
-            "verified": True,
+            # Set once the verification transaction is confirmed
+            "verified": False,
             "verification_date": datetime.utcnow().isoformat(),
             "expiry_date": (datetime.utcnow() + timedelta(days=365)).isoformat(),
             "verification_authority": "Jharkhand Tourism Board"
@@ -337,6 +475,7 @@ class BlockchainService:
         
         verification_record["transaction_hash"] = verification_tx["hash"]
         verification_record["block_number"] = verification_tx["block_number"]
+        verification_record["transaction_status"] = verification_tx["status"]
         
         # Store verification record
         self.verification_requests[verification_id] = verification_record
@@ -359,7 +498,8 @@ class BlockchainService:
             "verified": verification.get("verified", False),
             "verification_date": verification.get("verification_date"),
             "expiry_date": verification.get("expiry_date"),
-            "transaction_hash": verification.get("transaction_hash")
+            "transaction_hash": verification.get("transaction_hash"),
+            "transaction_status": verification.get("transaction_status")
         }
     
     def issue_digital_certificate(self, recipient_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -394,11 +534,137 @@ class BlockchainService:
         
         certificate_data["transaction_hash"] = certificate_tx["hash"]
         certificate_data["block_number"] = certificate_tx["block_number"]
+        certificate_data["transaction_status"] = certificate_tx["status"]
         
         return certificate_data
     
+    def issue_certificate_batch(self, batch_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Issue certificates to many recipients under one Merkle root, anchored in a single transaction"""
+        recipients = batch_data.get("recipients") or []
+        if not isinstance(recipients, list) or not recipients:
+            raise ValueError("recipients must be a non-empty list")
+        if len(recipients) > self.certificate_batch_max:
+            raise ValueError(f"At most {self.certificate_batch_max} recipients per batch")
+        
+        issue_date = datetime.utcfromtimestamp(self.clock()).isoformat()
+        batch_id = hashlib.sha256(
+            f"{batch_data.get('achievement')}{len(recipients)}{issue_date}{len(self.certificate_batches)}".encode()
+        ).hexdigest()[:16]
+        
+        certificates = []
+        for index, recipient in enumerate(recipients):
+            if not isinstance(recipient, dict):
+                raise ValueError(f"Recipient {index} must be an object")
+            achievement = recipient.get("achievement", batch_data.get("achievement"))
+            certificates.append({
+                "certificate_id": hashlib.sha256(
+                    f"{batch_id}{index}{recipient.get('recipient_name')}{achievement}".encode()
+                ).hexdigest()[:16],
+                "recipient_name": recipient.get("recipient_name"),
+                "recipient_wallet": recipient.get("recipient_wallet"),
+                "achievement": achievement,
+                "issue_date": issue_date,
+                "issuing_authority": "Jharkhand Tourism Platform",
+                "certificate_type": recipient.get("type", batch_data.get("type", "completion")),
+                "metadata": recipient.get("metadata", batch_data.get("metadata", {})),
+                "batch_id": batch_id
+            })
+        
+        levels = merkle_levels(_certificate_leaf(certificate) for certificate in certificates)
+        merkle_root = "0x" + levels[-1][0].hex()
+        
+        # Only the root goes on chain: one transaction for the whole batch
+        anchor_tx = self.create_transaction(
+            from_address="0xJharkhandTourismPlatform",
+            to_address=batch_data.get("contract_address", "0x0"),
+            value=0,
+            data={
+                "type": "certificate_batch",
+                "batch_id": batch_id,
+                "action": "anchor_certificates",
+                "merkle_root": merkle_root,
+                "certificate_count": len(certificates)
+            }
+        )
+        
+        issued = []
+        for index, certificate in enumerate(certificates):
+            issued.append({
+                "certificate": certificate,
+                "leaf_index": index,
+                "proof": merkle_proof(levels, index)
+            })
+            self.batched_certificates[certificate["certificate_id"]] = (batch_id, index)
+        
+        self.certificate_batches[batch_id] = {
+            "batch_id": batch_id,
+            "merkle_root": merkle_root,
+            "certificate_count": len(certificates),
+            "issue_date": issue_date,
+            "transaction_hash": anchor_tx["hash"],
+            "certificates": issued
+        }
+        
+        return {
+            "batch_id": batch_id,
+            "merkle_root": merkle_root,
+            "certificate_count": len(certificates),
+            "transaction_hash": anchor_tx["hash"],
+            "block_number": anchor_tx["block_number"],
+            "transaction_status": anchor_tx["status"],
+            "certificates": issued
+        }
+    
+    def get_certificate_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Get a certificate batch's root and anchoring transaction status (without its certificates)"""
+        batch = self.certificate_batches.get(batch_id)
+        if batch is None:
+            return None
+        anchor_tx = self.get_transaction(batch["transaction_hash"]) or {}
+        return {
+            **{key: value for key, value in batch.items() if key != "certificates"},
+            "block_number": anchor_tx.get("block_number"),
+            "transaction_status": anchor_tx.get("status")
+        }
+    
+    def verify_certificate_proof(self, certificate: Dict[str, Any], proof: List[Dict[str, Any]],
+                                 merkle_root: Optional[str] = None) -> Dict[str, Any]:
+        """Check a batched certificate against its inclusion proof and the root anchored on chain"""
+        batch = self.certificate_batches.get(certificate.get("batch_id"))
+        if merkle_root is None and batch is not None:
+            merkle_root = batch["merkle_root"]
+        if merkle_root is None:
+            raise ValueError("merkle_root is required for a certificate from an unknown batch")
+        
+        included = verify_proof(_certificate_leaf(certificate), proof, merkle_root)
+        anchored = batch is not None and batch["merkle_root"] == merkle_root.lower()
+        anchor_tx = (self.get_transaction(batch["transaction_hash"]) or {}) if anchored else {}
+        return {
+            "certificate_id": certificate.get("certificate_id"),
+            "batch_id": certificate.get("batch_id"),
+            "merkle_root": merkle_root,
+            "included": included,
+            "anchored": anchored,
+            "transaction_hash": anchor_tx.get("hash"),
+            "block_number": anchor_tx.get("block_number"),
+            "transaction_status": anchor_tx.get("status"),
+            "valid": included and anchored and anchor_tx.get("status") == "confirmed",
+            "validation_date": datetime.utcnow().isoformat()
+        }
+    
     def validate_certificate(self, certificate_id: str) -> Dict[str, Any]:
         """Validate a digital certificate"""
+        if certificate_id in self.batched_certificates:
+            # Batched certificates are re-checked against their batch's anchored root
+            batch_id, index = self.batched_certificates[certificate_id]
+            issued = self.certificate_batches[batch_id]["certificates"][index]
+            result = self.verify_certificate_proof(issued["certificate"], issued["proof"])
+            result["message"] = (
+                "Certificate is valid and its batch root is confirmed on blockchain" if result["valid"]
+                else "Certificate batch root is not confirmed on blockchain yet"
+            )
+            return result
+        
         # In a real implementation, this would query the blockchain
         # For mock purposes, we'll assume valid if it follows our format
         if len(certificate_id) == 16 and certificate_id.isalnum():
@@ -422,18 +688,14 @@ class BlockchainService:
         if not contract:
             return {"error": "Contract not found"}
         
-        # Filter transactions for this contract
-        contract_transactions = [
-            tx for tx in self.mock_transactions 
-            if tx.get("contract_address") == contract_address
-        ]
+        # Running totals kept by the transaction index; active users is a HyperLogLog estimate
+        stats = self.transaction_index.contract_stats(contract["address"]) or {
+            "total_transactions": 0,
+            "active_users": 0,
+            "transaction_volume": 0,
+            "gas_used": 0,
+            "last_activity": None,
+            "transaction_types": []
+        }
         
-        return {
-            "contract_address": contract_address,
-            "total_transactions": len(contract_transactions),
-            "active_users": len(set(tx["from"] for tx in contract_transactions)),
-            "transaction_volume": sum(tx["value"] for tx in contract_transactions),
-            "gas_used": sum(tx["gas"] for tx in contract_transactions),
-            "last_activity": contract_transactions[0]["timestamp"] if contract_transactions else None,
-            "transaction_types": list(set(tx["type"] for tx in contract_transactions))
-        }
\ No newline at end of file
+        return {"contract_address": contract["address"], **stats}
\ No newline at end of file
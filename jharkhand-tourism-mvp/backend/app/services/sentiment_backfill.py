@@ -0,0 +1,244 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from .sentiment_engine import SentimentBatchEngine
+from .sentiment_jobs import JobWork
+from .sentiment_service import SentimentService
+from ..utils.aspect_rollups import AspectRollups
+from ..utils.language_scorers import normalize_language
+from ..utils.sentiment_aggregates import SentimentAggregates
+from ..utils.topic_tracker import TopicTracker
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(tempfile.gettempdir(), "sentiment-backfill")
+
+
+class SentimentBackfill:
+    """Re-scores every stored feedback item, e.g. after the keywords change.
+
+    Feedback is walked in chunks that are scored on the batch engine's worker
+    pool. After each chunk the compact results are appended to a checkpoint
+    file and the position is saved, so a failed, cancelled or interrupted run
+    resumes from the last finished chunk (as long as the vocabulary and the
+    stored feedback have not changed). New aggregates, topics and aspect
+    rollups are built on the side and replace the live ones in a single step
+    at the end; until then every read keeps seeing the old, consistent state.
+    """
+
+    def __init__(self, service: SentimentService, engine: Optional[SentimentBatchEngine] = None,
+                 checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR, chunk_size: int = 500):
+        self.service = service
+        self.engine = engine
+        self.checkpoint_dir = checkpoint_dir
+        self.chunk_size = max(1, chunk_size)
+        self.running = False
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.checkpoint_dir, "state.json")
+
+    @property
+    def results_path(self) -> str:
+        return os.path.join(self.checkpoint_dir, "results.jsonl")
+
+    def fingerprint(self) -> str:
+        """Hash of the settings that affect scores; a checkpoint only resumes under the same one"""
+        settings = {
+            "vocabulary": self.service.get_keyword_vocabulary(),
+            "cascade": [self.service.cascade, list(self.service.cascade_band)]
+        }
+        return hashlib.sha1(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def load_checkpoint(self, fingerprint: str, ids: List[int]) -> List[Dict[str, Any]]:
+        """Get the results saved by an earlier run of the same backfill (empty if none match)"""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not os.path.exists(self.results_path):
+            return []
+        done = state.get("done", 0)
+        if state.get("fingerprint") != fingerprint or done > len(ids):
+            return []
+
+        records = []
+        with open(self.results_path, "r+b") as f:
+            while len(records) < done:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break
+                records.append(json.loads(line))
+            # Drop lines written after the last saved position (a chunk cut short by a crash)
+            f.truncate(f.tell())
+        # The saved records must be for the same feedback, in the same order
+        if len(records) < done or [record["id"] for record in records] != ids[:done]:
+            return []
+        return records
+
+    def save_checkpoint(self, fingerprint: str, records: List[Dict[str, Any]], done: int, total: int):
+        """Append one chunk of results, then atomically move the saved position forward"""
+        with open(self.results_path, "a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        temporary = self.state_path + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump({"fingerprint": fingerprint, "done": done, "total": total,
+                       "updated_at": time.time()}, f)
+        os.replace(temporary, self.state_path)
+
+    def clear_checkpoint(self):
+        """Delete the checkpoint files"""
+        for path in (self.state_path, self.results_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def work(self, resume: bool = True) -> JobWork:
+        """Job body for ``SentimentJobQueue.submit``"""
+        async def work(job: Dict[str, Any]):
+            self.running = True
+            try:
+                await self._run(job, resume)
+            finally:
+                self.running = False
+        return work
+
+    async def _analyze(self, texts: List[str], languages: List[str]) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        # Each item is scored in its own language, one batch per language
+        if self.engine is not None:
+            analyses = await self.engine.analyze_grouped(texts, languages)
+        else:
+            analyses = await loop.run_in_executor(None, lambda: [
+                self.service.analyze_single_text(text, language) for text, language in zip(texts, languages)
+            ])
+        aspects = await loop.run_in_executor(None, lambda: [self.service.analyze_aspects(text) for text in texts])
+        return [dict(analysis, aspect_sentiment=aspect) for analysis, aspect in zip(analyses, aspects)]
+
+    async def _run(self, job: Dict[str, Any], resume: bool):
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        fingerprint = self.fingerprint()
+        # Feedback that arrives while the backfill runs is scored live and folded in at the swap
+        feedback = list(self.service.feedback_data)
+        ids = [item["id"] for item in feedback]
+
+        records = self.load_checkpoint(fingerprint, ids) if resume else []
+        if not records:
+            self.clear_checkpoint()
+        resumed_from = len(records)
+        job["total"] = len(feedback)
+        job["processed"] = resumed_from
+        job["metrics"] = {"resumed_from": resumed_from, "items_per_sec": 0.0,
+                          "elapsed_seconds": 0.0, "eta_seconds": None}
+
+        start = time.monotonic()
+        for offset in range(resumed_from, len(feedback), self.chunk_size):
+            chunk = feedback[offset:offset + self.chunk_size]
+            analyses = await self._analyze([item.get("comment", "") for item in chunk],
+                                           [item.get("language") or "en" for item in chunk])
+            chunk_records = [_record(item, analysis) for item, analysis in zip(chunk, analyses)]
+            self.save_checkpoint(fingerprint, chunk_records, offset + len(chunk), len(feedback))
+            records.extend(chunk_records)
+
+            job["processed"] = len(records)
+            elapsed = time.monotonic() - start
+            rate = (len(records) - resumed_from) / elapsed if elapsed else 0.0
+            job["metrics"].update({
+                "items_per_sec": round(rate, 1),
+                "elapsed_seconds": round(elapsed, 2),
+                "eta_seconds": round((len(feedback) - len(records)) / rate, 1) if rate else None
+            })
+
+        # Build the replacement state off the event loop, then swap it in without yielding
+        state = await asyncio.get_running_loop().run_in_executor(None, self._build, feedback, records)
+        changed = self._swap(state, feedback, records)
+        self.clear_checkpoint()
+        job["metrics"]["eta_seconds"] = 0.0
+        job["summary"] = {
+            "rescored": len(records),
+            "resumed_from": resumed_from,
+            "label_changes": changed,
+            "added_during_backfill": len(self.service.feedback_data) - len(feedback)
+        }
+
+    def _build(self, feedback: List[Dict[str, Any]], records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        state = {
+            "aggregates": SentimentAggregates(self.service.aggregates.max_suggestions),
+            "topics": TopicTracker(),
+            "aspects": AspectRollups(self.service.aspect_rollups.window_days)
+        }
+        for item, record in zip(feedback, records):
+            _fold(state, item, record)
+        return state
+
+    def _swap(self, state: Dict[str, Any], feedback: List[Dict[str, Any]],
+              records: List[Dict[str, Any]]) -> int:
+        """Fold in feedback that arrived meanwhile and replace the live state (no awaits)"""
+        service = self.service
+        for item in service.feedback_data[len(feedback):]:
+            if "aspect_sentiment" not in item:
+                item["aspect_sentiment"] = service.analyze_aspects(item.get("comment", ""))
+            language = normalize_language(item.get("language") or "en")
+            _fold(state, item, _record(item, service.analyze_single_text(item.get("comment", ""), language)))
+
+        changed = 0
+        for item, record in zip(feedback, records):
+            old = item.get("sentiment")
+            if old != record["sentiment"]:
+                changed += 1
+                # Move the item between labels in its day of the sentiment history
+                if service.sentiment_history.get_day(item.get("date", "")) is not None:
+                    rating = item.get("rating", 0) or 0
+                    service.sentiment_history.record(item["date"], old, rating, count=-1)
+                    service.sentiment_history.record(item["date"], record["sentiment"], rating)
+            item["sentiment"] = record["sentiment"]
+            item["aspect_sentiment"] = record["aspect_sentiment"]
+
+        service.aggregates = state["aggregates"]
+        service.topic_tracker = state["topics"]
+        service.aspect_rollups = state["aspects"]
+        service._unanalyzed_feedback = []
+        service._unscored_aspects = []
+        # Cached results of duplicate clusters were scored under the old settings
+        service.cluster_results.clear()
+        return changed
+
+
+def _record(feedback: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """The parts of an analysis the aggregates need, as saved in the checkpoint"""
+    context = analysis.get("tourism_context", {})
+    return {
+        "id": feedback["id"],
+        "sentiment": analysis["sentiment"],
+        "score": analysis["score"],
+        "keywords": analysis.get("keywords", [])[:5],
+        "improvement_suggestions": context.get("improvement_suggestions", 0),
+        "aspects_mentioned": context.get("aspects_mentioned", {}),
+        "aspect_sentiment": analysis.get("aspect_sentiment", feedback.get("aspect_sentiment")) or {}
+    }
+
+
+def _fold(state: Dict[str, Any], feedback: Dict[str, Any], record: Dict[str, Any]):
+    """Count one re-scored feedback item into the replacement state"""
+    category = feedback.get("category", "general")
+    state["aggregates"].add(dict(feedback, sentiment=record["sentiment"]))
+    state["topics"].add(record["keywords"], category, feedback.get("date"))
+    state["aspects"].record(record["aspect_sentiment"], category, feedback.get("date"))
+    if (record["sentiment"] in ("negative", "neutral") and record["improvement_suggestions"] > 0
+            and not state["aggregates"].suggestions_full()):
+        state["aggregates"].add_suggestion({
+            "feedback_id": feedback["id"],
+            "category": category,
+            "suggestion_text": feedback.get("comment", ""),
+            "priority": "high" if record["sentiment"] == "negative" else "medium",
+            "aspects": record["aspects_mentioned"],
+            "keywords": record["keywords"]
+        })
@@ -0,0 +1,231 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional, Tuple
+
+from .sentiment_service import SentimentService
+from ..utils.language_scorers import LanguageRegistry
+from ..utils.nlp_models import NLPModels
+from ..utils.process_memory import process_memory
+
+# Per-process analyzer, created once by the pool initializer
+_worker_service: Optional[SentimentService] = None
+
+# Models preloaded by the parent before forking; workers inherit and share them
+_preloaded_models: Optional[NLPModels] = None
+
+# Shared by the pool's workers so each warmup call runs on a different worker
+_warmup_barrier = None
+
+# Seconds a warmup call waits for the other workers before giving up
+WARMUP_TIMEOUT = 600.0
+
+
+def _init_worker(barrier=None, languages: Optional[Tuple[str, int]] = None):
+    """Load the NLP models once when a pool worker starts"""
+    global _worker_service, _warmup_barrier
+    _warmup_barrier = barrier
+    # Same lexicon directory and memory cap as the parent's registry, so batches score like /analyze
+    registry = LanguageRegistry(*languages) if languages is not None else None
+    # Results are cached by the parent service, not per worker
+    _worker_service = SentimentService(cache_size=0, models=_preloaded_models, languages=registry)
+    # Load the lexicons (unless inherited) and score a sample text before taking real work
+    _worker_service.warmup()
+
+
+def _worker_ready() -> Dict[str, Any]:
+    """Report a worker's model status (running it makes the worker initialize)"""
+    # Hold this worker until every worker has taken a warmup call, so no worker runs two
+    if _warmup_barrier is not None:
+        _warmup_barrier.wait(WARMUP_TIMEOUT)
+    return dict(_worker_service.models.get_status(), pid=os.getpid(), memory=process_memory())
+
+
+def _analyze_chunk(texts: List[str], language: str,
+                   vocabulary: Optional[Dict[str, List[str]]] = None,
+                   cascade: Optional[Tuple[bool, Tuple[float, float]]] = None) -> List[Dict[str, Any]]:
+    """Analyze one chunk of texts inside a pool worker"""
+    # Pick up keywords that were added to the parent service at runtime
+    if vocabulary is not None and vocabulary != _worker_service.get_keyword_vocabulary():
+        _worker_service.set_keyword_vocabulary(vocabulary)
+    # Follow the parent's cascade settings
+    if cascade is not None and cascade != (_worker_service.cascade, _worker_service.cascade_band):
+        _worker_service.configure_cascade(*cascade)
+    return [_worker_service.analyze_single_text(text, language) for text in texts]
+
+
+class SentimentBatchEngine:
+    """Runs large sentiment batches on a warm process pool.
+
+    Batches are split into chunks of ``chunk_size`` texts, each chunk is scored
+    in a worker process and the results are returned in input order. The event
+    loop only awaits the chunk futures, so other endpoints stay responsive.
+    With ``preload``, the service's models are loaded and frozen in this
+    process and the workers are forked from it, so every worker reads the
+    parent's lexicons copy-on-write instead of loading its own.
+    When a ``service`` is given, its result cache is consulted first: cached
+    and repeated texts are not sent to the pool, and new results are cached.
+    Its keyword vocabularies and cascade settings are shipped with every chunk
+    so runtime changes reach the workers.
+    """
+
+    def __init__(self, service: Optional[SentimentService] = None, chunk_size: int = 200,
+                 max_workers: Optional[int] = None, preload: bool = False):
+        self.service = service
+        self.chunk_size = max(1, chunk_size)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Sharing needs fork; elsewhere each worker loads its own models
+        self.preload = preload and service is not None and "fork" in multiprocessing.get_all_start_methods()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._warmups: List[Future] = []
+
+    def start(self) -> ProcessPoolExecutor:
+        """Create the worker pool (if needed) and start warming every worker"""
+        global _preloaded_models
+        if self._executor is None:
+            context = None
+            if self.preload:
+                self.service.models.preload(self.service.analyze_single_text)
+                _preloaded_models = self.service.models
+                context = multiprocessing.get_context("fork")
+            barrier = (context or multiprocessing).Barrier(self.max_workers)
+            languages = None
+            if self.service is not None:
+                languages = (self.service.languages.lexicon_dir, self.service.languages.max_bytes)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(barrier, languages)
+            )
+            self._warmups = [self._executor.submit(_worker_ready) for _ in range(self.max_workers)]
+        return self._executor
+
+    def workers_ready(self) -> List[Dict[str, Any]]:
+        """Get the status reported by each worker that finished warming up"""
+        return [
+            future.result() for future in self._warmups
+            if future.done() and not future.cancelled() and future.exception() is None
+        ]
+
+    @property
+    def ready(self) -> bool:
+        """Whether the pool is running and every worker has loaded its models"""
+        workers = self.workers_ready()
+        return (
+            self._executor is not None
+            and len(workers) == len(self._warmups)
+            and len({worker["pid"] for worker in workers}) == self.max_workers
+            and all(worker["ready"] for worker in workers)
+        )
+
+    def split(self, texts: List[str], chunk_size: Optional[int] = None) -> List[List[str]]:
+        """Split texts into consecutive chunks"""
+        size = max(1, chunk_size or self.chunk_size)
+        return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+    async def analyze_batch(self, texts: List[str], language: str = "en",
+                            chunk_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze texts on the process pool, preserving input order"""
+        if not texts:
+            return []
+
+        # Serve cached texts directly and send each distinct miss to the pool once
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        for position, text in enumerate(texts):
+            if self.service is None:
+                pending[str(position)] = [position]
+                continue
+            key = self.service.cache_key(text, language)
+            cached = self.service.get_cached_analysis(text, language, key)
+            if cached is not None:
+                results[position] = cached
+            else:
+                pending.setdefault(key, []).append(position)
+
+        if not pending:
+            return results
+
+        executor = self.start()
+        loop = asyncio.get_running_loop()
+        vocabulary = self.service.get_keyword_vocabulary() if self.service else None
+        cascade = (self.service.cascade, self.service.cascade_band) if self.service else None
+        misses = [texts[positions[0]] for positions in pending.values()]
+        futures = [
+            loop.run_in_executor(executor, _analyze_chunk, chunk, language, vocabulary, cascade)
+            for chunk in self.split(misses, chunk_size)
+        ]
+
+        try:
+            chunk_results = await asyncio.gather(*futures)
+        except BrokenProcessPool:
+            # A worker died; drop the pool so the next batch starts a fresh one
+            self.shutdown(wait=False)
+            raise
+
+        if self.service and self.service.cascade:
+            # Workers count in their own processes; tally their cascade decisions here
+            scored = [result for chunk in chunk_results for result in chunk if "scorers" in result]
+            fallbacks = sum(1 for result in scored if len(result["scorers"]) > 1)
+            self.service.record_cascade(len(scored), fallbacks)
+
+        analyzed = (result for chunk in chunk_results for result in chunk)
+        for positions, result in zip(pending.values(), analyzed):
+            if self.service and result["text"].strip():
+                self.service.cache_analysis(result["text"], language, result)
+            results[positions[0]] = result
+            for position in positions[1:]:
+                results[position] = dict(result, text=texts[position])
+
+        return results
+
+    async def analyze_grouped(self, texts: List[str], languages: List[str],
+                              chunk_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze texts in mixed languages as one batch per language, preserving input order"""
+        if self.service is not None:
+            groups = self.service.group_by_language(texts, languages)
+        else:
+            groups = {}
+            for position, language in enumerate(languages):
+                groups.setdefault(language, []).append(position)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        for language, positions in groups.items():
+            analyzed = await self.analyze_batch([texts[position] for position in positions], language, chunk_size)
+            for position, result in zip(positions, analyzed):
+                results[position] = result
+        return results
+
+    def get_memory(self) -> Dict[str, Any]:
+        """Get current RSS/PSS/USS of this process and of every live pool worker"""
+        processes = getattr(self._executor, "_processes", None) or {}
+        workers = [process_memory(pid) for pid in sorted(processes)]
+        uss = [worker["uss_kb"] for worker in workers if worker.get("uss_kb") is not None]
+        return {
+            "preload": self.preload,
+            "parent": process_memory(),
+            "workers": workers,
+            "workers_uss_kb": sum(uss),
+            "workers_rss_kb": sum(worker.get("rss_kb") or 0 for worker in workers)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine configuration and state"""
+        return {
+            "chunk_size": self.chunk_size,
+            "max_workers": self.max_workers,
+            "preload": self.preload,
+            "running": self._executor is not None,
+            "ready": self.ready,
+            "workers": self.workers_ready()
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            self._warmups = []
@@ -0,0 +1,159 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# A job body: receives the job record and fills in its results and progress
+JobWork = Callable[[Dict[str, Any]], Awaitable[None]]
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+
+class SentimentJobQueue:
+    """Runs long sentiment jobs in the background and keeps their results.
+
+    ``submit`` returns a job record immediately; the work runs as an asyncio
+    task, with at most ``max_concurrent`` jobs running at once and the rest
+    waiting in order. Finished jobs (and their results) are kept for
+    ``result_ttl`` seconds and then dropped.
+    """
+
+    def __init__(self, max_concurrent: int = 2, result_ttl: float = 3600, max_pending: int = 100):
+        self.max_concurrent = max(1, max_concurrent)
+        self.result_ttl = result_ttl
+        self.max_pending = max(1, max_pending)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def submit(self, kind: str, total: int, work: JobWork, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Queue a job and return its public status right away"""
+        self.purge_expired()
+        active = sum(1 for job in self.jobs.values() if job["status"] not in FINISHED_STATUSES)
+        if active >= self.max_pending:
+            raise RuntimeError(f"Too many pending sentiment jobs (limit {self.max_pending})")
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "kind": kind,
+            "status": "queued",
+            "params": params or {},
+            "total": total,
+            "processed": 0,
+            "results": [],
+            "summary": None,
+            "error": None,
+            "created_at": datetime.utcnow().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "expires_at": None
+        }
+        self.jobs[job_id] = job
+        self._tasks[job_id] = asyncio.ensure_future(self._run(job, work))
+        return self.get_status(job_id)
+
+    async def _run(self, job: Dict[str, Any], work: JobWork):
+        try:
+            async with self._semaphore:
+                job["status"] = "running"
+                job["started_at"] = datetime.utcnow().isoformat()
+                await work(job)
+                job["status"] = "completed"
+        except asyncio.CancelledError:
+            job["status"] = "cancelled"
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+        finally:
+            job["finished_at"] = datetime.utcnow().isoformat()
+            job["_expires"] = time.monotonic() + self.result_ttl
+            job["expires_at"] = datetime.utcfromtimestamp(time.time() + self.result_ttl).isoformat()
+            self._tasks.pop(job["id"], None)
+
+    def _get_job(self, job_id: str) -> Dict[str, Any]:
+        self.purge_expired()
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Sentiment job with ID {job_id} not found")
+        return job
+
+    def get_status(self, job_id: str) -> Dict[str, Any]:
+        """Get a job's status and progress (without its results)"""
+        job = self._get_job(job_id)
+        status = {key: value for key, value in job.items() if key not in ("results", "_expires")}
+        status["progress"] = round(job["processed"] / job["total"], 4) if job["total"] else (
+            1.0 if job["status"] == "completed" else 0.0
+        )
+        status["results_available"] = len(job["results"])
+        return status
+
+    def get_results(self, job_id: str, offset: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """Get one page of a job's results (partial while it is still running)"""
+        job = self._get_job(job_id)
+        return {
+            "job_id": job_id,
+            "status": job["status"],
+            "offset": offset,
+            "limit": limit,
+            "total": len(job["results"]),
+            "results": job["results"][offset:offset + limit],
+            "summary": job["summary"]
+        }
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a queued or running job"""
+        self._get_job(job_id)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        return self.get_status(job_id)
+
+    def purge_expired(self) -> int:
+        """Drop finished jobs whose results outlived the TTL"""
+        now = time.monotonic()
+        expired = [job_id for job_id, job in self.jobs.items() if job.get("_expires", now + 1) <= now]
+        for job_id in expired:
+            del self.jobs[job_id]
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counts by status and the queue configuration"""
+        self.purge_expired()
+        counts: Dict[str, int] = {}
+        for job in self.jobs.values():
+            counts[job["status"]] = counts.get(job["status"], 0) + 1
+        return {
+            "jobs": counts,
+            "max_concurrent": self.max_concurrent,
+            "max_pending": self.max_pending,
+            "result_ttl_seconds": self.result_ttl
+        }
+
+    async def shutdown(self):
+        """Cancel every unfinished job"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def batch_job(analyze: Callable[..., Awaitable[List[Dict[str, Any]]]],
+              texts: List[str], chunk_size: int, languages: Optional[List[str]] = None) -> JobWork:
+    """Job body that analyzes texts chunk by chunk so progress is visible.
+
+    With per-text ``languages``, ``analyze`` also receives each chunk's languages.
+    """
+    async def work(job: Dict[str, Any]):
+        for start in range(0, len(texts), chunk_size):
+            chunk = texts[start:start + chunk_size]
+            if languages is None:
+                job["results"].extend(await analyze(chunk))
+            else:
+                job["results"].extend(await analyze(chunk, languages[start:start + chunk_size]))
+            job["processed"] = len(job["results"])
+    return work
@@ -1,24 +1,77 @@
 import json
 import os
-from typing import Dict, List, Any, Optional
+import hashlib
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import random
-from textblob import TextBlob
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
 import re
+import threading
+from nltk.sentiment import SentimentIntensityAnalyzer
+
+from ..utils.text_pipeline import ProcessedText, process_text, vader_scores, pattern_scores
+from ..utils.keyword_matcher import KeywordMatcher
+from ..utils.cache import TTLCache
+from ..utils.sentiment_aggregates import SentimentAggregates, SENTIMENT_LABELS
+from ..utils.timeseries import SentimentTimeSeries
+from ..utils.nlp_models import NLPModels
+from ..utils.bulk_scoring import BulkSentimentScorer, label_for
+from ..utils.topic_tracker import TopicTracker
+from ..utils.minhash import MinHashLSH
+from ..utils.aspect_rollups import AspectRollups
+from ..utils.spike_detector import SpikeDetector
+from ..utils.language_scorers import LanguageRegistry, LexiconScorer, normalize_language
+
+# Common stop words skipped by keyword extraction
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "as", "is", "was", "were", "be", "been", "have",
+    "has", "had", "do", "does", "did", "will", "would", "could", "should",
+    "may", "might", "must", "can", "this", "that", "these", "those", "i",
+    "you", "he", "she", "it", "we", "they", "my", "your", "his", "her"
+})
+
+# Sentence boundaries for aspect-level sentiment
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+")
+
+# Posts returned by the mock social media analysis (and the default ingestion fixture)
+SAMPLE_SOCIAL_POSTS = (
+    "Loved my trip to Jharkhand! The eco-tourism initiatives are amazing. 🌿",
+    "The tribal handicrafts marketplace is fantastic! Supporting local artisans. 🛍️",
+    "Had some issues with transportation but the guides were knowledgeable.",
+    "Beautiful waterfalls and rich cultural heritage. Highly recommended!",
+    "Platform needs better customer support, but overall good experience."
+)
 
-# Download required NLTK data
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon')
+# VADER compound scores inside this band are too weak to label on their own
+DEFAULT_CASCADE_BAND = (-0.5, 0.5)
 
 class SentimentService:
-    def __init__(self):
-        self.sia = SentimentIntensityAnalyzer()
+    def __init__(self, cache_size: int = 10000, cache_ttl: float = 3600,
+                 models: Optional[NLPModels] = None, duplicate_threshold: float = 0.8,
+                 cascade: bool = False, cascade_band: Tuple[float, float] = DEFAULT_CASCADE_BAND,
+                 spike_detector: Optional[SpikeDetector] = None,
+                 languages: Optional[LanguageRegistry] = None):
+        # Lexicons load on first use or at warmup, never at construction
+        self.models = models or NLPModels()
+        # Scorers for non-English texts, loaded per language on first use
+        self.languages = languages or LanguageRegistry()
+        # Cascade mode: VADER first, TextBlob only when VADER's compound falls inside the band
+        self.cascade = cascade
+        self.cascade_band = self.validate_cascade_band(cascade_band)
+        self._cascade_lock = threading.Lock()
+        self._cascade_counts = {"texts": 0, "fallbacks": 0}
+        # Results of analyze_single_text keyed by normalized text + language
+        self.result_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
         self.feedback_data = self.load_feedback_data()
-        self.sentiment_history = self.initialize_sentiment_history()
+        # Near-duplicate comments (Jaccard >= duplicate_threshold) reuse their cluster's analysis
+        self.duplicate_index = MinHashLSH(threshold=duplicate_threshold)
+        self.cluster_results = TTLCache(maxsize=cache_size, ttl=0)
+        for feedback in self.feedback_data:
+            self.duplicate_index.add(feedback["id"], feedback["comment"])
+        # Daily sentiment history keyed by date; old days roll into week/month buckets
+        self.sentiment_history = SentimentTimeSeries()
+        for entry in self.initialize_sentiment_history():
+            self.sentiment_history.load_day(entry)
         
         # Tourism-specific keywords for better analysis
         self.tourism_keywords = {
@@ -37,6 +90,85 @@ class SentimentService:
                 "need", "lack", "missing", "issue", "problem", "concern"
             ]
         }
+        
+        # Terms that signal which aspect of the trip a review talks about
+        self.aspect_keywords = {
+            "guide": ["guide", "tour guide", "leader"],
+            "accommodation": ["hotel", "accommodation", "stay", "room"],
+            "transport": ["transport", "vehicle", "car", "bus", "travel"],
+            "food": ["food", "meal", "restaurant", "dining"],
+            "location": ["place", "location", "site", "destination"],
+            "price": ["price", "cost", "expensive", "cheap", "value"]
+        }
+        
+        # All vocabularies compiled into one matcher, scanned once per text
+        self.keyword_matcher = KeywordMatcher({**self.tourism_keywords, **self.aspect_keywords})
+        
+        # Running counters behind the dashboard reads, updated once per feedback item
+        self.aggregates = SentimentAggregates()
+        # Heavy-hitter topics of all feedback, updated as each item arrives
+        self.topic_tracker = TopicTracker()
+        # Aspect sentiment per aspect/category/day plus a 90-day running window
+        self.aspect_rollups = AspectRollups(window_days=90)
+        # Feedback whose aspect sentiment is still to be computed (needs the models)
+        self._unscored_aspects: List[Dict[str, Any]] = []
+        # Negative bursts per site, category and provider, fed by new feedback only
+        self.spike_detector = spike_detector or SpikeDetector()
+        # Feedback still to be checked for improvement suggestions (needs the models)
+        self._unanalyzed_feedback: List[Dict[str, Any]] = []
+        # Vectorized scorer for bulk jobs, built on first use
+        self._bulk_scorer: Optional[BulkSentimentScorer] = None
+        for feedback in self.feedback_data:
+            self.record_feedback(feedback)
+    
+    @property
+    def sia(self) -> SentimentIntensityAnalyzer:
+        """The VADER analyzer, loaded on first use"""
+        return self.models.vader
+    
+    def warmup(self) -> Dict[str, Any]:
+        """Load the NLP models and score a sample text; returns the model status"""
+        # Cascade mode may not need TextBlob for the sample, so load it explicitly
+        self.models.load_pattern()
+        return self.models.warmup(self.analyze_single_text)
+    
+    @staticmethod
+    def validate_cascade_band(band: Tuple[float, float]) -> Tuple[float, float]:
+        """Check that a cascade band is an ordered pair inside [-1, 1]"""
+        low, high = band
+        if not -1.0 <= low <= high <= 1.0:
+            raise ValueError(f"Invalid cascade band ({low}, {high}): need -1 <= low <= high <= 1")
+        return float(low), float(high)
+    
+    def configure_cascade(self, enabled: Optional[bool] = None,
+                          band: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+        """Switch cascade mode or change its ambiguous band at runtime"""
+        if band is not None:
+            self.cascade_band = self.validate_cascade_band(band)
+        if enabled is not None:
+            self.cascade = enabled
+        # Cached results were produced under the previous settings
+        self.clear_result_caches()
+        return self.get_cascade_stats()
+    
+    def record_cascade(self, texts: int, fallbacks: int):
+        """Count texts scored in cascade mode and how many needed TextBlob"""
+        with self._cascade_lock:
+            self._cascade_counts["texts"] += texts
+            self._cascade_counts["fallbacks"] += fallbacks
+    
+    def get_cascade_stats(self) -> Dict[str, Any]:
+        """Get the cascade settings and how often the TextBlob fallback ran"""
+        with self._cascade_lock:
+            texts, fallbacks = self._cascade_counts["texts"], self._cascade_counts["fallbacks"]
+        return {
+            "enabled": self.cascade,
+            "band": list(self.cascade_band),
+            "texts": texts,
+            "fallbacks": fallbacks,
+            "vader_only": texts - fallbacks,
+            "fallback_rate": round(fallbacks / texts, 4) if texts else 0.0
+        }
     
     def load_feedback_data(self) -> List[Dict[str, Any]]:
         """Load sample feedback data"""
@@ -111,6 +243,36 @@ class SentimentService:
         
         return history
     
+    def cache_key(self, text: str, language: str = "en") -> str:
+        """Content hash of a text after whitespace normalization"""
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{language}\x00{normalized}".encode("utf-8")).hexdigest()
+    
+    def get_cached_analysis(self, text: str, language: str = "en",
+                            key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get a cached analysis for the text, with this call's text and timestamp"""
+        cached = self.result_cache.get(key or self.cache_key(text, language))
+        if cached is None:
+            return None
+        
+        result = dict(cached)
+        result["text"] = text
+        result["timestamp"] = datetime.utcnow().isoformat()
+        return result
+    
+    def cache_analysis(self, text: str, language: str, result: Dict[str, Any]):
+        """Store an analysis result in the cache"""
+        self.result_cache.set(self.cache_key(text, language), dict(result))
+    
+    def clear_result_caches(self):
+        """Drop cached analyses and near-duplicate cluster results"""
+        self.result_cache.clear()
+        self.cluster_results.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get analysis cache statistics"""
+        return self.result_cache.get_stats()
+    
     def analyze_single_text(self, text: str, language: str = "en") -> Dict[str, Any]:
         """Analyze sentiment for a single text with tourism context"""
         if not text or text.strip() == "":
@@ -125,19 +287,42 @@ class SentimentService:
                 "timestamp": datetime.utcnow().isoformat()
             }
         
-        # TextBlob analysis
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity  # -1 to 1
-        subjectivity = blob.sentiment.subjectivity  # 0 to 1
+        cached = self.get_cached_analysis(text, language)
+        if cached is not None:
+            return cached
+        
+        # Tokenize once and share the token streams between all stages
+        processed = process_text(text)
+        
+        # Other languages go to their own lexicon scorer; without one they fall back to English
+        resolved = self.languages.resolve(language, text)
+        scorer = self.languages.get(resolved) if resolved != "en" else None
+        if scorer is not None:
+            result = self.analyze_with_lexicon(processed, scorer)
+            self.cache_analysis(text, language, result)
+            return result
         
         # VADER sentiment analysis
-        vader_scores = self.sia.polarity_scores(text)
+        vader = vader_scores(self.sia, processed)
+        
+        # In cascade mode a decisive VADER score is used alone and TextBlob is skipped
+        low, high = self.cascade_band
+        if self.cascade and not low <= vader['compound'] <= high:
+            polarity = subjectivity = None
+            combined_score = vader['compound']
+            scorers = ["vader"]
+        else:
+            # TextBlob analysis
+            self.models.load_pattern()
+            polarity, subjectivity = pattern_scores(processed)  # -1 to 1, 0 to 1
+            # Combined score (weighted average)
+            combined_score = (polarity + vader['compound']) / 2
+            scorers = ["vader", "textblob"]
+        if self.cascade:
+            self.record_cascade(1, len(scorers) - 1)
         
         # Enhanced sentiment analysis with tourism context
-        tourism_context = self.analyze_tourism_context(text)
-        
-        # Combined score (weighted average)
-        combined_score = (polarity + vader_scores['compound']) / 2
+        tourism_context = self.analyze_tourism_context(processed)
         
         # Determine sentiment label with confidence
         if combined_score > 0.1:
@@ -151,38 +336,73 @@ class SentimentService:
             confidence = 1.0 - abs(combined_score)
         
         # Extract keywords
-        keywords = self.extract_keywords(text)
+        keywords = self.extract_keywords(processed)
         
-        return {
+        result = {
             "text": text,
             "sentiment": sentiment_label,
             "score": combined_score,
             "confidence": confidence,
             "subjectivity": subjectivity,
-            "vader_scores": vader_scores,
+            "vader_scores": vader,
             "textblob_polarity": polarity,
+            "scorers": scorers,
+            "language": "en",
             "keywords": keywords,
             "tourism_context": tourism_context,
             "timestamp": datetime.utcnow().isoformat()
         }
+        if resolved != "en":
+            result["requested_language"] = resolved
+        self.cache_analysis(text, language, result)
+        return result
     
-    def analyze_tourism_context(self, text: str) -> Dict[str, Any]:
+    def analyze_with_lexicon(self, processed: ProcessedText, scorer: LexiconScorer) -> Dict[str, Any]:
+        """Analyze a non-English text with its language's lexicon scorer"""
+        scores = scorer.polarity_scores(processed.text)
+        sentiment_label, confidence = label_for(scores["compound"])
+        # Native keywords first, then any English (code-mixed) ones
+        keywords = scorer.keywords(processed.text)
+        keywords += [word for word in self.extract_keywords(processed) if word not in keywords]
+        return {
+            "text": processed.text,
+            "sentiment": sentiment_label,
+            "score": scores["compound"],
+            "confidence": confidence,
+            "subjectivity": None,
+            "vader_scores": scores,
+            "textblob_polarity": None,
+            "scorers": [f"lexicon:{scorer.language}"],
+            "language": scorer.language,
+            "keywords": keywords[:10],
+            "tourism_context": self.analyze_tourism_context(processed),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    def analyze_bulk(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Score many texts at once with the vectorized lexicon scorer.
+        
+        Much faster than analyze_single_text but approximate, and without
+        keywords or tourism context; meant for large offline jobs.
+        """
+        if self._bulk_scorer is None:
+            self._bulk_scorer = BulkSentimentScorer(self.sia.lexicon, self.tourism_keywords)
+        return self._bulk_scorer.analyze(texts)
+    
+    def analyze_tourism_context(self, text: Union[str, ProcessedText]) -> Dict[str, Any]:
         """Analyze tourism-specific context in text"""
-        text_lower = text.lower()
+        processed = text if isinstance(text, ProcessedText) else process_text(text)
+        hits = self.keyword_matcher.match(processed.words)
         
-        # Count keyword occurrences
-        positive_count = sum(1 for word in self.tourism_keywords["positive"] if word in text_lower)
-        negative_count = sum(1 for word in self.tourism_keywords["negative"] if word in text_lower)
-        improvement_count = sum(1 for word in self.tourism_keywords["improvement"] if word in text_lower)
+        # Count distinct keyword occurrences
+        positive_count = len(hits.get("positive", ()))
+        negative_count = len(hits.get("negative", ()))
+        improvement_count = len(hits.get("improvement", ()))
         
         # Detect specific aspects
         aspects = {
-            "guide_mentioned": any(word in text_lower for word in ["guide", "tour guide", "leader"]),
-            "accommodation_mentioned": any(word in text_lower for word in ["hotel", "accommodation", "stay", "room"]),
-            "transport_mentioned": any(word in text_lower for word in ["transport", "vehicle", "car", "bus", "travel"]),
-            "food_mentioned": any(word in text_lower for word in ["food", "meal", "restaurant", "dining"]),
-            "location_mentioned": any(word in text_lower for word in ["place", "location", "site", "destination"]),
-            "price_mentioned": any(word in text_lower for word in ["price", "cost", "expensive", "cheap", "value"])
+            f"{aspect}_mentioned": aspect in hits
+            for aspect in self.aspect_keywords
         }
         
         return {
@@ -190,33 +410,81 @@ class SentimentService:
             "negative_keywords": negative_count,
             "improvement_suggestions": improvement_count,
             "aspects_mentioned": aspects,
-            "tourism_focus_score": (positive_count + negative_count + improvement_count) / len(text.split()) * 100
+            "tourism_focus_score": (positive_count + negative_count + improvement_count) / len(processed.raw_tokens) * 100
         }
     
-    def extract_keywords(self, text: str, num_keywords: int = 10) -> List[str]:
+    def analyze_aspects(self, text: str) -> Dict[str, Dict[str, Any]]:
+        """Score each sentence with VADER and attribute it to the aspects it mentions"""
+        scores: Dict[str, List[float]] = {}
+        for sentence in SENTENCE_BOUNDARY.split(text or ""):
+            processed = process_text(sentence)
+            hits = self.keyword_matcher.match(processed.words)
+            aspects = [aspect for aspect in self.aspect_keywords if aspect in hits]
+            if not aspects:
+                continue
+            compound = vader_scores(self.sia, processed)["compound"]
+            for aspect in aspects:
+                scores.setdefault(aspect, []).append(compound)
+        
+        result = {}
+        for aspect, values in scores.items():
+            score = sum(values) / len(values)
+            result[aspect] = {
+                "sentiment": label_for(score)[0],
+                "score": round(score, 4),
+                "sentences": len(values)
+            }
+        return result
+    
+    def get_keyword_vocabulary(self) -> Dict[str, List[str]]:
+        """Get the tourism keyword and aspect vocabularies"""
+        return self.keyword_matcher.vocabularies()
+    
+    def add_keywords(self, group: str, terms: List[str]) -> Dict[str, Any]:
+        """Extend a keyword or aspect vocabulary at runtime"""
+        vocabulary = self.tourism_keywords.get(group, self.aspect_keywords.get(group))
+        if vocabulary is None:
+            raise ValueError(f"Unknown keyword group: {group}")
+        
+        added = self.keyword_matcher.add_terms(group, terms)
+        vocabulary.extend(added)
+        if added:
+            # Cached tourism contexts were computed with the old vocabulary
+            self.clear_result_caches()
+            self._bulk_scorer = None
+        return {"group": group, "added": added, "terms": list(vocabulary)}
+    
+    def set_keyword_vocabulary(self, vocabularies: Dict[str, List[str]]):
+        """Replace all vocabularies, e.g. to sync a worker with its parent"""
+        self.tourism_keywords = {group: list(vocabularies.get(group, [])) for group in self.tourism_keywords}
+        self.aspect_keywords = {group: list(vocabularies.get(group, [])) for group in self.aspect_keywords}
+        self.keyword_matcher = KeywordMatcher({**self.tourism_keywords, **self.aspect_keywords})
+        self.clear_result_caches()
+        self._bulk_scorer = None
+    
+    def extract_keywords(self, text: Union[str, ProcessedText], num_keywords: int = 10) -> List[str]:
         """Extract keywords from text with tourism focus"""
-        # Remove common stop words and punctuation
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", 
-            "of", "with", "by", "as", "is", "was", "were", "be", "been", "have",
-            "has", "had", "do", "does", "did", "will", "would", "could", "should",
-            "may", "might", "must", "can", "this", "that", "these", "those", "i",
-            "you", "he", "she", "it", "we", "they", "my", "your", "his", "her"
-        }
-        
-        # Clean and tokenize text
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+        processed = text if isinstance(text, ProcessedText) else process_text(text)
         
-        # Filter stop words and count frequencies
+        # Filter short words and stop words, then count frequencies
         word_freq = {}
-        for word in words:
-            if word not in stop_words:
+        for word in processed.words:
+            if len(word) >= 3 and word not in STOP_WORDS:
                 word_freq[word] = word_freq.get(word, 0) + 1
         
         # Sort by frequency and return top keywords
         sorted_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
         return [word for word, freq in sorted_keywords[:num_keywords]]
     
+    def group_by_language(self, texts: List[str], languages: List[str]) -> Dict[str, List[int]]:
+        """Positions of the texts per resolved language, so each scorer is used once per batch"""
+        if len(texts) != len(languages):
+            raise ValueError("languages must have one entry per text")
+        groups: Dict[str, List[int]] = {}
+        for position, (text, language) in enumerate(zip(texts, languages)):
+            groups.setdefault(self.languages.resolve(language, text), []).append(position)
+        return groups
+    
     def analyze_batch_texts(self, texts: List[str], language: str = "en") -> List[Dict[str, Any]]:
         """Analyze sentiment for multiple texts"""
         results = []
@@ -225,9 +493,10 @@ class SentimentService:
             results.append(result)
         return results
     
-    def get_overall_sentiment(self) -> Dict[str, Any]:
-        """Get overall sentiment analysis from all feedback"""
-        total_feedback = len(self.feedback_data)
+    def get_overall_sentiment(self, collapse_duplicates: bool = False) -> Dict[str, Any]:
+        """Get overall sentiment analysis from all feedback (or one item per duplicate cluster)"""
+        totals = self.aggregates.get_totals(unique_only=collapse_duplicates)
+        total_feedback = totals["total"]
         if total_feedback == 0:
             return {
                 "overall_score": 0,
@@ -237,30 +506,13 @@ class SentimentService:
                 "confidence": 0
             }
         
-        # Calculate sentiment distribution
-        sentiment_count = {"positive": 0, "neutral": 0, "negative": 0}
-        total_score = 0
-        total_rating = 0
-        
-        for feedback in self.feedback_data:
-            sentiment = feedback.get("sentiment", "neutral")
-            sentiment_count[sentiment] += 1
-            
-            # Convert sentiment to numerical score for average
-            if sentiment == "positive":
-                total_score += 1
-            elif sentiment == "negative":
-                total_score -= 1
-            
-            total_rating += feedback.get("rating", 0)
-        
-        overall_score = total_score / total_feedback
-        average_rating = total_rating / total_feedback
+        overall_score = totals["score_sum"] / total_feedback
+        average_rating = totals["total_rating"] / total_feedback
         
         # Convert counts to percentages
         sentiment_distribution = {
-            sentiment: (count / total_feedback) * 100 
-            for sentiment, count in sentiment_count.items()
+            sentiment: (totals[sentiment] / total_feedback) * 100
+            for sentiment in SENTIMENT_LABELS
         }
         
         # Calculate confidence based on data volume and consistency
@@ -277,36 +529,20 @@ class SentimentService:
     
     def get_sentiment_trends(self, days: int = 30) -> List[Dict[str, Any]]:
         """Get sentiment trends over time"""
-        if days > len(self.sentiment_history):
-            days = len(self.sentiment_history)
-        
-        return self.sentiment_history[-days:]
+        return self.sentiment_history.last(days)
+    
+    def get_sentiment_rollups(self, period: str = "week") -> List[Dict[str, Any]]:
+        """Get weekly or monthly sentiment totals for days older than the daily window"""
+        return self.sentiment_history.rollups(period)
     
     def get_sentiment_by_category(self) -> Dict[str, Any]:
         """Get sentiment analysis by category"""
-        categories = {}
-        
-        for feedback in self.feedback_data:
-            category = feedback.get("category", "general")
-            sentiment = feedback.get("sentiment", "neutral")
-            
-            if category not in categories:
-                categories[category] = {
-                    "positive": 0, 
-                    "neutral": 0, 
-                    "negative": 0, 
-                    "total": 0,
-                    "average_rating": 0,
-                    "total_rating": 0
-                }
-            
-            categories[category][sentiment] += 1
-            categories[category]["total"] += 1
-            categories[category]["total_rating"] += feedback.get("rating", 0)
+        categories = self.aggregates.get_categories()
         
         # Calculate percentages and averages
         for category, data in categories.items():
             total = data["total"]
+            data["average_rating"] = 0
             if total > 0:
                 data["positive_percent"] = (data["positive"] / total) * 100
                 data["neutral_percent"] = (data["neutral"] / total) * 100
@@ -317,86 +553,178 @@ class SentimentService:
     
     def process_feedback(self, feedback_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process new feedback and return sentiment analysis"""
-        # Analyze sentiment of the feedback comment
-        sentiment_result = self.analyze_single_text(feedback_data.get("comment", ""))
+        comment = feedback_data.get("comment", "")
+        language = normalize_language(feedback_data.get("language") or "en")
+        feedback_id = len(self.feedback_data) + 1
+        
+        # Near-duplicates of earlier feedback in the same language reuse that cluster's analysis
+        duplicate = self.duplicate_index.add(feedback_id, comment)
+        representative = duplicate[0] if duplicate else feedback_id
+        cluster_key = (representative, language)
+        sentiment_result = self.cluster_results.get(cluster_key) if duplicate else None
+        reused = sentiment_result is not None
+        if reused:
+            sentiment_result = dict(sentiment_result, text=comment, duplicate_of=representative,
+                                    duplicate_similarity=round(duplicate[1], 4),
+                                    timestamp=datetime.utcnow().isoformat())
+        else:
+            # Analyze sentiment of the feedback comment
+            sentiment_result = self.analyze_single_text(comment, language)
+            self.cluster_results.set(cluster_key, sentiment_result)
+        
+        # Aspect sentiment is computed once here and stored with the feedback; a duplicate
+        # reuses its cluster's only while the cluster result is cached (same vocabulary)
+        aspect_sentiment = None
+        if reused and representative <= len(self.feedback_data):
+            aspect_sentiment = self.feedback_data[representative - 1].get("aspect_sentiment")
+        if aspect_sentiment is None:
+            aspect_sentiment = self.analyze_aspects(comment)
         
         # Create new feedback entry
         new_feedback = {
-            "id": len(self.feedback_data) + 1,
+            "id": feedback_id,
             "user": feedback_data.get("user", "Anonymous"),
             "rating": feedback_data.get("rating", 0),
             "comment": feedback_data.get("comment", ""),
             "category": feedback_data.get("category", "general"),
             "date": datetime.utcnow().strftime("%Y-%m-%d"),
             "sentiment": sentiment_result["sentiment"],
-            "language": feedback_data.get("language", "en"),
-            "source": feedback_data.get("source", "web_platform")
+            "language": language,
+            "source": feedback_data.get("source", "web_platform"),
+            "site": feedback_data.get("site"),
+            "provider_id": feedback_data.get("provider_id"),
+            "duplicate_of": duplicate[0] if duplicate else None,
+            "aspect_sentiment": aspect_sentiment
         }
         
         self.feedback_data.append(new_feedback)
+        self.record_feedback(new_feedback, sentiment_result)
         
         # Update sentiment history
         self.update_sentiment_history(new_feedback)
+        alerts = self.spike_detector.observe(new_feedback)
         
         return {
             "feedback": new_feedback,
             "sentiment_analysis": sentiment_result,
+            "alerts": alerts,
             "message": "Feedback submitted successfully"
         }
     
     def update_sentiment_history(self, feedback: Dict[str, Any]):
         """Update sentiment history with new feedback"""
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        
-        # Find today's entry or create new one
-        today_entry = None
-        for entry in self.sentiment_history:
-            if entry["date"] == today:
-                today_entry = entry
+        self.sentiment_history.record(
+            today,
+            feedback.get("sentiment", "neutral"),
+            feedback.get("rating", 0) or 0
+        )
+    
+    def record_feedback(self, feedback: Dict[str, Any], analysis: Optional[Dict[str, Any]] = None):
+        """Fold one feedback item into the running aggregates"""
+        self.aggregates.add(feedback)
+        topics = analysis["keywords"][:5] if analysis else self.extract_keywords(feedback.get("comment", ""), 5)
+        self.topic_tracker.add(topics, feedback.get("category", "general"), feedback.get("date"))
+        if "aspect_sentiment" in feedback:
+            self._record_aspects(feedback)
+        else:
+            # Scored on the next aspect read, so building the service never loads the models
+            self._unscored_aspects.append(feedback)
+        
+        # Negative and neutral feedback that asks for changes becomes a suggestion
+        if feedback.get("sentiment") not in ["negative", "neutral"] or self.aggregates.suggestions_full():
+            return
+        if analysis is None:
+            # Checked on the next read, so building the service never loads the models
+            self._unanalyzed_feedback.append(feedback)
+            return
+        self._analyze_pending_suggestions()
+        self._add_suggestion(feedback, analysis)
+    
+    def _analyze_pending_suggestions(self):
+        """Check feedback recorded without an analysis, oldest first"""
+        pending, self._unanalyzed_feedback = self._unanalyzed_feedback, []
+        for feedback in pending:
+            if self.aggregates.suggestions_full():
                 break
-        
-        if not today_entry:
-            today_entry = {
-                "date": today,
-                "positive": 0,
-                "neutral": 0,
-                "negative": 0,
-                "total_feedback": 0,
-                "average_rating": 0
-            }
-            self.sentiment_history.append(today_entry)
-        
-        # Update counts
-        today_entry["total_feedback"] += 1
-        sentiment = feedback.get("sentiment", "neutral")
-        today_entry[sentiment] += 1
-        
-        # Update average rating
-        total_rating = sum(fb.get("rating", 0) for fb in self.feedback_data 
-                          if fb.get("date") == today)
-        today_entry["average_rating"] = round(total_rating / today_entry["total_feedback"], 1)
+            self._add_suggestion(
+                feedback, self.analyze_single_text(feedback.get("comment", ""), feedback.get("language", "en"))
+            )
+    
+    def _add_suggestion(self, feedback: Dict[str, Any], analysis: Dict[str, Any]):
+        if analysis["tourism_context"]["improvement_suggestions"] > 0:
+            self.aggregates.add_suggestion({
+                "feedback_id": feedback["id"],
+                "category": feedback.get("category", "general"),
+                "suggestion_text": feedback.get("comment", ""),
+                "priority": "high" if feedback["sentiment"] == "negative" else "medium",
+                "aspects": analysis["tourism_context"]["aspects_mentioned"],
+                "keywords": analysis["keywords"][:5]
+            })
+    
+    def _record_aspects(self, feedback: Dict[str, Any]):
+        self.aspect_rollups.record(
+            feedback["aspect_sentiment"], feedback.get("category", "general"), feedback.get("date")
+        )
+    
+    def _score_pending_aspects(self):
+        """Compute and roll up aspect sentiment of feedback recorded without it"""
+        pending, self._unscored_aspects = self._unscored_aspects, []
+        for feedback in pending:
+            feedback["aspect_sentiment"] = self.analyze_aspects(feedback.get("comment", ""))
+            self._record_aspects(feedback)
+    
+    def get_aspect_sentiment(self, category: Optional[str] = None, window: bool = True) -> Dict[str, Any]:
+        """Get per-aspect sentiment over the rolling window (or all time)"""
+        self._score_pending_aspects()
+        aspects = self.aspect_rollups.window(category) if window else self.aspect_rollups.totals(category)
+        return {
+            "category": category,
+            "window_days": self.aspect_rollups.window_days if window else None,
+            "aspects": aspects
+        }
+    
+    def get_aspect_trend(self, aspect: str, days: int = 30, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get one aspect's daily sentiment over the last ``days`` days"""
+        if aspect not in self.aspect_keywords:
+            raise ValueError(f"Unknown aspect: {aspect}")
+        self._score_pending_aspects()
+        return self.aspect_rollups.trend(aspect, days, category)
+    
+    def get_sentiment_alerts(self, after: int = 0, limit: int = 100,
+                             dimension: Optional[str] = None) -> Dict[str, Any]:
+        """Get negative-sentiment spike alerts raised after alert ID ``after``"""
+        return {
+            "alerts": self.spike_detector.get_alerts(after, limit, dimension),
+            "stats": self.spike_detector.get_stats()
+        }
     
     def get_improvement_suggestions(self) -> List[Dict[str, Any]]:
         """Get actionable improvement suggestions from feedback"""
-        suggestions = []
-        
-        # Analyze negative and neutral feedback for improvement areas
-        for feedback in self.feedback_data:
-            if feedback["sentiment"] in ["negative", "neutral"]:
-                analysis = self.analyze_single_text(feedback["comment"])
-                
-                if analysis["tourism_context"]["improvement_suggestions"] > 0:
-                    suggestion = {
-                        "feedback_id": feedback["id"],
-                        "category": feedback["category"],
-                        "suggestion_text": feedback["comment"],
-                        "priority": "high" if feedback["sentiment"] == "negative" else "medium",
-                        "aspects": analysis["tourism_context"]["aspects_mentioned"],
-                        "keywords": analysis["keywords"][:5]
-                    }
-                    suggestions.append(suggestion)
-        
-        return suggestions[:10]  # Return top 10 suggestions
+        self._analyze_pending_suggestions()
+        return self.aggregates.get_suggestions()
+    
+    def get_duplicate_clusters(self, limit: int = 20) -> Dict[str, Any]:
+        """Get the largest clusters of near-duplicate feedback and the index stats"""
+        largest = sorted(self.duplicate_index.clusters.items(), key=lambda item: len(item[1]), reverse=True)
+        return {
+            "clusters": [
+                {
+                    "representative_id": representative,
+                    "size": len(members),
+                    "feedback_ids": members,
+                    # Feedback IDs are positions in feedback_data, starting at 1
+                    "comment": self.feedback_data[representative - 1]["comment"]
+                }
+                for representative, members in largest[:limit]
+            ],
+            "index": self.duplicate_index.get_stats()
+        }
+    
+    def get_feedback_topics(self, limit: int = 10, category: Optional[str] = None,
+                            days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the most discussed feedback topics, overall, per category or for recent days"""
+        return self.topic_tracker.top(limit, category, days)
     
     def get_sentiment_summary(self) -> Dict[str, Any]:
         """Get comprehensive sentiment summary"""
@@ -448,13 +776,7 @@ class SentimentService:
     def analyze_social_media_sentiment(self, platform: str, query: str) -> Dict[str, Any]:
         """Analyze sentiment from social media (mock implementation)"""
         # In a real implementation, this would connect to social media APIs
-        mock_posts = [
-            "Loved my trip to Jharkhand! The eco-tourism initiatives are amazing. 🌿",
-            "The tribal handicrafts marketplace is fantastic! Supporting local artisans. 🛍️",
-            "Had some issues with transportation but the guides were knowledgeable.",
-            "Beautiful waterfalls and rich cultural heritage. Highly recommended!",
-            "Platform needs better customer support, but overall good experience."
-        ]
+        mock_posts = list(SAMPLE_SOCIAL_POSTS)
         
         analysis_results = self.analyze_batch_texts(mock_posts)
         
@@ -0,0 +1,404 @@
+import asyncio
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from .sentiment_engine import SentimentBatchEngine
+from .sentiment_jobs import JobWork
+from .sentiment_service import SAMPLE_SOCIAL_POSTS
+from ..utils.language_scorers import normalize_language
+from ..utils.ndjson import MAX_LINE_BYTES
+from ..utils.topic_tracker import TopicTracker
+
+DEFAULT_SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "social")
+
+# Window over which the recent posts/sec rate is measured
+RATE_WINDOW_SECONDS = 10.0
+
+# Marks the end of a queue's input
+_END = object()
+
+
+class PostSource(ABC):
+    """A stream of raw social media posts (JSON strings or objects with a "text" field)"""
+
+    kind = "source"
+
+    def __init__(self, platform: str):
+        self.platform = platform
+
+    @abstractmethod
+    def read(self) -> AsyncIterator[Any]:
+        """Yield raw posts; undecodable ones are yielded as None"""
+
+    def describe(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "platform": self.platform}
+
+
+class FixturePostSource(PostSource):
+    """Replays a fixed list of posts, e.g. for tests and demos"""
+
+    kind = "fixture"
+
+    def __init__(self, posts: Iterable[Any] = SAMPLE_SOCIAL_POSTS, platform: str = "fixture",
+                 repeat: int = 1, interval: float = 0.0):
+        super().__init__(platform)
+        self.posts = list(posts)
+        self.repeat = max(1, repeat)
+        self.interval = max(0.0, interval)
+
+    async def read(self) -> AsyncIterator[Any]:
+        count = 0
+        for _ in range(self.repeat):
+            for post in self.posts:
+                yield post
+                count += 1
+                if self.interval:
+                    await asyncio.sleep(self.interval)
+                elif count % 100 == 0:
+                    # Let the rest of the pipeline run between posts
+                    await asyncio.sleep(0)
+
+    def describe(self) -> Dict[str, Any]:
+        return dict(super().describe(), posts=len(self.posts), repeat=self.repeat, interval=self.interval)
+
+
+class FilePostSource(PostSource):
+    """Reads posts from an NDJSON file, optionally following it as it grows (like ``tail -f``)"""
+
+    kind = "file"
+
+    def __init__(self, path: str, platform: str = "file", follow: bool = False,
+                 poll_interval: float = 1.0, read_lines: int = 256):
+        super().__init__(platform)
+        self.path = path
+        self.follow = follow
+        self.poll_interval = poll_interval
+        self.read_lines = max(1, read_lines)
+
+    async def read(self) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        with open(self.path, "rb") as file:
+            while True:
+                # File reads run off the event loop, a block of lines at a time
+                values = await loop.run_in_executor(None, self._read_block, file)
+                if not values:
+                    if not self.follow:
+                        return
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                for value in values:
+                    yield value
+
+    def _read_block(self, file) -> List[Any]:
+        values = []
+        while len(values) < self.read_lines:
+            start = file.tell()
+            line = file.readline(MAX_LINE_BYTES + 1)
+            if not line:
+                break
+            if not line.endswith(b"\n"):
+                if len(line) > MAX_LINE_BYTES:
+                    # Discard the rest of an oversized line
+                    while line and not line.endswith(b"\n"):
+                        line = file.readline(MAX_LINE_BYTES)
+                    values.append(None)
+                    continue
+                if self.follow:
+                    # The writer has not finished this line; read it again on the next poll
+                    file.seek(start)
+                    break
+            if line.strip():
+                values.append(_decode(line))
+        return values
+
+    def describe(self) -> Dict[str, Any]:
+        return dict(super().describe(), path=os.path.basename(self.path), follow=self.follow)
+
+
+def _decode(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def build_source(kind: str, platform: Optional[str] = None, path: Optional[str] = None,
+                 follow: bool = False, repeat: int = 1, interval: float = 0.0,
+                 source_dir: str = DEFAULT_SOURCE_DIR) -> PostSource:
+    """Create a post source; file paths must stay inside ``source_dir``"""
+    if kind == "fixture":
+        return FixturePostSource(platform=platform or "fixture", repeat=repeat, interval=interval)
+    if kind == "file":
+        if not path:
+            raise ValueError("A file source needs a path")
+        root = os.path.realpath(source_dir)
+        resolved = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath([root, resolved]) != root:
+            raise ValueError("Source path must be inside the ingestion source directory")
+        if not os.path.isfile(resolved):
+            raise ValueError(f"Source file not found: {path}")
+        return FilePostSource(resolved, platform or "file", follow=follow)
+    raise ValueError(f"Unknown post source: {kind}")
+
+
+def normalize_post(value: Any, platform: str, language: str, number: int) -> Optional[Dict[str, Any]]:
+    """Turn a raw post into the pipeline's post record (None if it has no text)"""
+    if isinstance(value, str):
+        value = {"text": value}
+    if not isinstance(value, dict) or not isinstance(value.get("text"), str) or not value["text"].strip():
+        return None
+    post_language = value.get("language") or language
+    try:
+        normalize_language(post_language)
+    except ValueError:
+        # A malformed language tag falls back to the job's language
+        post_language = language
+    return {
+        "id": value.get("id", number),
+        "platform": str(value.get("platform") or platform),
+        "author": value.get("author"),
+        "created_at": value.get("created_at"),
+        "language": post_language,
+        "text": value["text"]
+    }
+
+
+def _empty_counts() -> Dict[str, Any]:
+    return {"total": 0, "positive": 0, "negative": 0, "neutral": 0, "score_sum": 0.0}
+
+
+def _public_counts(counts: Dict[str, Any]) -> Dict[str, Any]:
+    total = counts["total"]
+    return {
+        "total": total,
+        "positive": counts["positive"],
+        "negative": counts["negative"],
+        "neutral": counts["neutral"],
+        "positive_percent": round(counts["positive"] / total * 100, 2) if total else 0.0,
+        "negative_percent": round(counts["negative"] / total * 100, 2) if total else 0.0,
+        "average_score": round(counts["score_sum"] / total, 4) if total else 0.0
+    }
+
+
+class SocialIngestionPipeline:
+    """Micro-batched sentiment analysis of a social media post stream.
+
+    A reader task pulls posts from the source into a bounded post queue; a
+    batcher cuts them into micro-batches of ``batch_size`` posts, or fewer once
+    ``max_wait_seconds`` have passed since a batch's first post; up to
+    ``max_in_flight`` batches are scored concurrently on the batch engine.
+    Both queues are bounded, so when analysis falls behind the batcher and
+    then the reader wait instead of buffering without limit. Results go to
+    the job's results (the newest ``max_results`` are kept) and into running
+    per-platform and topic aggregates; throughput and queue depths are
+    reported in the job's ``metrics``.
+    """
+
+    def __init__(self, engine: SentimentBatchEngine, batch_size: int = 100, max_wait_seconds: float = 0.5,
+                 queue_size: int = 1000, max_in_flight: int = 2, max_results: int = 10000,
+                 language: str = "en", query: Optional[str] = None):
+        self.engine = engine
+        self.batch_size = max(1, batch_size)
+        self.max_wait_seconds = max(0.001, max_wait_seconds)
+        self.queue_size = max(1, queue_size)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_results = max(0, max_results)
+        self.language = normalize_language(language)
+        # Only posts containing the query (case-insensitive) are analyzed
+        self.query = query.lower() if query else None
+
+        self.totals = _empty_counts()
+        self.platforms: Dict[str, Dict[str, Any]] = {}
+        self.topics = TopicTracker()
+        self.counts = {"read": 0, "analyzed": 0, "invalid": 0, "filtered": 0, "batches": 0, "results_trimmed": 0}
+        self.flushes = {"size": 0, "time": 0, "end": 0}
+        self.blocked = {"reader": 0.0, "batcher": 0.0}
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.batch_seconds = 0.0
+        self._posts: Optional[asyncio.Queue] = None
+        self._batches: Optional[asyncio.Queue] = None
+        self._started = 0.0
+        self._rate_samples: deque = deque()
+
+    def work(self, source: PostSource) -> JobWork:
+        """Job body for ``SentimentJobQueue.submit``"""
+        async def work(job: Dict[str, Any]):
+            await self._run(job, source)
+        return work
+
+    async def _run(self, job: Dict[str, Any], source: PostSource):
+        self._posts = asyncio.Queue(self.queue_size)
+        self._batches = asyncio.Queue(self.max_in_flight)
+        self._started = time.monotonic()
+        job["source"] = source.describe()
+        self._refresh(job)
+
+        tasks = [
+            asyncio.ensure_future(self._read(source)),
+            asyncio.ensure_future(self._batch(job))
+        ] + [asyncio.ensure_future(self._analyze(job)) for _ in range(self.max_in_flight)]
+        try:
+            # Runs until the source ends (or the job is cancelled); the first failure stops every stage
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._refresh(job)
+
+    async def _put(self, queue: asyncio.Queue, item: Any, stage: str):
+        if queue.full():
+            # Backpressure: wait for the next stage to catch up
+            started = time.monotonic()
+            await queue.put(item)
+            self.blocked[stage] += time.monotonic() - started
+        else:
+            queue.put_nowait(item)
+
+    async def _read(self, source: PostSource):
+        number = 0
+        async for value in source.read():
+            number += 1
+            post = normalize_post(value, source.platform, self.language, number)
+            if post is None:
+                self.counts["invalid"] += 1
+                continue
+            if self.query is not None and self.query not in post["text"].lower():
+                self.counts["filtered"] += 1
+                continue
+            await self._put(self._posts, post, "reader")
+            self.counts["read"] += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._posts.qsize())
+        await self._posts.put(_END)
+
+    async def _batch(self, job: Dict[str, Any]):
+        loop = asyncio.get_running_loop()
+        ended = False
+        while not ended:
+            try:
+                first = await asyncio.wait_for(self._posts.get(), self.max_wait_seconds)
+            except asyncio.TimeoutError:
+                # Idle source: keep the metrics current
+                self._refresh(job)
+                continue
+            if first is _END:
+                break
+
+            batch = [first]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.batch_size:
+                try:
+                    post = self._posts.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        post = await asyncio.wait_for(self._posts.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if post is _END:
+                    ended = True
+                    break
+                batch.append(post)
+
+            reason = "size" if len(batch) >= self.batch_size else "end" if ended else "time"
+            self.flushes[reason] += 1
+            await self._put(self._batches, batch, "batcher")
+            self._refresh(job)
+
+        for _ in range(self.max_in_flight):
+            await self._batches.put(_END)
+
+    async def _analyze(self, job: Dict[str, Any]):
+        chunk_size = max(1, self.batch_size // self.engine.max_workers)
+        while True:
+            batch = await self._batches.get()
+            if batch is _END:
+                return
+            self.in_flight += 1
+            started = time.monotonic()
+            try:
+                results = await self.engine.analyze_grouped(
+                    [post["text"] for post in batch], [post["language"] for post in batch], chunk_size
+                )
+            finally:
+                self.in_flight -= 1
+            self.batch_seconds += time.monotonic() - started
+            self._write(job, batch, results)
+            self._refresh(job)
+
+    def _write(self, job: Dict[str, Any], batch: List[Dict[str, Any]], results: List[Dict[str, Any]]):
+        """Store one analyzed batch and count it into the aggregates"""
+        records = []
+        for post, result in zip(batch, results):
+            keywords = result.get("keywords", [])[:5]
+            records.append(dict(post, sentiment=result["sentiment"], score=result["score"], keywords=keywords))
+            platform = self.platforms.get(post["platform"])
+            if platform is None:
+                platform = self.platforms[post["platform"]] = _empty_counts()
+            for counts in (self.totals, platform):
+                counts["total"] += 1
+                counts[result["sentiment"]] += 1
+                counts["score_sum"] += result["score"]
+            day = post["created_at"][:10] if isinstance(post["created_at"], str) else None
+            self.topics.add(keywords, post["platform"], day)
+
+        job["results"].extend(records)
+        excess = len(job["results"]) - self.max_results
+        if excess > 0:
+            del job["results"][:excess]
+            self.counts["results_trimmed"] += excess
+        self.counts["analyzed"] += len(batch)
+        self.counts["batches"] += 1
+
+    def _refresh(self, job: Dict[str, Any]):
+        """Publish current progress, metrics and aggregates on the job record"""
+        now = time.monotonic()
+        elapsed = now - self._started
+        analyzed = self.counts["analyzed"]
+        self._rate_samples.append((now, analyzed))
+        while len(self._rate_samples) > 2 and now - self._rate_samples[1][0] >= RATE_WINDOW_SECONDS:
+            self._rate_samples.popleft()
+        since, analyzed_since = self._rate_samples[0]
+        batches = self.counts["batches"]
+
+        job["total"] = self.counts["read"]
+        job["processed"] = analyzed
+        job["metrics"] = {
+            "posts_read": self.counts["read"],
+            "posts_analyzed": analyzed,
+            "invalid_posts": self.counts["invalid"],
+            "filtered_posts": self.counts["filtered"],
+            "batches": batches,
+            "flushes": dict(self.flushes),
+            "posts_per_sec": round(analyzed / elapsed, 1) if elapsed else 0.0,
+            "recent_posts_per_sec": round((analyzed - analyzed_since) / (now - since), 1) if now > since else 0.0,
+            "queue_depth": self._posts.qsize() if self._posts else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_size": self.queue_size,
+            "batches_waiting": self._batches.qsize() if self._batches else 0,
+            "batches_in_flight": self.in_flight,
+            "reader_blocked_seconds": round(self.blocked["reader"], 3),
+            "batcher_blocked_seconds": round(self.blocked["batcher"], 3),
+            "average_batch_size": round(analyzed / batches, 1) if batches else 0.0,
+            "average_batch_ms": round(self.batch_seconds / batches * 1000, 1) if batches else 0.0,
+            "results_trimmed": self.counts["results_trimmed"],
+            "elapsed_seconds": round(elapsed, 2)
+        }
+        job["summary"] = self.get_summary()
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get sentiment counts overall and per platform, and the top topics"""
+        return {
+            "overall": _public_counts(self.totals),
+            "platforms": {name: _public_counts(counts) for name, counts in self.platforms.items()},
+            "topics": self.topics.top(10)
+        }
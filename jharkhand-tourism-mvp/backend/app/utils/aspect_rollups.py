@@ -0,0 +1,154 @@
+"""Per-aspect sentiment rollups maintained as feedback is ingested.
+
+Each feedback item contributes one sentiment per aspect it mentions (guide,
+transport, food, ...). Those are counted all-time, per category and per day,
+and a running sum over the last ``window_days`` days is kept as well: days
+are added to it as they are recorded and subtracted once they fall out of
+the window. Reading "sentiment by aspect over the last 90 days" returns
+that running sum, so its cost does not depend on the amount of feedback.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .sentiment_aggregates import SENTIMENT_LABELS
+
+# Counters of one aspect in one bucket
+_FIELDS = ("positive", "neutral", "negative", "mentions", "score_sum")
+
+# (category, aspect) -> counters
+_Counters = Dict[Tuple[str, str], Dict[str, float]]
+
+
+def _empty_counts() -> Dict[str, float]:
+    return {"positive": 0, "neutral": 0, "negative": 0, "mentions": 0, "score_sum": 0.0}
+
+
+def _public(counts: Dict[str, float]) -> Dict[str, Any]:
+    """Counters as returned by the API: score sum replaced by the average"""
+    mentions = counts["mentions"]
+    entry = {label: counts[label] for label in SENTIMENT_LABELS}
+    entry["mentions"] = mentions
+    entry["average_score"] = round(counts["score_sum"] / mentions, 4) if mentions else 0
+    return entry
+
+
+def _add(target: Dict[str, float], source: Dict[str, float], sign: int = 1):
+    for field in _FIELDS:
+        target[field] += sign * source[field]
+
+
+class AspectRollups:
+    """Aspect sentiment counters all-time, per category, per day and over a sliding window"""
+
+    def __init__(self, window_days: int = 90, daily_retention: int = 400):
+        self.window_days = max(1, window_days)
+        self.daily_retention = max(self.window_days, daily_retention)
+        self._lock = threading.Lock()
+        self._totals: _Counters = {}
+        self._days: Dict[str, _Counters] = {}
+        self._window: _Counters = {}
+        # First day counted in the window, moved forward as time passes
+        self._window_start = self._start_for(datetime.utcnow())
+
+    def _start_for(self, now: datetime) -> str:
+        return (now - timedelta(days=self.window_days - 1)).strftime("%Y-%m-%d")
+
+    def record(self, aspects: Dict[str, Dict[str, Any]], category: str = "general",
+               day: Optional[str] = None):
+        """Count one feedback item's ``{aspect: {"sentiment", "score"}}`` results"""
+        if not aspects:
+            return
+        day = day or datetime.utcnow().strftime("%Y-%m-%d")
+        with self._lock:
+            self._advance()
+            day_counts = self._days.get(day)
+            if day_counts is None:
+                day_counts = self._insert_day(day)
+            in_window = self._window_start <= day
+            for aspect, result in aspects.items():
+                sentiment = result.get("sentiment")
+                if sentiment not in SENTIMENT_LABELS:
+                    sentiment = "neutral"
+                score = float(result.get("score", 0) or 0)
+                targets = [self._totals, day_counts] + ([self._window] if in_window else [])
+                for counters in targets:
+                    for key in ((category, aspect), ("*", aspect)):
+                        counts = counters.get(key)
+                        if counts is None:
+                            counts = counters[key] = _empty_counts()
+                        counts[sentiment] += 1
+                        counts["mentions"] += 1
+                        counts["score_sum"] += score
+            self._evict()
+
+    def _insert_day(self, day: str) -> _Counters:
+        """Add an empty day, keeping days in date order"""
+        newest = next(reversed(self._days), None)
+        counts = self._days[day] = {}
+        if newest is not None and day < newest:
+            # Backfilled day: re-sort, which is rare
+            ordered = sorted(self._days.items())
+            self._days.clear()
+            self._days.update(ordered)
+        return counts
+
+    def _advance(self):
+        """Subtract days that slid out of the window since the last call"""
+        start = self._start_for(datetime.utcnow())
+        if start <= self._window_start:
+            return
+        for day, day_counts in self._days.items():
+            if day >= start:
+                break
+            if day >= self._window_start:
+                for key, counts in day_counts.items():
+                    _add(self._window[key], counts, -1)
+        self._window_start = start
+
+    def _evict(self):
+        while len(self._days) > self.daily_retention:
+            day = next(iter(self._days))
+            if day >= self._window_start:
+                break
+            del self._days[day]
+
+    def _select(self, counters: _Counters, category: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        wanted = category or "*"
+        return {
+            aspect: _public(counts)
+            for (key_category, aspect), counts in counters.items()
+            if key_category == wanted and counts["mentions"]
+        }
+
+    def window(self, category: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Get per-aspect sentiment over the last ``window_days`` days (one category or all)"""
+        with self._lock:
+            self._advance()
+            return self._select(self._window, category)
+
+    def totals(self, category: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Get all-time per-aspect sentiment (one category or all)"""
+        with self._lock:
+            return self._select(self._totals, category)
+
+    def trend(self, aspect: str, days: int = 30, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get one aspect's daily sentiment for the last ``days`` days held, oldest first"""
+        since = (datetime.utcnow() - timedelta(days=max(1, days) - 1)).strftime("%Y-%m-%d")
+        key = (category or "*", aspect)
+        with self._lock:
+            return [
+                dict(_public(day_counts[key]), date=day)
+                for day, day_counts in self._days.items()
+                if day >= since and key in day_counts
+            ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get window settings and how many days are held"""
+        with self._lock:
+            return {
+                "window_days": self.window_days,
+                "window_start": self._window_start,
+                "days": len(self._days),
+                "daily_retention": self.daily_retention
+            }
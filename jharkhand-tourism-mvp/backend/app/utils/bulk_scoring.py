@@ -0,0 +1,177 @@
+"""Vectorized lexicon scoring for bulk and offline sentiment jobs.
+
+The VADER lexicon, TextBlob's word polarities and the tourism keyword weights
+are laid out as NumPy arrays over one shared vocabulary. A batch of texts is
+encoded as a sparse (CSR-style) index matrix: one flat array of vocabulary
+ids, the text (row) each token belongs to and its position in that text.
+Scores for the whole batch are then computed with array operations: gathers,
+shifted negation masks and ``bincount`` row sums.
+
+This approximates the per-text path (``SentimentService.analyze_single_text``)
+rather than reproducing it: VADER's negation window, "but" weighting and
+normalization are kept, and TextBlob polarity becomes the mean polarity of
+known words with simple negation. Idioms, boosters, capitalization and
+punctuation emphasis are skipped.
+"""
+import string
+from typing import Dict, List, Tuple
+
+import numpy as np
+from nltk.sentiment.vader import VaderConstants
+from textblob.en import sentiment as pattern_sentiment
+
+_PUNCTUATION = string.punctuation
+
+# VADER's compound normalization constant and negation scalar
+_ALPHA = 15
+_NEGATION_SCALAR = VaderConstants.N_SCALAR
+
+# TextBlob halves and flips a negated polarity
+_PATTERN_NEGATION_SCALAR = -0.5
+
+# Valence given to tourism keywords that VADER does not know
+TOURISM_KEYWORD_VALENCE = 1.5
+
+# Same label thresholds as analyze_single_text
+LABEL_THRESHOLD = 0.1
+
+
+def label_for(score: float) -> Tuple[str, float]:
+    """Sentiment label and confidence for a combined score"""
+    if score > LABEL_THRESHOLD:
+        return "positive", min(score, 1.0)
+    if score < -LABEL_THRESHOLD:
+        return "negative", min(abs(score), 1.0)
+    return "neutral", 1.0 - abs(score)
+
+
+class BulkSentimentScorer:
+    """Scores whole batches of texts with NumPy array operations"""
+
+    def __init__(self, vader_lexicon: Dict[str, float], tourism_keywords: Dict[str, List[str]]):
+        len(pattern_sentiment)  # Make sure TextBlob's lexicon is loaded
+        pattern = {word: senses[None][0] for word, senses in pattern_sentiment.items() if None in senses}
+
+        words = set(vader_lexicon) | set(pattern)
+        words |= set(VaderConstants.NEGATE) | set(pattern_sentiment.negations) | {"but"}
+        for group in ("positive", "negative"):
+            words.update(term for term in tourism_keywords.get(group, []) if " " not in term)
+
+        # Id 0 is reserved for unknown tokens, whose weights are all zero
+        self.vocabulary: Dict[str, int] = {word: i for i, word in enumerate(sorted(words), start=1)}
+        size = len(self.vocabulary) + 1
+
+        self.vader_valence = np.zeros(size)
+        self.pattern_polarity = np.zeros(size)
+        self.pattern_known = np.zeros(size, dtype=bool)
+        self.vader_negation = np.zeros(size, dtype=bool)
+        self.pattern_negation = np.zeros(size, dtype=bool)
+        self.is_but = np.zeros(size, dtype=bool)
+
+        for word, valence in vader_lexicon.items():
+            self.vader_valence[self.vocabulary[word]] = valence
+        for word, polarity in pattern.items():
+            self.pattern_polarity[self.vocabulary[word]] = polarity
+            self.pattern_known[self.vocabulary[word]] = True
+        for word in VaderConstants.NEGATE:
+            self.vader_negation[self.vocabulary[word]] = True
+        for word in pattern_sentiment.negations:
+            self.pattern_negation[self.vocabulary[word]] = True
+        self.is_but[self.vocabulary["but"]] = True
+
+        # Tourism keywords fill gaps in VADER ("knowledgeable", "overpriced", ...)
+        for group, sign in (("positive", 1), ("negative", -1)):
+            for term in tourism_keywords.get(group, []):
+                index = self.vocabulary.get(term)
+                if index is not None and self.vader_valence[index] == 0:
+                    self.vader_valence[index] = sign * TOURISM_KEYWORD_VALENCE
+
+    def encode(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Encode texts as flat ``(token_ids, rows, positions)`` arrays"""
+        vocabulary_get = self.vocabulary.get
+        ids: List[int] = []
+        lengths: List[int] = []
+        for text in texts:
+            tokens = [token.strip(_PUNCTUATION) for token in text.lower().split()]
+            row = [vocabulary_get(token, 0) for token in tokens if token]
+            ids.extend(row)
+            lengths.append(len(row))
+
+        token_ids = np.fromiter(ids, dtype=np.int32, count=len(ids))
+        counts = np.asarray(lengths, dtype=np.int64)
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(texts) else counts
+        positions = np.arange(len(token_ids), dtype=np.int64) - np.repeat(starts, counts)
+        return token_ids, rows, positions
+
+    def score(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """Get VADER-like compound, TextBlob-like polarity and combined scores per text"""
+        n_texts = len(texts)
+        token_ids, rows, positions = self.encode(texts)
+        if not len(token_ids):
+            zeros = np.zeros(n_texts)
+            return {"compound": zeros, "polarity": zeros.copy(), "score": zeros.copy()}
+
+        # VADER: a negation in the previous three tokens scales the valence
+        valence = self.vader_valence[token_ids]
+        negated = _preceded_by(self.vader_negation[token_ids], rows, 3)
+        valence = np.where(negated, valence * _NEGATION_SCALAR, valence)
+
+        # VADER "but" check: halve before the first "but", boost after it
+        but_flags = self.is_but[token_ids]
+        first_but = np.full(n_texts, np.iinfo(np.int64).max)
+        np.minimum.at(first_but, rows[but_flags], positions[but_flags])
+        token_first_but = first_but[rows]
+        has_but = token_first_but != np.iinfo(np.int64).max
+        valence = np.where(has_but & (positions < token_first_but), valence * 0.5, valence)
+        valence = np.where(has_but & (positions > token_first_but), valence * 1.5, valence)
+
+        totals = np.bincount(rows, weights=valence, minlength=n_texts)
+        compound = np.clip(totals / np.sqrt(totals * totals + _ALPHA), -1.0, 1.0)
+
+        # TextBlob: mean polarity of known words, flipped after a negation
+        polarity = self.pattern_polarity[token_ids]
+        pattern_negated = _preceded_by(self.pattern_negation[token_ids], rows, 1)
+        polarity = np.where(pattern_negated, polarity * _PATTERN_NEGATION_SCALAR, polarity)
+        known = self.pattern_known[token_ids]
+        polarity_sums = np.bincount(rows, weights=np.where(known, polarity, 0.0), minlength=n_texts)
+        known_counts = np.bincount(rows, weights=known.astype(np.float64), minlength=n_texts)
+        mean_polarity = np.divide(polarity_sums, known_counts, out=np.zeros(n_texts), where=known_counts > 0)
+        mean_polarity = np.clip(mean_polarity, -1.0, 1.0)
+
+        return {
+            "compound": np.round(compound, 4),
+            "polarity": mean_polarity,
+            "score": (mean_polarity + np.round(compound, 4)) / 2
+        }
+
+    def analyze(self, texts: List[str]) -> List[Dict[str, object]]:
+        """Score texts and return one small result dict per text, in input order"""
+        scores = self.score(texts)
+        results = []
+        for text, score, compound, polarity in zip(
+            texts, scores["score"].tolist(), scores["compound"].tolist(), scores["polarity"].tolist()
+        ):
+            if not text.strip():
+                score = compound = polarity = 0.0
+            label, confidence = label_for(score)
+            results.append({
+                "text": text,
+                "sentiment": label,
+                "score": score,
+                "confidence": confidence,
+                "vader_compound": compound,
+                "textblob_polarity": polarity
+            })
+        return results
+
+
+def _preceded_by(flags: np.ndarray, rows: np.ndarray, window: int) -> np.ndarray:
+    """Mark tokens with a flagged token among the previous ``window`` tokens of the same row"""
+    marked = np.zeros(len(flags), dtype=bool)
+    for shift in range(1, window + 1):
+        if shift >= len(flags):
+            break
+        same_row = rows[shift:] == rows[:-shift]
+        marked[shift:] |= flags[:-shift] & same_row
+    return marked
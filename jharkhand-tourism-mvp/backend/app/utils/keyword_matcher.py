@@ -0,0 +1,153 @@
+"""Token-level multi-pattern matcher for tourism vocabularies.
+
+All keyword groups (positive/negative/improvement terms and aspect terms) are
+compiled into a single index keyed by the first token of each term and its
+inflected forms, so one linear scan with one dict lookup per token returns
+every hit in every group. Terms match whole words (plus light inflections
+such as "guides", "improved" or "transportation"), so "car" no longer
+matches inside "careful" or "oscars". Compound words only match through the
+explicit ``COMPOUNDS`` list ("overcrowded" counts as "crowded"), and a term
+right after a split-off negating prefix ("un-friendly") is not matched.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# One compiled term: (remaining tokens after the first one, group, term)
+_Entry = Tuple[Tuple[str, ...], str, str]
+
+# Compound words that count as the term they end in
+COMPOUNDS = {
+    "overcrowded": "crowded",
+    "homestay": "stay",
+    "marketplace": "place",
+    "tourguide": "guide",
+}
+
+# Prefixes that negate the word they are attached to; a compound may not start with one
+NEGATING_PREFIXES = ("un", "in", "dis", "non")
+
+# Negating prefixes the tokenizer splits off as a token of their own ("un-friendly");
+# "in" is left out because as a token it is nearly always the preposition
+_NEGATING_TOKENS = frozenset(("un", "dis", "non"))
+
+
+def _surface_forms(word: str) -> Set[str]:
+    """A word and its common inflections ("guide" -> "guides", "guided", ...)"""
+    forms = {word}
+    if len(word) < 3:
+        return forms
+    for suffix in ("s", "es", "ed", "ing", "ment", "ments", "ion", "ions", "ation", "ations"):
+        forms.add(word + suffix)
+    if word.endswith("e"):
+        stem = word[:-1]
+        forms.update((word + "d", stem + "ing", stem + "ion", stem + "ions", stem + "ation", stem + "ations"))
+    return forms
+
+
+def _check_compounds(compounds: Dict[str, str]) -> Dict[str, str]:
+    """Validate a compound list: each word must end in its term after a non-negating prefix"""
+    checked = {}
+    for word, term in compounds.items():
+        word, term = word.lower(), term.lower()
+        head = word[:-len(term)] if term and word.endswith(term) else ""
+        if not head:
+            raise ValueError(f"Compound {word!r} does not end in {term!r} after a prefix")
+        if head.startswith(NEGATING_PREFIXES):
+            raise ValueError(f"Compound {word!r} starts with a negating prefix")
+        checked[word] = term
+    return checked
+
+
+class KeywordMatcher:
+    """Matches many keyword groups against a token stream in one pass"""
+
+    def __init__(self, vocabularies: Dict[str, List[str]] = None,
+                 compounds: Optional[Dict[str, str]] = None):
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[_Entry, ...]] = {}
+        # term -> compound words that count as it
+        self._compounds: Dict[str, List[str]] = {}
+        for word, term in _check_compounds(COMPOUNDS if compounds is None else compounds).items():
+            self._compounds.setdefault(term, []).append(word)
+        self._vocabularies: Dict[str, List[str]] = {}
+        for group, terms in (vocabularies or {}).items():
+            self.add_terms(group, terms)
+
+    def _forms(self, words: Tuple[str, ...]) -> Set[str]:
+        # Inflections of the first word, plus those of its compounds for one-word terms
+        forms = _surface_forms(words[0])
+        if len(words) == 1:
+            for compound in self._compounds.get(words[0], ()):
+                forms |= _surface_forms(compound)
+        return forms
+
+    def add_terms(self, group: str, terms: Iterable[str]) -> List[str]:
+        """Add terms to a group at runtime; returns the terms that were new.
+
+        Only the index buckets of the new terms are replaced, so concurrent
+        ``match`` calls keep working against a consistent index.
+        """
+        added = []
+        with self._lock:
+            known = self._vocabularies.setdefault(group, [])
+            for term in terms:
+                words = tuple(term.lower().split())
+                normalized = " ".join(words)
+                if not words or normalized in known:
+                    continue
+                entry = (words[1:], group, normalized)
+                for form in self._forms(words):
+                    self._index[form] = self._index.get(form, ()) + (entry,)
+                known.append(normalized)
+                added.append(normalized)
+        return added
+
+    def remove_terms(self, group: str, terms: Iterable[str]) -> List[str]:
+        """Remove terms from a group; returns the terms that were removed"""
+        removed = []
+        with self._lock:
+            known = self._vocabularies.get(group, [])
+            for term in terms:
+                words = tuple(term.lower().split())
+                normalized = " ".join(words)
+                if normalized not in known:
+                    continue
+                for form in self._forms(words):
+                    bucket = tuple(
+                        entry for entry in self._index.get(form, ())
+                        if not (entry[1] == group and entry[2] == normalized)
+                    )
+                    if bucket:
+                        self._index[form] = bucket
+                    else:
+                        self._index.pop(form, None)
+                known.remove(normalized)
+                removed.append(normalized)
+        return removed
+
+    def vocabularies(self) -> Dict[str, List[str]]:
+        """Get a copy of every group's terms"""
+        with self._lock:
+            return {group: list(terms) for group, terms in self._vocabularies.items()}
+
+    def match(self, tokens: List[str]) -> Dict[str, Set[str]]:
+        """Get the distinct terms of each group that occur in ``tokens``"""
+        index = self._index
+        hits: Dict[str, Set[str]] = {}
+        total = len(tokens)
+
+        for position, token in enumerate(tokens):
+            entries = index.get(token)
+            if entries is None:
+                continue
+            # "un-friendly" is tokenized as "un", "friendly"
+            if position and tokens[position - 1] in _NEGATING_TOKENS:
+                continue
+            for tail, group, term in entries:
+                if tail:
+                    end = position + 1 + len(tail)
+                    if end > total or tuple(tokens[position + 1:end]) != tail:
+                        continue
+                hits.setdefault(group, set()).add(term)
+
+        return hits
@@ -0,0 +1,271 @@
+"""Language-specific lexicon scorers, loaded on demand under a memory cap.
+
+English keeps the VADER + TextBlob pipeline. Other languages are scored by a
+``LexiconScorer`` built from ``<lexicon_dir>/<code>.json``::
+
+    {
+      "language": "hi",
+      "name": "Hindi",
+      "lexicon": {"अच्छा": 2.0, "खराब": -2.5, ...},   # VADER scale, -4 .. 4
+      "negations": ["नहीं", ...],
+      "boosters": {"बहुत": 0.293, ...},
+      "stopwords": ["है", ...],
+      "negation_window_before": 1,
+      "negation_window_after": 2
+    }
+
+Scoring follows VADER's shape: per-word valences, boosters, a negation
+window within the clause (which can look *after* the word, since Hindi and
+Bengali put the negation after the adjective) and the same compound
+normalization.
+
+``LanguageRegistry`` loads a scorer the first time its language is used and
+keeps loaded scorers in LRU order; when their estimated size exceeds
+``max_bytes`` the least recently used ones are dropped and reload on demand.
+"""
+import json
+import math
+import os
+import re
+import string
+import sys
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_LEXICON_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "lexicons")
+
+# VADER's negation scalar and compound normalization constant
+NEGATION_SCALAR = -0.74
+_ALPHA = 15
+
+# Punctuation stripped from token edges, including the Devanagari danda
+_PUNCTUATION = string.punctuation + "।॥…“”‘’«»"
+
+# Negation and booster scopes do not cross these clause boundaries
+_CLAUSE_BOUNDARY = re.compile(r"[,;:!?.।॥]+")
+
+# Names and regional codes mapped to the language codes lexicons are keyed by
+LANGUAGE_ALIASES = {
+    "english": "en", "hindi": "hi", "bengali": "bn", "bangla": "bn",
+    "santhali": "sat", "santali": "sat"
+}
+
+# Base language codes (ISO 639-1/639-3); anything else never reaches the lexicon directory
+_LANGUAGE_CODE = re.compile(r"[a-z]{2,3}")
+
+# Unicode script ranges used to guess the language of ``language="auto"`` texts
+_SCRIPTS = (
+    (0x1C50, 0x1C7F, "sat"),  # Ol Chiki
+    (0x0980, 0x09FF, "bn"),   # Bengali
+    (0x0900, 0x097F, "hi")    # Devanagari
+)
+
+
+def normalize_language(language: Optional[str]) -> str:
+    """Lower-cased base language code ("hi-IN" -> "hi", "Bengali" -> "bn"); raises ValueError for other values"""
+    code = (language or "en").strip().lower().replace("_", "-").split("-")[0]
+    code = LANGUAGE_ALIASES.get(code, code) or "en"
+    if code != "auto" and not _LANGUAGE_CODE.fullmatch(code):
+        raise ValueError(f"Invalid language code: {str(language)[:32]!r}")
+    return code
+
+
+def detect_script_language(text: str) -> str:
+    """Guess a language from the first non-Latin script found in the text"""
+    for char in text:
+        point = ord(char)
+        if point < 0x0900:
+            continue
+        for low, high, language in _SCRIPTS:
+            if low <= point <= high:
+                return language
+    return "en"
+
+
+def _normalize(word: str) -> str:
+    return unicodedata.normalize("NFC", word.lower())
+
+
+class LexiconScorer:
+    """VADER-style lexicon scorer for one language"""
+
+    def __init__(self, language: str, lexicon: Dict[str, float], negations: List[str] = (),
+                 boosters: Dict[str, float] = None, stopwords: List[str] = (),
+                 negation_window_before: int = 3, negation_window_after: int = 0,
+                 name: Optional[str] = None):
+        self.language = language
+        self.name = name or language
+        self.lexicon = {_normalize(word): float(valence) for word, valence in lexicon.items()}
+        self.negations = frozenset(_normalize(word) for word in negations)
+        self.boosters = {_normalize(word): float(value) for word, value in (boosters or {}).items()}
+        self.stopwords = frozenset(_normalize(word) for word in stopwords)
+        self.negation_window_before = negation_window_before
+        self.negation_window_after = negation_window_after
+
+    @classmethod
+    def from_file(cls, path: str) -> "LexiconScorer":
+        """Build a scorer from a lexicon JSON file"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        language = data.get("language") or os.path.splitext(os.path.basename(path))[0]
+        return cls(
+            language,
+            data["lexicon"],
+            data.get("negations", []),
+            data.get("boosters", {}),
+            data.get("stopwords", []),
+            data.get("negation_window_before", 3),
+            data.get("negation_window_after", 0),
+            data.get("name")
+        )
+
+    def tokens(self, text: str) -> List[str]:
+        """Whitespace tokens with edge punctuation removed, NFC-normalized"""
+        words = (token.strip(_PUNCTUATION) for token in text.split())
+        return [_normalize(word) for word in words if word]
+
+    def polarity_scores(self, text: str) -> Dict[str, float]:
+        """Get VADER-shaped ``neg``/``neu``/``pos``/``compound`` scores"""
+        sentiments = []
+        token_count = 0
+        for clause in _CLAUSE_BOUNDARY.split(text):
+            tokens = self.tokens(clause)
+            token_count += len(tokens)
+            for i, token in enumerate(tokens):
+                valence = self.lexicon.get(token)
+                if valence is None:
+                    continue
+                if i and tokens[i - 1] in self.boosters:
+                    valence += math.copysign(self.boosters[tokens[i - 1]], valence)
+                window = (tokens[max(0, i - self.negation_window_before):i]
+                          + tokens[i + 1:i + 1 + self.negation_window_after])
+                if any(word in self.negations for word in window):
+                    valence *= NEGATION_SCALAR
+                sentiments.append(valence)
+
+        total = sum(sentiments)
+        compound = total / math.sqrt(total * total + _ALPHA) if sentiments else 0.0
+        positive = sum(value + 1 for value in sentiments if value > 0)
+        negative = sum(abs(value - 1) for value in sentiments if value < 0)
+        neutral = token_count - len(sentiments) + sum(1 for value in sentiments if value == 0)
+        scale = positive + negative + neutral
+        return {
+            "neg": round(negative / scale, 3) if scale else 0.0,
+            "neu": round(neutral / scale, 3) if scale else 0.0,
+            "pos": round(positive / scale, 3) if scale else 0.0,
+            "compound": round(max(-1.0, min(1.0, compound)), 4)
+        }
+
+    def keywords(self, text: str, num_keywords: int = 10) -> List[str]:
+        """Most frequent non-stop-word tokens, in first-seen order on ties"""
+        counts: Dict[str, int] = {}
+        for token in self.tokens(text):
+            if len(token) >= 2 and token not in self.stopwords and not token.isdigit():
+                counts[token] = counts.get(token, 0) + 1
+        return sorted(counts, key=lambda word: counts[word], reverse=True)[:num_keywords]
+
+    def memory_bytes(self) -> int:
+        """Approximate size of the scorer's word tables"""
+        size = sys.getsizeof(self.lexicon) + sum(
+            sys.getsizeof(word) + sys.getsizeof(valence) for word, valence in self.lexicon.items()
+        )
+        for words in (self.negations, self.stopwords, self.boosters):
+            size += sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+        return size
+
+
+class LanguageRegistry:
+    """Lazily loaded per-language scorers kept under a memory cap"""
+
+    def __init__(self, lexicon_dir: str = DEFAULT_LEXICON_DIR, max_bytes: int = 64 * 1024 * 1024):
+        self.lexicon_dir = lexicon_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._loaders: Dict[str, Callable[[], LexiconScorer]] = {}
+        self._loaded: "OrderedDict[str, LexiconScorer]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        # Lexicon files found in lexicon_dir, listed once on first use
+        self._files: Optional[Dict[str, str]] = None
+        self._counts = {"loads": 0, "evictions": 0, "hits": 0, "unsupported": 0}
+        self.requests: Dict[str, int] = {}
+
+    def register(self, language: str, loader: Callable[[], LexiconScorer]):
+        """Add (or replace) the loader of a language"""
+        language = normalize_language(language)
+        with self._lock:
+            self._loaders[language] = loader
+            self._unload(language)
+
+    def available(self) -> List[str]:
+        """Languages with a registered loader or a lexicon file"""
+        return sorted(set(self._loaders) | set(self._lexicon_files()))
+
+    def _lexicon_files(self) -> Dict[str, str]:
+        """Language code -> file name of the lexicons in ``lexicon_dir``"""
+        files = self._files
+        if files is None:
+            files = {}
+            if os.path.isdir(self.lexicon_dir):
+                for name in os.listdir(self.lexicon_dir):
+                    code, extension = os.path.splitext(name)
+                    if extension == ".json" and _LANGUAGE_CODE.fullmatch(code):
+                        files[code] = name
+            self._files = files
+        return files
+
+    def refresh(self):
+        """Rescan the lexicon directory, e.g. after adding a lexicon file"""
+        self._files = None
+
+    def resolve(self, language: Optional[str], text: str = "") -> str:
+        """Normalize a language code, guessing it from the script for "auto\""""
+        code = normalize_language(language)
+        return detect_script_language(text) if code == "auto" else code
+
+    def get(self, language: str) -> Optional[LexiconScorer]:
+        """Get a language's scorer, loading it (and evicting others) if needed"""
+        language = normalize_language(language)
+        with self._lock:
+            scorer = self._loaded.get(language)
+            if scorer is not None:
+                self.requests[language] += 1
+                self._loaded.move_to_end(language)
+                self._counts["hits"] += 1
+                return scorer
+
+            # Only registered languages and files listed in the lexicon directory are loaded
+            loader = self._loaders.get(language)
+            file_name = self._lexicon_files().get(language) if loader is None else None
+            if loader is None and file_name is None:
+                self._counts["unsupported"] += 1
+                return None
+            self.requests[language] = self.requests.get(language, 0) + 1
+            scorer = loader() if loader is not None else LexiconScorer.from_file(
+                os.path.join(self.lexicon_dir, file_name)
+            )
+            self._loaded[language] = scorer
+            self._sizes[language] = scorer.memory_bytes()
+            self._counts["loads"] += 1
+            # Evict least recently used scorers, but always keep the one just loaded
+            while sum(self._sizes.values()) > self.max_bytes and len(self._loaded) > 1:
+                self._unload(next(iter(self._loaded)))
+                self._counts["evictions"] += 1
+            return scorer
+
+    def _unload(self, language: str):
+        self._loaded.pop(language, None)
+        self._sizes.pop(language, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get loaded scorers, their sizes and load/eviction counters"""
+        with self._lock:
+            return {
+                "available": self.available(),
+                "loaded": {language: self._sizes[language] for language in self._loaded},
+                "loaded_bytes": sum(self._sizes.values()),
+                "max_bytes": self.max_bytes,
+                "requests": dict(self.requests),
+                **self._counts
+            }
@@ -0,0 +1,144 @@
+"""Append-only block store of the local chain simulator used in mock mode.
+
+Blocks are chained by hash: each block commits to its parent's hash, its
+number, timestamp, miner, gas used and the Merkle root of its transaction
+hashes. The same transactions appended with the same clock always produce
+the same blocks, so runs are reproducible when the clock is fixed.
+"""
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .merkle import merkle_root
+
+GENESIS_PARENT = "0x" + "0" * 64
+
+# Clique-style proof of authority: every in-turn block has difficulty 2
+BLOCK_DIFFICULTY = 2
+
+
+def _block_hash(header: Dict[str, Any]) -> str:
+    return "0x" + hashlib.sha256(json.dumps(header, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class LocalChain:
+    """Hash-linked, append-only block store with transaction lookup by hash"""
+
+    def __init__(self, chain_id: int = 1337, start_block: int = 0, gas_limit: int = 30000000,
+                 miner: str = "0x" + "0" * 39 + "1", clock: Callable[[], float] = time.time,
+                 genesis_time: Optional[float] = None):
+        self.chain_id = chain_id
+        self.gas_limit = gas_limit
+        self.miner = miner
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.blocks: List[Dict[str, Any]] = []
+        # transaction hash -> (block index, position in block)
+        self._locations: Dict[str, Tuple[int, int]] = {}
+        self._transactions: List[List[Dict[str, Any]]] = []
+        self.first_block = start_block
+        self.append_block([], genesis_time)
+
+    @property
+    def height(self) -> int:
+        return self.blocks[-1]["number"]
+
+    @property
+    def latest(self) -> Dict[str, Any]:
+        return self.blocks[-1]
+
+    def append_block(self, transactions: List[Dict[str, Any]], timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """Seal transactions into the next block; each gets its block number, hash and index"""
+        with self._lock:
+            parent = self.blocks[-1] if self.blocks else None
+            number = parent["number"] + 1 if parent else self.first_block
+            now = self.clock() if timestamp is None else timestamp
+            if parent is not None:
+                # Block times never go backwards
+                now = max(now, parent["_time"])
+            header = {
+                "number": number,
+                "parent_hash": parent["hash"] if parent else GENESIS_PARENT,
+                "timestamp": datetime.utcfromtimestamp(now).isoformat(),
+                "merkle_root": merkle_root(tx["hash"].encode("utf-8") for tx in transactions),
+                "gas_used": sum(tx.get("gas", 0) for tx in transactions),
+                "gas_limit": self.gas_limit,
+                "miner": self.miner,
+                "chain_id": self.chain_id
+            }
+            block = dict(
+                header,
+                hash=_block_hash(header),
+                transaction_count=len(transactions),
+                fill_ratio=round(header["gas_used"] / self.gas_limit, 4) if self.gas_limit else 0.0,
+                transactions=[tx["hash"] for tx in transactions],
+                difficulty=BLOCK_DIFFICULTY,
+                total_difficulty=str(BLOCK_DIFFICULTY * (number - self.first_block + 1)),
+                _time=now
+            )
+            index = len(self.blocks)
+            for position, tx in enumerate(transactions):
+                tx["block_number"] = number
+                tx["block_hash"] = block["hash"]
+                tx["transaction_index"] = position
+                self._locations[tx["hash"]] = (index, position)
+            self.blocks.append(block)
+            self._transactions.append(transactions)
+            return block
+
+    def get_block(self, number: int, full: bool = False) -> Optional[Dict[str, Any]]:
+        """Get a block by number; ``full`` includes its transaction hashes"""
+        index = number - self.first_block
+        if not 0 <= index < len(self.blocks):
+            return None
+        return _public(self.blocks[index], full)
+
+    def recent_blocks(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the newest blocks, newest first"""
+        return [_public(block, False) for block in reversed(self.blocks[-max(0, limit):])] if limit > 0 else []
+
+    def block_transactions(self, number: int) -> List[Dict[str, Any]]:
+        """Get the transactions sealed in a block"""
+        index = number - self.first_block
+        return list(self._transactions[index]) if 0 <= index < len(self.blocks) else []
+
+    def get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Get a sealed transaction by hash"""
+        location = self._locations.get(tx_hash)
+        if location is None:
+            return None
+        return self._transactions[location[0]][location[1]]
+
+    def verify(self) -> bool:
+        """Check every block's hash, parent link and Merkle root"""
+        parent_hash = GENESIS_PARENT
+        for block, transactions in zip(self.blocks, self._transactions):
+            header = {key: block[key] for key in ("number", "parent_hash", "timestamp", "merkle_root",
+                                                  "gas_used", "gas_limit", "miner", "chain_id")}
+            if (block["parent_hash"] != parent_hash or _block_hash(header) != block["hash"]
+                    or merkle_root(tx["hash"].encode("utf-8") for tx in transactions) != block["merkle_root"]):
+                return False
+            parent_hash = block["hash"]
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get chain height, size and average block time"""
+        span = self.blocks[-1]["_time"] - self.blocks[0]["_time"]
+        return {
+            "chain_id": self.chain_id,
+            "height": self.height,
+            "blocks": len(self.blocks),
+            "transactions": len(self._locations),
+            "latest_hash": self.latest["hash"],
+            "average_block_seconds": round(span / (len(self.blocks) - 1), 3) if len(self.blocks) > 1 else 0.0
+        }
+
+
+def _public(block: Dict[str, Any], full: bool) -> Dict[str, Any]:
+    return {
+        key: value for key, value in block.items()
+        if not key.startswith("_") and (full or key != "transactions")
+    }
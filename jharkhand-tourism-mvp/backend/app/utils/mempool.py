@@ -0,0 +1,155 @@
+"""Priority mempool for the local chain simulator.
+
+Pending transactions sit in a binary heap keyed by (-gas_price, arrival
+sequence): the best-paying transaction comes out first and equal prices come
+out in arrival order. Insert and pop are O(log n). Removals are lazy: a
+removed entry stays in the heap and is skipped when it surfaces, and the
+heap is rebuilt once such dead entries outnumber the live ones. A second,
+arrival-ordered queue finds stale transactions without scanning the heap.
+"""
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Gas of a plain transfer; a block with less room left than this is full
+MIN_TRANSACTION_GAS = 21000
+
+# Transactions set aside for not fitting before a block is considered full
+MAX_SKIPPED = 64
+
+
+class Mempool:
+    """Pending transactions ordered by gas price, then arrival"""
+
+    def __init__(self, max_size: int = 10000, max_age_seconds: float = 3600,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_size = max(1, max_size)
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock
+        self._heap: List[Tuple[int, int, str]] = []
+        # hash -> (transaction, arrival time)
+        self._entries: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._arrivals: deque = deque()
+        self._sequence = itertools.count()
+        self.max_depth = 0
+        self.counts = {"added": 0, "included": 0, "evicted": 0, "rejected": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tx_hash: str) -> bool:
+        return tx_hash in self._entries
+
+    def get(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(tx_hash)
+        return entry[0] if entry is not None else None
+
+    def arrival(self, tx_hash: str) -> Optional[float]:
+        entry = self._entries.get(tx_hash)
+        return entry[1] if entry is not None else None
+
+    def add(self, transaction: Dict[str, Any]):
+        """Queue a transaction; raises RuntimeError when the pool is full"""
+        if len(self._entries) >= self.max_size:
+            self.counts["rejected"] += 1
+            raise RuntimeError(f"Mempool is full ({self.max_size} pending transactions)")
+        tx_hash = transaction["hash"]
+        now = self.clock()
+        self._entries[tx_hash] = (transaction, now)
+        heapq.heappush(self._heap, (-transaction.get("gas_price", 0), next(self._sequence), tx_hash))
+        self._arrivals.append((now, tx_hash))
+        self.counts["added"] += 1
+        self.max_depth = max(self.max_depth, len(self._entries))
+
+    def remove(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Drop a transaction from the pool (its heap entry is discarded lazily)"""
+        entry = self._entries.pop(tx_hash, None)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+        return entry[0] if entry is not None else None
+
+    def _compact(self):
+        self._heap = [item for item in self._heap if item[2] in self._entries]
+        heapq.heapify(self._heap)
+        self._arrivals = deque(item for item in self._arrivals if item[1] in self._entries)
+
+    def pop(self) -> Optional[Dict[str, Any]]:
+        """Remove and return the highest-priority transaction"""
+        while self._heap:
+            _, _, tx_hash = heapq.heappop(self._heap)
+            entry = self._entries.pop(tx_hash, None)
+            if entry is not None:
+                return entry[0]
+        return None
+
+    def build_block(self, gas_limit: int,
+                    max_transactions: Optional[int] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Take the best-paying transactions that fit in ``gas_limit`` gas, with their arrival times.
+
+        Transactions are taken in priority order; one that does not fit in
+        the gas left is set aside (and returned to the pool afterwards) so
+        smaller ones behind it can still fill the block.
+        """
+        block, skipped = [], []
+        remaining = gas_limit
+        while (remaining >= MIN_TRANSACTION_GAS and len(skipped) < MAX_SKIPPED
+               and (max_transactions is None or len(block) < max_transactions)):
+            item = self._pop_item()
+            if item is None:
+                break
+            transaction, arrival, sequence = item
+            if transaction.get("gas", 0) <= remaining:
+                block.append((transaction, arrival))
+                remaining -= transaction.get("gas", 0)
+            else:
+                skipped.append(item)
+        for transaction, arrival, sequence in skipped:
+            # Back in with its original arrival sequence, so it keeps its place
+            self._entries[transaction["hash"]] = (transaction, arrival)
+            heapq.heappush(self._heap, (-transaction.get("gas_price", 0), sequence, transaction["hash"]))
+        self.counts["included"] += len(block)
+        return block
+
+    def _pop_item(self) -> Optional[Tuple[Dict[str, Any], float, int]]:
+        while self._heap:
+            _, sequence, tx_hash = heapq.heappop(self._heap)
+            entry = self._entries.pop(tx_hash, None)
+            if entry is not None:
+                return entry[0], entry[1], sequence
+        return None
+
+    def evict_stale(self) -> List[Dict[str, Any]]:
+        """Drop transactions that waited longer than ``max_age_seconds``; returns them"""
+        cutoff = self.clock() - self.max_age_seconds
+        evicted = []
+        self._trim_arrivals()
+        while self._arrivals and self._arrivals[0][0] <= cutoff:
+            _, tx_hash = self._arrivals.popleft()
+            evicted.append(self.remove(tx_hash))
+            self._trim_arrivals()
+        self.counts["evicted"] += len(evicted)
+        return evicted
+
+    def _trim_arrivals(self):
+        """Drop leading arrival records of transactions that already left the pool"""
+        while self._arrivals:
+            arrival, tx_hash = self._arrivals[0]
+            entry = self._entries.get(tx_hash)
+            if entry is not None and entry[1] == arrival:
+                return
+            self._arrivals.popleft()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get depth, counters and the age of the oldest pending transaction"""
+        self._trim_arrivals()
+        oldest = self._arrivals[0][0] if self._arrivals else None
+        return {
+            "depth": len(self._entries),
+            "max_depth": self.max_depth,
+            "max_size": self.max_size,
+            "oldest_pending_seconds": round(self.clock() - oldest, 3) if oldest is not None else 0.0,
+            "max_age_seconds": self.max_age_seconds,
+            **self.counts
+        }
@@ -0,0 +1,78 @@
+"""Merkle trees over SHA-256.
+
+Leaves and inner nodes are hashed with different prefixes (0x00 and 0x01,
+as in RFC 6962), so a leaf can never be passed off as an inner node. A node
+without a sibling is carried up to the next level unchanged.
+
+An inclusion proof lists the sibling hashes on the path from one leaf to
+the root, so a single leaf can be checked against the root alone.
+"""
+import hashlib
+from typing import Any, Dict, Iterable, List
+
+# Root of a tree with no leaves
+EMPTY_ROOT = "0x" + hashlib.sha256(b"").hexdigest()
+
+
+def leaf_hash(data: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _next_level(level: List[bytes]) -> List[bytes]:
+    return [
+        node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+        for i in range(0, len(level), 2)
+    ]
+
+
+def merkle_root(leaves: Iterable[bytes]) -> str:
+    """Hex (0x-prefixed) Merkle root of raw leaf values"""
+    level = [leaf_hash(leaf) for leaf in leaves]
+    if not level:
+        return EMPTY_ROOT
+    while len(level) > 1:
+        level = _next_level(level)
+    return "0x" + level[0].hex()
+
+
+def merkle_levels(leaves: Iterable[bytes]) -> List[List[bytes]]:
+    """Every level of the tree, leaf hashes first and the root last (for building many proofs)"""
+    levels = [[leaf_hash(leaf) for leaf in leaves]]
+    while len(levels[-1]) > 1:
+        levels.append(_next_level(levels[-1]))
+    return levels
+
+
+def merkle_proof(levels: List[List[bytes]], index: int) -> List[Dict[str, Any]]:
+    """Sibling hashes from leaf ``index`` up to the root, each with the side it joins on"""
+    if not levels or not 0 <= index < len(levels[0]):
+        raise ValueError(f"Leaf index {index} out of range")
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        # A node without a sibling is carried up and adds no step
+        if sibling < len(level):
+            proof.append({"position": "left" if sibling < index else "right", "hash": "0x" + level[sibling].hex()})
+        index //= 2
+    return proof
+
+
+def verify_proof(leaf: bytes, proof: List[Dict[str, Any]], root: str) -> bool:
+    """Check that a raw leaf value is in the tree with the given hex root"""
+    try:
+        node = leaf_hash(leaf)
+        for step in proof:
+            sibling = bytes.fromhex(step["hash"][2:] if step["hash"].startswith("0x") else step["hash"])
+            if step["position"] == "left":
+                node = node_hash(sibling, node)
+            elif step["position"] == "right":
+                node = node_hash(node, sibling)
+            else:
+                return False
+    except (KeyError, TypeError, AttributeError, ValueError):
+        return False
+    return "0x" + node.hex() == root.lower()
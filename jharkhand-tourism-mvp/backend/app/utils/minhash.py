@@ -0,0 +1,162 @@
+"""MinHash / LSH index for finding near-duplicate feedback comments.
+
+Each comment is reduced to a set of word shingles and summarized by a MinHash
+signature, whose agreement rate with another signature estimates the Jaccard
+similarity of the two shingle sets. Signatures are split into bands and each
+band is hashed into a bucket table, so a lookup only compares against the
+comments that share at least one bucket instead of the whole corpus.
+"""
+import re
+import sys
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Universal hashing modulus (a Mersenne prime small enough that a * h fits in 64 bits)
+_PRIME = (1 << 31) - 1
+
+
+def shingles(text: str, size: int = 3) -> List[str]:
+    """Word ``size``-grams of a normalized text (the text itself when shorter)"""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Pick (bands, rows) whose LSH threshold (1/b)^(1/r) sits just below ``threshold``"""
+    best, best_distance = (num_perm, 1), float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        distance = threshold - (1 / bands) ** (1 / rows)
+        # Prefer candidates slightly below the threshold: misses cost more than checks
+        if 0 <= distance < best_distance:
+            best, best_distance = (bands, rows), distance
+    return best
+
+
+class MinHashLSH:
+    """Near-duplicate index over texts with a configurable Jaccard threshold.
+
+    ``add`` returns the closest earlier document at or above ``threshold``
+    (if any) and puts the new document into that document's cluster, so
+    every cluster is represented by the first document seen.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, shingle_size: int = 3,
+                 seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        self._signatures: Dict[Any, np.ndarray] = {}
+        self._tables: List[Dict[int, List[Any]]] = [{} for _ in range(self.bands)]
+        self._cluster_of: Dict[Any, Any] = {}
+        self.clusters: Dict[Any, List[Any]] = {}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of a text, or None when it has no words"""
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) & _PRIME for gram in set(grams)), dtype=np.uint64
+        )
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[int]:
+        # Hashed band values keep the tables small; collisions only add candidates
+        return [hash(signature[i * self.rows:(i + 1) * self.rows].tobytes()) for i in range(self.bands)]
+
+    def query(self, text: str) -> Optional[Tuple[Any, float]]:
+        """Find the most similar indexed document at or above the threshold"""
+        signature = self.signature(text)
+        if signature is None:
+            return None
+        with self._lock:
+            return self._best_match(signature)
+
+    def _best_match(self, signature: np.ndarray) -> Optional[Tuple[Any, float]]:
+        candidates = set()
+        for table, key in zip(self._tables, self._band_keys(signature)):
+            candidates.update(table.get(key, ()))
+
+        best = None
+        for doc_id in candidates:
+            similarity = float(np.mean(self._signatures[doc_id] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (doc_id, similarity)
+        return best
+
+    def add(self, doc_id: Any, text: str) -> Optional[Tuple[Any, float]]:
+        """Index a document; returns ``(representative_id, similarity)`` of its duplicate cluster"""
+        signature = self.signature(text)
+        if signature is None:
+            return None
+        with self._lock:
+            match = self._best_match(signature)
+            self._signatures[doc_id] = signature
+            for table, key in zip(self._tables, self._band_keys(signature)):
+                table.setdefault(key, []).append(doc_id)
+
+            if match is None:
+                self._cluster_of[doc_id] = doc_id
+                return None
+            representative = self._cluster_of[match[0]]
+            self._cluster_of[doc_id] = representative
+            self.clusters.setdefault(representative, [representative]).append(doc_id)
+            return representative, match[1]
+
+    def representative(self, doc_id: Any) -> Any:
+        """Get the first document of a document's duplicate cluster"""
+        return self._cluster_of.get(doc_id, doc_id)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Approximate bytes held by signatures, band tables and cluster maps"""
+        signatures = sum(signature.nbytes for signature in self._signatures.values())
+        signatures += sys.getsizeof(self._signatures)
+        tables = sum(
+            sys.getsizeof(table) + sum(sys.getsizeof(key) + sys.getsizeof(ids) for key, ids in table.items())
+            for table in self._tables
+        )
+        clusters = sys.getsizeof(self._cluster_of) + sum(
+            sys.getsizeof(members) for members in self.clusters.values()
+        ) + sys.getsizeof(self.clusters)
+        return {
+            "signatures_bytes": signatures,
+            "band_tables_bytes": tables,
+            "clusters_bytes": clusters,
+            "total_bytes": signatures + tables + clusters
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size, LSH parameters, duplicate counts and memory use"""
+        with self._lock:
+            duplicates = sum(len(members) - 1 for members in self.clusters.values())
+            return {
+                "documents": len(self._signatures),
+                "duplicate_clusters": len(self.clusters),
+                "duplicates": duplicates,
+                "threshold": self.threshold,
+                "num_perm": self.num_perm,
+                "bands": self.bands,
+                "rows": self.rows,
+                "memory": self.memory_usage()
+            }
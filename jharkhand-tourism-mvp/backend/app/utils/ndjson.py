@@ -0,0 +1,62 @@
+"""Helpers for newline-delimited JSON (NDJSON) streams."""
+import json
+import tempfile
+from typing import Any, AsyncIterable, BinaryIO, Iterator, Tuple
+
+# Longest accepted line; longer lines are reported as errors and skipped
+MAX_LINE_BYTES = 1024 * 1024
+
+# Request bodies larger than this are spooled to a temporary file on disk
+SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+
+async def spool_stream(chunks: AsyncIterable[bytes],
+                       max_memory_bytes: int = SPOOL_MEMORY_BYTES) -> BinaryIO:
+    """Copy a byte stream into a temporary file, rewound for reading.
+
+    Small bodies stay in memory; larger ones roll over to disk, so the size of
+    an upload never dictates the memory footprint of the process.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)
+    try:
+        async for chunk in chunks:
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def iter_ndjson(file: BinaryIO, max_line_bytes: int = MAX_LINE_BYTES) -> Iterator[Tuple[int, Any, str]]:
+    """Yield ``(line_number, value, error)`` for each non-blank line of a file.
+
+    ``value`` is the decoded JSON (None when ``error`` is set). Lines are read
+    one at a time and never more than ``max_line_bytes`` are held in memory.
+    """
+    line_number = 0
+    while True:
+        line = file.readline(max_line_bytes + 1)
+        if not line:
+            return
+        line_number += 1
+
+        if len(line) > max_line_bytes and not line.endswith(b"\n"):
+            # Discard the rest of the oversized line
+            while line and not line.endswith(b"\n"):
+                line = file.readline(max_line_bytes)
+            yield line_number, None, f"line exceeds {max_line_bytes} bytes"
+        elif line.strip():
+            yield (line_number, *_decode(line))
+
+
+def _decode(line: bytes) -> Tuple[Any, str]:
+    try:
+        return json.loads(line), ""
+    except ValueError as e:
+        return None, f"invalid JSON: {e}"
+
+
+def dump_line(value: Any) -> str:
+    """Serialize one NDJSON line"""
+    return json.dumps(value, default=str, ensure_ascii=False) + "\n"
@@ -0,0 +1,138 @@
+"""Lazy, offline loading of the NLP lexicons used for sentiment analysis.
+
+Nothing is downloaded at runtime. The VADER lexicon is resolved from the
+bundled data directory (``app/data/nltk_data``, or ``SENTIMENT_NLTK_DATA``)
+before NLTK's usual search path; the TextBlob lexicon ships with TextBlob.
+Both are loaded on first use or by an explicit ``warmup()``, and the time
+each load took is recorded.
+
+``preload()`` is for the preload-then-fork setup: the parent loads the
+lexicons once and freezes them, and forked workers read the parent's copy
+instead of building their own.
+"""
+import gc
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import nltk
+from nltk.sentiment import SentimentIntensityAnalyzer
+from textblob.en import sentiment as pattern_sentiment
+
+BUNDLED_NLTK_DATA = os.getenv(
+    "SENTIMENT_NLTK_DATA",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "nltk_data")
+)
+
+VADER_LEXICON = "sentiment/vader_lexicon.zip"
+
+# Sample review scored during warmup so every lazy structure is built
+WARMUP_TEXT = "The tour guide was friendly and the waterfalls were beautiful, but the bus was late."
+
+if BUNDLED_NLTK_DATA not in nltk.data.path:
+    nltk.data.path.insert(0, BUNDLED_NLTK_DATA)
+
+
+def resolve_vader_lexicon() -> str:
+    """Find the VADER lexicon on disk without touching the network"""
+    try:
+        return str(nltk.data.find(VADER_LEXICON))
+    except LookupError:
+        raise LookupError(
+            f"VADER lexicon not found in {BUNDLED_NLTK_DATA} or the NLTK data path; "
+            f"bundle it with: python -m nltk.downloader -d {BUNDLED_NLTK_DATA} vader_lexicon"
+        ) from None
+
+
+def compact_lexicon(lexicon: Dict[str, float]) -> int:
+    """Make equal valences share one float object; returns the distinct value count.
+
+    VADER's ~7,500 valences take only ~70 distinct values. Sharing them keeps
+    the lexicon smaller, and it means reads in forked workers only touch the
+    reference counts of those few objects instead of pages all over the
+    lexicon, so its pages stay shared with the parent.
+    """
+    shared: Dict[float, float] = {}
+    for word, valence in lexicon.items():
+        lexicon[word] = shared.setdefault(valence, valence)
+    return len(shared)
+
+
+class NLPModels:
+    """Loads VADER and the TextBlob lexicon once, on first use or at warmup"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._vader: Optional[SentimentIntensityAnalyzer] = None
+        self._pattern_loaded = False
+        self.load_times: Dict[str, float] = {}
+        self.warmed_up = False
+        self.preloaded = False
+        self.error: Optional[str] = None
+
+    @property
+    def vader(self) -> SentimentIntensityAnalyzer:
+        """The VADER analyzer, loaded on first access"""
+        if self._vader is None:
+            with self._lock:
+                if self._vader is None:
+                    start = time.perf_counter()
+                    resolve_vader_lexicon()
+                    self._vader = SentimentIntensityAnalyzer()
+                    self.load_times["vader"] = time.perf_counter() - start
+        return self._vader
+
+    def load_pattern(self):
+        """Load TextBlob's sentiment lexicon (it is otherwise read on first score)"""
+        if not self._pattern_loaded:
+            with self._lock:
+                if not self._pattern_loaded:
+                    start = time.perf_counter()
+                    len(pattern_sentiment)  # Forces the lazy lexicon to load
+                    self._pattern_loaded = True
+                    self.load_times["textblob"] = time.perf_counter() - start
+
+    def warmup(self, analyze=None) -> Dict[str, Any]:
+        """Load every model and optionally run ``analyze(WARMUP_TEXT)`` once.
+
+        Errors are recorded rather than raised so that a missing lexicon
+        shows up in the status instead of crashing the caller.
+        """
+        start = time.perf_counter()
+        try:
+            self.vader
+            self.load_pattern()
+            if analyze is not None:
+                analyze(WARMUP_TEXT)
+            self.error = None
+            self.warmed_up = True
+        except Exception as e:
+            self.error = str(e)
+        self.load_times["warmup"] = time.perf_counter() - start
+        return self.get_status()
+
+    def preload(self, analyze=None) -> Dict[str, Any]:
+        """Warm up, compact the lexicons and freeze them before worker processes fork.
+
+        ``gc.freeze()`` moves everything allocated so far out of the collector's
+        reach, so garbage collection in a forked child does not write to (and
+        privately copy) the pages holding the parent's lexicons.
+        """
+        status = self.warmup(analyze)
+        if self.warmed_up and not self.preloaded:
+            compact_lexicon(self.vader.lexicon)
+            gc.freeze()
+            self.preloaded = True
+            status = self.get_status()
+        return status
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get readiness and per-model load times in milliseconds"""
+        return {
+            "ready": self.warmed_up,
+            "preloaded": self.preloaded,
+            "loaded": {"vader": self._vader is not None, "textblob": self._pattern_loaded},
+            "load_times_ms": {name: round(seconds * 1000, 1) for name, seconds in self.load_times.items()},
+            "error": self.error
+        }
@@ -0,0 +1,43 @@
+"""Per-process memory figures for the API process and its pool workers.
+
+RSS counts every resident page, including pages shared copy-on-write with
+the parent, so it overstates what each forked worker really costs. On Linux
+``/proc/<pid>/smaps_rollup`` also gives PSS (shared pages split between the
+processes mapping them) and USS (pages private to the process), which show
+how much memory adding one more worker takes.
+"""
+import os
+import resource
+from typing import Any, Dict, Optional
+
+# smaps_rollup fields reported, in kB
+_FIELDS = {
+    "Rss": "rss_kb",
+    "Pss": "pss_kb",
+    "Shared_Clean": "shared_clean_kb",
+    "Shared_Dirty": "shared_dirty_kb",
+    "Private_Clean": "private_clean_kb",
+    "Private_Dirty": "private_dirty_kb"
+}
+
+
+def process_memory(pid: Optional[int] = None) -> Dict[str, Any]:
+    """Get RSS, PSS and USS of a process (this one by default) in kB"""
+    pid = pid or os.getpid()
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            lines = f.readlines()
+    except OSError:
+        if pid != os.getpid():
+            return {"pid": pid, "error": "memory details unavailable"}
+        # Without /proc only the peak RSS of this process is known
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {"pid": pid, "rss_kb": usage.ru_maxrss, "pss_kb": None, "uss_kb": None}
+
+    memory: Dict[str, Any] = {"pid": pid}
+    for line in lines:
+        name, _, value = line.partition(":")
+        if name in _FIELDS:
+            memory[_FIELDS[name]] = int(value.split()[0])
+    memory["uss_kb"] = memory.get("private_clean_kb", 0) + memory.get("private_dirty_kb", 0)
+    return memory
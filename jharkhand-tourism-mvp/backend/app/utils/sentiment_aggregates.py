@@ -0,0 +1,82 @@
+"""Running sentiment aggregates over the feedback stream.
+
+Every feedback item updates a handful of counters once, when it is added, so
+dashboard reads cost the same whether there are five items or five million.
+"""
+import threading
+from typing import Any, Dict, List
+
+SENTIMENT_LABELS = ("positive", "neutral", "negative")
+
+# Contribution of each label to the overall score (-1 .. 1)
+SENTIMENT_SCORES = {"positive": 1, "neutral": 0, "negative": -1}
+
+
+def _empty_counts() -> Dict[str, Any]:
+    return {"positive": 0, "neutral": 0, "negative": 0, "total": 0, "total_rating": 0}
+
+
+class SentimentAggregates:
+    """Per-sentiment and per-category counters with rating sums"""
+
+    def __init__(self, max_suggestions: int = 10):
+        self._lock = threading.Lock()
+        self.totals = _empty_counts()
+        self.score_sum = 0
+        # Same counters with near-duplicates left out (one item per duplicate cluster)
+        self.unique_totals = _empty_counts()
+        self.unique_score_sum = 0
+        self.categories: Dict[str, Dict[str, Any]] = {}
+        self.max_suggestions = max_suggestions
+        self.suggestions: List[Dict[str, Any]] = []
+
+    def add(self, feedback: Dict[str, Any]):
+        """Count one feedback item in O(1)"""
+        sentiment = feedback.get("sentiment", "neutral")
+        if sentiment not in SENTIMENT_SCORES:
+            sentiment = "neutral"
+        rating = feedback.get("rating", 0) or 0
+
+        with self._lock:
+            for counts in (
+                self.totals,
+                self.categories.setdefault(feedback.get("category", "general"), _empty_counts())
+            ):
+                counts[sentiment] += 1
+                counts["total"] += 1
+                counts["total_rating"] += rating
+            self.score_sum += SENTIMENT_SCORES.get(sentiment, 0)
+            if feedback.get("duplicate_of") is None:
+                self.unique_totals[sentiment] += 1
+                self.unique_totals["total"] += 1
+                self.unique_totals["total_rating"] += rating
+                self.unique_score_sum += SENTIMENT_SCORES.get(sentiment, 0)
+
+    def add_suggestion(self, suggestion: Dict[str, Any]) -> bool:
+        """Keep an improvement suggestion while fewer than ``max_suggestions`` are held"""
+        with self._lock:
+            if len(self.suggestions) >= self.max_suggestions:
+                return False
+            self.suggestions.append(suggestion)
+            return True
+
+    def suggestions_full(self) -> bool:
+        """Whether no more improvement suggestions will be kept"""
+        return len(self.suggestions) >= self.max_suggestions
+
+    def get_totals(self, unique_only: bool = False) -> Dict[str, Any]:
+        """Get a copy of the overall counters and the summed sentiment score"""
+        with self._lock:
+            if unique_only:
+                return dict(self.unique_totals, score_sum=self.unique_score_sum)
+            return dict(self.totals, score_sum=self.score_sum)
+
+    def get_categories(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of every category's counters"""
+        with self._lock:
+            return {category: dict(counts) for category, counts in self.categories.items()}
+
+    def get_suggestions(self) -> List[Dict[str, Any]]:
+        """Get the retained improvement suggestions, oldest first"""
+        with self._lock:
+            return list(self.suggestions)
@@ -0,0 +1,168 @@
+"""Online detection of bursts of negative feedback.
+
+Every feedback item is an observation x = 1 (negative) or 0 (otherwise) for
+its site, its category and its provider. For each of those keys the
+detector keeps, in O(1) per event:
+
+* a slow EWMA of x, the key's usual negative rate (the baseline);
+* a fast EWMA of x, the recent negative rate (reported with alerts);
+* a one-sided CUSUM, S = max(0, S + x - baseline - slack), which grows while
+  negatives arrive faster than usual and decays otherwise.
+
+When S crosses ``threshold`` an alert is raised and S restarts from zero.
+Alerts are kept in a bounded in-memory log and pushed to subscriber queues.
+"""
+import itertools
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional
+
+# Feedback fields the detector tracks, by dimension name
+DIMENSIONS = {"site": "site", "category": "category", "provider": "provider_id"}
+
+
+class SpikeDetector:
+    """EWMA/CUSUM negative-sentiment spike detection per site, category and provider"""
+
+    def __init__(self, threshold: float = 3.0, slack: float = 0.1, fast_alpha: float = 0.2,
+                 slow_alpha: float = 0.02, prior_rate: float = 0.1, min_events: int = 3,
+                 cooldown_seconds: float = 300, max_keys: int = 10000, max_alerts: int = 1000):
+        self.threshold = threshold
+        self.slack = slack
+        self.fast_alpha = fast_alpha
+        self.slow_alpha = slow_alpha
+        self.prior_rate = prior_rate
+        self.min_events = min_events
+        self.cooldown_seconds = cooldown_seconds
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # dimension -> key -> state, least recently updated first
+        self._states: Dict[str, "OrderedDict[str, Dict[str, float]]"] = {
+            dimension: OrderedDict() for dimension in DIMENSIONS
+        }
+        self._alert_ids = itertools.count(1)
+        self.alerts: deque = deque(maxlen=max_alerts)
+        self._subscribers: List[queue.Queue] = []
+        self.events = 0
+        self.alerts_raised = 0
+        self.dropped_alerts = 0
+
+    def observe(self, feedback: Dict[str, Any], now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Update every key of one feedback item; returns the alerts it raised"""
+        now = time.time() if now is None else now
+        negative = 1.0 if feedback.get("sentiment") == "negative" else 0.0
+        raised = []
+        with self._lock:
+            self.events += 1
+            for dimension, field in DIMENSIONS.items():
+                key = feedback.get(field)
+                if key is None or key == "":
+                    continue
+                # Enum members (e.g. FeedbackCategory) are tracked by their value
+                alert = self._update(dimension, str(getattr(key, "value", key)), negative, now)
+                if alert is not None:
+                    alert["feedback_id"] = feedback.get("id")
+                    raised.append(alert)
+            self.alerts_raised += len(raised)
+            for alert in raised:
+                self.alerts.append(alert)
+                self._publish(alert)
+        return raised
+
+    def _update(self, dimension: str, key: str, x: float, now: float) -> Optional[Dict[str, Any]]:
+        states = self._states[dimension]
+        state = states.get(key)
+        if state is None:
+            state = states[key] = {"events": 0, "baseline": self.prior_rate, "recent": self.prior_rate,
+                                   "cusum": 0.0, "last_alert": float("-inf")}
+            if len(states) > self.max_keys:
+                states.popitem(last=False)
+        else:
+            states.move_to_end(key)
+
+        # CUSUM against the baseline as it was before this event
+        state["cusum"] = max(0.0, state["cusum"] + x - state["baseline"] - self.slack)
+        state["recent"] += self.fast_alpha * (x - state["recent"])
+        state["baseline"] += self.slow_alpha * (x - state["baseline"])
+        state["events"] += 1
+
+        if (state["cusum"] < self.threshold or state["events"] < self.min_events
+                or now - state["last_alert"] < self.cooldown_seconds):
+            return None
+        alert = {
+            "id": next(self._alert_ids),
+            "dimension": dimension,
+            "key": key,
+            "cusum": round(state["cusum"], 4),
+            "recent_negative_rate": round(state["recent"], 4),
+            "baseline_negative_rate": round(state["baseline"], 4),
+            "events": state["events"],
+            "timestamp": now
+        }
+        state["cusum"] = 0.0
+        state["last_alert"] = now
+        return alert
+
+    def _publish(self, alert: Dict[str, Any]):
+        for subscriber in self._subscribers:
+            try:
+                subscriber.put_nowait(alert)
+            except queue.Full:
+                # A slow consumer loses alerts rather than slowing ingestion down
+                self.dropped_alerts += 1
+
+    def subscribe(self, maxsize: int = 1000) -> "queue.Queue[Dict[str, Any]]":
+        """Get a queue that receives every alert raised from now on"""
+        subscriber: queue.Queue = queue.Queue(maxsize)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        """Stop delivering alerts to a queue"""
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def get_alerts(self, after: int = 0, limit: int = 100, dimension: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get retained alerts with an ID above ``after``, oldest first"""
+        with self._lock:
+            alerts = [
+                dict(alert) for alert in self.alerts
+                if alert["id"] > after and (dimension is None or alert["dimension"] == dimension)
+            ]
+        return alerts[:limit]
+
+    def get_state(self, dimension: str, key: str) -> Optional[Dict[str, Any]]:
+        """Get the current EWMA/CUSUM state of one key"""
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}")
+        with self._lock:
+            state = self._states[dimension].get(key)
+            if state is None:
+                return None
+            return {
+                "dimension": dimension,
+                "key": key,
+                "events": state["events"],
+                "cusum": round(state["cusum"], 4),
+                "recent_negative_rate": round(state["recent"], 4),
+                "baseline_negative_rate": round(state["baseline"], 4)
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get event and alert counts, tracked keys and detector settings"""
+        with self._lock:
+            return {
+                "events": self.events,
+                "alerts_raised": self.alerts_raised,
+                "alerts_retained": len(self.alerts),
+                "dropped_alerts": self.dropped_alerts,
+                "subscribers": len(self._subscribers),
+                "tracked_keys": {dimension: len(states) for dimension, states in self._states.items()},
+                "threshold": self.threshold,
+                "slack": self.slack,
+                "cooldown_seconds": self.cooldown_seconds
+            }
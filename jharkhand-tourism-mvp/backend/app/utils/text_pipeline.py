@@ -0,0 +1,119 @@
+"""Single-pass text preprocessing shared by the sentiment stages.
+
+A review is normalized and tokenized once into a ``ProcessedText``; VADER,
+TextBlob polarity, tourism keyword/aspect detection and keyword extraction
+all read from that object instead of re-scanning the raw string.
+"""
+import re
+import string
+from typing import Dict, List, Tuple
+
+from nltk.sentiment.vader import SentiText, VaderConstants
+from textblob.en import sentiment as pattern_sentiment
+
+# Same token definition extract_keywords has always used (ASCII words)
+WORD_PATTERN = re.compile(r"\b[a-z]+\b")
+
+_PUNCTUATION = VaderConstants.REGEX_REMOVE_PUNCTUATION
+_PUNCTUATION_RUN = re.compile("^[%s]*" % re.escape(string.punctuation))
+_VADER_PUNC = frozenset(VaderConstants.PUNC_LIST)
+
+
+class ProcessedText:
+    """A text normalized and tokenized once for every sentiment stage.
+
+    The lower-cased text, whitespace tokens and word tokens are built up front;
+    the VADER and TextBlob token streams are built on first access, so callers
+    that only need keywords do not pay for the sentiment tokenizers.
+    """
+
+    __slots__ = ("text", "lower", "raw_tokens", "words", "_vader_tokens", "_pattern_tokens")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        # Whitespace tokens, as VADER and tourism_focus_score count them
+        self.raw_tokens = text.split()
+        self.words = WORD_PATTERN.findall(self.lower)
+        self._vader_tokens = None
+        self._pattern_tokens = None
+
+    @property
+    def vader_tokens(self) -> List[str]:
+        """Whitespace tokens with VADER's leading/trailing punctuation removed"""
+        if self._vader_tokens is None:
+            self._vader_tokens = [
+                _strip_vader_punctuation(token) for token in self.raw_tokens if len(token) > 1
+            ]
+        return self._vader_tokens
+
+    @property
+    def pattern_tokens(self) -> List[str]:
+        """TextBlob's own tokenization, lower-cased the way its analyzer does it"""
+        if self._pattern_tokens is None:
+            self._pattern_tokens = " ".join(pattern_sentiment.tokenizer(self.text)).lower().split()
+        return self._pattern_tokens
+
+
+def process_text(text: str) -> ProcessedText:
+    """Normalize and tokenize a text once"""
+    return ProcessedText(text)
+
+
+def _strip_vader_punctuation(token: str) -> str:
+    """Strip one leading or trailing VADER punctuation mark from a token.
+
+    Equivalent to ``SentiText._words_and_emoticons`` without building the
+    (punctuation x words) lookup table for every text.
+    """
+    leading = _PUNCTUATION_RUN.match(token).group()
+    if leading:
+        word = token[len(leading):]
+        if leading in _VADER_PUNC and len(word) > 1 and not _PUNCTUATION.search(word):
+            return word
+        return token
+
+    word = token.rstrip(string.punctuation)
+    trailing = token[len(word):]
+    if trailing in _VADER_PUNC and len(word) > 1 and not _PUNCTUATION.search(word):
+        return word
+    return token
+
+
+class _PretokenizedSentiText(SentiText):
+    """SentiText built from tokens that were already split"""
+
+    def __init__(self, text: str, words_and_emoticons: List[str]):
+        self.text = text
+        self.words_and_emoticons = words_and_emoticons
+        self.is_cap_diff = self.allcap_differential(words_and_emoticons)
+
+
+def vader_scores(analyzer, processed: ProcessedText) -> Dict[str, float]:
+    """Run ``SentimentIntensityAnalyzer.polarity_scores`` on pre-split tokens"""
+    sentitext = _PretokenizedSentiText(processed.text, list(processed.vader_tokens))
+    words_and_emoticons = sentitext.words_and_emoticons
+    boosters = analyzer.constants.BOOSTER_DICT
+    sentiments = []
+
+    for item in words_and_emoticons:
+        valence = 0
+        i = words_and_emoticons.index(item)
+        if (
+            i < len(words_and_emoticons) - 1
+            and item.lower() == "kind"
+            and words_and_emoticons[i + 1].lower() == "of"
+        ) or item.lower() in boosters:
+            sentiments.append(valence)
+            continue
+
+        sentiments = analyzer.sentiment_valence(valence, sentitext, item, i, sentiments)
+
+    sentiments = analyzer._but_check(words_and_emoticons, sentiments)
+    return analyzer.score_valence(sentiments, processed.text)
+
+
+def pattern_scores(processed: ProcessedText) -> Tuple[float, float]:
+    """Get TextBlob (pattern) polarity and subjectivity from the token stream"""
+    score = pattern_sentiment(processed.pattern_tokens)
+    return score[0], score[1]
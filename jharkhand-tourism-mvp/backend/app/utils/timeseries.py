@@ -0,0 +1,133 @@
+"""Day-keyed sentiment time series with weekly and monthly rollups."""
+import threading
+from datetime import date as Date
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from .sentiment_aggregates import SENTIMENT_LABELS
+
+
+def _empty_bucket(key: str) -> Dict[str, Any]:
+    return {"date": key, "positive": 0, "neutral": 0, "negative": 0,
+            "total_feedback": 0, "total_rating": 0.0}
+
+
+def _week_key(day: str) -> str:
+    year, week, _ = Date.fromisoformat(day).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _public(bucket: Dict[str, Any]) -> Dict[str, Any]:
+    """Bucket as returned by the API: rating sum replaced by the average"""
+    entry = {key: value for key, value in bucket.items() if key != "total_rating"}
+    total = bucket["total_feedback"]
+    entry["average_rating"] = round(bucket["total_rating"] / total, 1) if total else 0
+    return entry
+
+
+class SentimentTimeSeries:
+    """Per-day sentiment counts indexed by ISO date (``YYYY-MM-DD``).
+
+    Days are kept in a dict in date order, so upserting a day is O(1) and the
+    last ``n`` days are read by walking ``n`` entries back from the newest.
+    Once more than ``daily_retention`` days are held, the oldest day is folded
+    into its ISO week bucket and its month bucket. Weeks and months are capped
+    the same way (``weekly_retention`` / ``monthly_retention``), so memory
+    stays bounded however long the service runs.
+    """
+
+    def __init__(self, daily_retention: int = 400, weekly_retention: int = 156,
+                 monthly_retention: int = 120):
+        self.daily_retention = max(1, daily_retention)
+        self.weekly_retention = max(0, weekly_retention)
+        self.monthly_retention = max(0, monthly_retention)
+        self._lock = threading.Lock()
+        self._days: Dict[str, Dict[str, Any]] = {}
+        self._weeks: Dict[str, Dict[str, Any]] = {}
+        self._months: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, day: str, sentiment: str, rating: float = 0, count: int = 1):
+        """Add ``count`` feedback items with the same sentiment to a day"""
+        if sentiment not in SENTIMENT_LABELS:
+            sentiment = "neutral"
+        with self._lock:
+            bucket = self._days.get(day) or _insert_bucket(self._days, day)
+            bucket[sentiment] += count
+            bucket["total_feedback"] += count
+            bucket["total_rating"] += rating * count
+            self._evict()
+
+    def load_day(self, entry: Dict[str, Any]):
+        """Replace a whole day from an entry shaped like the API output"""
+        with self._lock:
+            bucket = self._days.get(entry["date"]) or _insert_bucket(self._days, entry["date"])
+            for label in SENTIMENT_LABELS:
+                bucket[label] = entry.get(label, 0)
+            bucket["total_feedback"] = entry.get("total_feedback", 0)
+            bucket["total_rating"] = entry.get("average_rating", 0) * bucket["total_feedback"]
+            self._evict()
+
+    def get_day(self, day: str) -> Optional[Dict[str, Any]]:
+        """Get one day, or None when it is not held at daily resolution"""
+        with self._lock:
+            bucket = self._days.get(day)
+            return _public(bucket) if bucket else None
+
+    def last(self, days: int) -> List[Dict[str, Any]]:
+        """Get the most recent ``days`` days held, oldest first"""
+        with self._lock:
+            recent = list(islice(reversed(self._days.values()), max(0, days)))
+        return [_public(bucket) for bucket in reversed(recent)]
+
+    def rollups(self, period: str) -> List[Dict[str, Any]]:
+        """Get the weekly or monthly buckets of days that left the daily window"""
+        if period not in ("week", "month"):
+            raise ValueError(f"Unknown rollup period: {period}")
+        with self._lock:
+            buckets = list((self._weeks if period == "week" else self._months).values())
+        return [_public(bucket) for bucket in buckets]
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get how many buckets are held at each resolution"""
+        return {
+            "days": len(self._days),
+            "weeks": len(self._weeks),
+            "months": len(self._months),
+            "daily_retention": self.daily_retention,
+            "weekly_retention": self.weekly_retention,
+            "monthly_retention": self.monthly_retention
+        }
+
+    def _evict(self):
+        """Roll the oldest days up until the daily window fits its retention"""
+        while len(self._days) > self.daily_retention:
+            self._roll_up(self._days.pop(next(iter(self._days))))
+
+    def _roll_up(self, bucket: Dict[str, Any]):
+        """Fold an expired day into its week and month buckets"""
+        for buckets, key, retention in (
+            (self._weeks, _week_key(bucket["date"]), self.weekly_retention),
+            (self._months, bucket["date"][:7], self.monthly_retention)
+        ):
+            if not retention:
+                continue
+            target = buckets.get(key) or _insert_bucket(buckets, key)
+            for field in ("positive", "neutral", "negative", "total_feedback", "total_rating"):
+                target[field] += bucket[field]
+            while len(buckets) > retention:
+                buckets.pop(next(iter(buckets)))
+
+
+def _insert_bucket(buckets: Dict[str, Dict[str, Any]], key: str) -> Dict[str, Any]:
+    """Add an empty bucket, keeping ``buckets`` in key order"""
+    newest = next(reversed(buckets), None)
+    bucket = buckets[key] = _empty_bucket(key)
+    if newest is not None and key < newest:
+        # Out-of-order insert (e.g. a backfilled day): re-sort, which is rare
+        ordered = sorted(buckets.items())
+        buckets.clear()
+        buckets.update(ordered)
+    return bucket
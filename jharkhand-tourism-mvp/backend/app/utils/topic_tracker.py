@@ -0,0 +1,161 @@
+"""Streaming heavy-hitter topics over the feedback stream.
+
+Topic counts use the Space-Saving algorithm: at most ``capacity`` counters
+are kept, and a new topic replaces the one with the smallest count
+(inheriting that count as its possible overestimate). Counters sit in
+count-ordered buckets, so every update is O(1) and an all-time top-N read
+walks at most ``capacity`` counters however much feedback has been seen.
+A windowed read (last ``days`` days) is not O(N): it merges one daily
+summary per day, O(days x capacity), still independent of the feedback
+volume.
+"""
+import heapq
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitter summary with O(1) unit increments"""
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = max(1, capacity)
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        # count -> topics holding exactly that count (dicts keep insertion order)
+        self._buckets: Dict[int, Dict[str, None]] = defaultdict(dict)
+        self._min_count = 0
+        self.total = 0
+
+    def add(self, topic: str):
+        """Count one occurrence of a topic"""
+        self.total += 1
+        count = self.counts.get(topic)
+        if count is not None:
+            self._move(topic, count, count + 1)
+            return
+
+        if len(self.counts) < self.capacity:
+            self.counts[topic] = 1
+            self.errors[topic] = 0
+            self._buckets[1][topic] = None
+            self._min_count = 1
+            return
+
+        # Replace a topic with the smallest count; its count becomes our error
+        bucket = self._buckets[self._min_count]
+        evicted = next(iter(bucket))
+        floor = self._min_count
+        del bucket[evicted]
+        del self.counts[evicted]
+        del self.errors[evicted]
+        self.counts[topic] = floor + 1
+        self.errors[topic] = floor
+        self._buckets[floor + 1][topic] = None
+        if not bucket:
+            del self._buckets[floor]
+            self._min_count = floor + 1
+
+    def _move(self, topic: str, old: int, new: int):
+        bucket = self._buckets[old]
+        del bucket[topic]
+        if not bucket:
+            del self._buckets[old]
+            if old == self._min_count:
+                self._min_count = new
+        self._buckets[new][topic] = None
+        self.counts[topic] = new
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Get the ``n`` most frequent topics with count and maximum overestimate"""
+        result = []
+        for count in sorted(self._buckets, reverse=True):
+            for topic in self._buckets[count]:
+                result.append({"topic": topic, "count": count, "error": self.errors[topic]})
+                if len(result) >= n:
+                    return result
+        return result
+
+    def merged_counts(self, into: Dict[str, int]):
+        """Add this summary's counts into ``into`` (used to combine windows)"""
+        for topic, count in self.counts.items():
+            into[topic] = into.get(topic, 0) + count
+
+
+class TopicTracker:
+    """Heavy-hitter topics overall, per category and per day.
+
+    Daily summaries, overall and per tracked category, are kept for
+    ``window_days`` days. A view over the last ``days`` days merges those
+    daily summaries on every read, which costs O(days x capacity) (up to
+    90 x 200 counters by default) plus O(m log n) to pick the top ``n`` of
+    the m merged topics; it never depends on the amount of feedback.
+    """
+
+    def __init__(self, capacity: int = 200, window_days: int = 90, max_categories: int = 100):
+        self.capacity = capacity
+        self.window_days = max(1, window_days)
+        self.max_categories = max_categories
+        self._lock = threading.Lock()
+        self.overall = SpaceSaving(capacity)
+        self.categories: Dict[str, SpaceSaving] = {}
+        self.days: Dict[str, SpaceSaving] = {}
+        # category -> day -> summary, for the categories in ``categories``
+        self.category_days: Dict[str, Dict[str, SpaceSaving]] = {}
+
+    def add(self, topics: Iterable[str], category: str = "general", day: Optional[str] = None):
+        """Count the topics of one feedback item"""
+        day = day or datetime.utcnow().strftime("%Y-%m-%d")
+        with self._lock:
+            summaries = [self.overall, self._summary_for_day(self.days, day)]
+            category_summary = self.categories.get(category)
+            if category_summary is None and len(self.categories) < self.max_categories:
+                category_summary = self.categories[category] = SpaceSaving(self.capacity)
+                self.category_days[category] = {}
+            if category_summary is not None:
+                summaries.append(category_summary)
+                summaries.append(self._summary_for_day(self.category_days[category], day))
+            for topic in topics:
+                for summary in summaries:
+                    summary.add(topic)
+
+    def _summary_for_day(self, days: Dict[str, SpaceSaving], day: str) -> SpaceSaving:
+        summary = days.get(day)
+        if summary is None:
+            summary = days[day] = SpaceSaving(self.capacity)
+            if len(days) > self.window_days:
+                # Keep only the newest window_days days
+                for stale in sorted(days)[:len(days) - self.window_days]:
+                    del days[stale]
+        return summary
+
+    def top(self, n: int = 10, category: Optional[str] = None,
+            days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the top ``n`` topics overall or for one category, over all time or the last ``days`` days.
+
+        All-time reads walk one summary; windowed reads merge one summary per day in the window.
+        """
+        with self._lock:
+            if days is None:
+                summary = self.categories.get(category) if category is not None else self.overall
+                return summary.top(n) if summary is not None else []
+
+            daily = self.category_days.get(category, {}) if category is not None else self.days
+            since = (datetime.utcnow() - timedelta(days=max(1, days) - 1)).strftime("%Y-%m-%d")
+            counts: Dict[str, int] = {}
+            for day, summary in daily.items():
+                if day >= since:
+                    summary.merged_counts(counts)
+        ranked = heapq.nlargest(n, counts.items(), key=lambda item: item[1])
+        return [{"topic": topic, "count": count} for topic, count in ranked]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get how much has been counted and how many summaries are held"""
+        return {
+            "topics_counted": self.overall.total,
+            "tracked_topics": len(self.overall.counts),
+            "capacity": self.capacity,
+            "categories": len(self.categories),
+            "days": len(self.days)
+        }
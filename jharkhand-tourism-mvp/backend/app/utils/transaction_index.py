@@ -0,0 +1,137 @@
+"""Secondary indexes over blockchain transactions.
+
+Transactions are indexed once, when they are submitted, by hash, by sender
+and recipient address and by contract address. The indexed dicts are the
+live transaction objects, so status and block changes made on confirmation
+show through without re-indexing.
+
+Address and contract histories are append-only lists of hashes, so a page
+is a slice of one list and a cursor is just a position in it: pages stay
+stable while new transactions arrive. Each contract also keeps running
+totals (count, value volume, gas, distinct senders in a HyperLogLog), so its
+analytics are read without touching its transactions.
+"""
+from typing import Any, Dict, List, Optional
+
+from .hyperloglog import HyperLogLog
+
+
+def _key(address: Optional[str]) -> str:
+    return (address or "").lower()
+
+
+class ContractAggregate:
+    """Running totals of one contract's transactions"""
+
+    def __init__(self, precision: int = 12):
+        self.transactions = 0
+        self.value_volume = 0.0
+        self.gas_used = 0
+        self.senders = HyperLogLog(precision)
+        self.transaction_types: Dict[str, int] = {}
+        self.last_activity: Optional[str] = None
+
+    def add(self, transaction: Dict[str, Any]):
+        # Read every field before changing any total, so a bad transaction leaves them untouched
+        value = float(transaction.get("value") or 0)
+        gas = int(transaction.get("gas") or 0)
+        sender = _key(transaction.get("from"))
+        self.transactions += 1
+        self.value_volume += value
+        self.gas_used += gas
+        self.senders.add(sender)
+        tx_type = transaction.get("type")
+        self.transaction_types[tx_type] = self.transaction_types.get(tx_type, 0) + 1
+        timestamp = transaction.get("timestamp")
+        if timestamp and (self.last_activity is None or timestamp > self.last_activity):
+            self.last_activity = timestamp
+
+
+class TransactionIndex:
+    """Transactions by hash, address and contract, with per-contract aggregates"""
+
+    def __init__(self, hll_precision: int = 12):
+        self.hll_precision = hll_precision
+        self._by_hash: Dict[str, Dict[str, Any]] = {}
+        self._by_address: Dict[str, List[str]] = {}
+        self._by_contract: Dict[str, List[str]] = {}
+        self._aggregates: Dict[str, ContractAggregate] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def __contains__(self, tx_hash: str) -> bool:
+        return tx_hash in self._by_hash
+
+    def add(self, transaction: Dict[str, Any]):
+        """Index a transaction (a hash already indexed is ignored)"""
+        tx_hash = transaction["hash"]
+        if tx_hash in self._by_hash:
+            return
+        # Compute every key first: a transaction that cannot be indexed leaves the index untouched
+        addresses = {_key(transaction.get("from")), _key(transaction.get("to"))}
+        contract = _key(transaction.get("contract_address"))
+        aggregate = self._aggregates.get(contract) if contract else None
+        if contract and aggregate is None:
+            aggregate = ContractAggregate(self.hll_precision)
+        if aggregate is not None:
+            aggregate.add(transaction)
+            self._aggregates[contract] = aggregate
+        self._by_hash[tx_hash] = transaction
+        for address in addresses:
+            if address:
+                self._by_address.setdefault(address, []).append(tx_hash)
+        if contract:
+            self._by_contract.setdefault(contract, []).append(tx_hash)
+
+    def get(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        return self._by_hash.get(tx_hash)
+
+    def address_history(self, address: str, cursor: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        """One page of the transactions sent or received by an address, newest first"""
+        return self._page(self._by_address.get(_key(address), []), cursor, limit)
+
+    def contract_history(self, contract_address: str, cursor: Optional[str] = None,
+                         limit: int = 50) -> Dict[str, Any]:
+        """One page of a contract's transactions, newest first"""
+        return self._page(self._by_contract.get(_key(contract_address), []), cursor, limit)
+
+    def _page(self, hashes: List[str], cursor: Optional[str], limit: int) -> Dict[str, Any]:
+        # The cursor is the history position the next page ends before
+        if cursor is None:
+            end = len(hashes)
+        else:
+            try:
+                end = int(cursor)
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}")
+            if not 0 <= end <= len(hashes):
+                raise ValueError(f"Invalid cursor: {cursor}")
+        start = max(0, end - max(1, limit))
+        return {
+            "transactions": [self._by_hash[tx_hash] for tx_hash in reversed(hashes[start:end])],
+            "total": len(hashes),
+            "next_cursor": str(start) if start > 0 else None
+        }
+
+    def contract_stats(self, contract_address: str) -> Optional[Dict[str, Any]]:
+        """Running totals of a contract's transactions; None if it has none"""
+        aggregate = self._aggregates.get(_key(contract_address))
+        if aggregate is None:
+            return None
+        return {
+            "total_transactions": aggregate.transactions,
+            "active_users": aggregate.senders.count(),
+            "transaction_volume": round(aggregate.value_volume, 8),
+            "gas_used": aggregate.gas_used,
+            "last_activity": aggregate.last_activity,
+            "transaction_types": sorted(aggregate.transaction_types, key=str)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index sizes"""
+        return {
+            "transactions": len(self._by_hash),
+            "addresses": len(self._by_address),
+            "contracts": len(self._by_contract)
+        }
@@ -0,0 +1 @@
+# Performance benchmarks for the Jharkhand Tourism API
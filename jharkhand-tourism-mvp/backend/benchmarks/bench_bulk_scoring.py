@@ -0,0 +1,46 @@
+"""Accuracy and throughput of the vectorized bulk scorer against analyze_single_text.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_bulk_scoring
+"""
+import time
+
+import numpy as np
+
+from app.services.sentiment_service import SentimentService
+from benchmarks.bench_text_pipeline import REVIEW_LENGTHS, make_reviews
+
+CORPUS_SIZE = 2000
+
+
+def main():
+    service = SentimentService(cache_size=0)
+    service.warmup()
+    service.analyze_bulk(["warm up the vectorized scorer"])
+
+    print(f"{'length':<10}{'per-text/s':>12}{'bulk/s':>12}{'speedup':>9}"
+          f"{'label agree':>13}{'score MAE':>11}{'score r':>9}")
+    for label, words in REVIEW_LENGTHS.items():
+        texts = make_reviews(words, CORPUS_SIZE, seed=7)
+
+        start = time.perf_counter()
+        exact = [service.analyze_single_text(text) for text in texts]
+        per_text = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = service.analyze_bulk(texts)
+        vectorized = time.perf_counter() - start
+
+        exact_scores = np.array([result["score"] for result in exact])
+        bulk_scores = np.array([result["score"] for result in bulk])
+        agreement = np.mean([a["sentiment"] == b["sentiment"] for a, b in zip(exact, bulk)])
+        mae = np.mean(np.abs(exact_scores - bulk_scores))
+        correlation = np.corrcoef(exact_scores, bulk_scores)[0, 1]
+
+        print(f"{label:<10}{len(texts) / per_text:>12.0f}{len(texts) / vectorized:>12.0f}"
+              f"{per_text / vectorized:>8.1f}x{agreement:>12.1%}{mae:>11.3f}{correlation:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""CPU time and label agreement of cascade mode against the full VADER + TextBlob path.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_cascade
+    python -m benchmarks.bench_cascade --bands 0.3 0.5 0.7
+"""
+import argparse
+import time
+from typing import List, Optional
+
+from app.services.sentiment_service import SentimentService
+from benchmarks.corpus import LENGTHS, make_corpus
+
+CORPUS_SIZE = 2000
+
+
+def cpu_time(service: SentimentService, texts: List[str], rounds: int = 3):
+    """Process CPU seconds spent analyzing texts (best of ``rounds``), and the results"""
+    best = float("inf")
+    for _ in range(max(1, rounds)):
+        start = time.process_time()
+        results = [service.analyze_single_text(text) for text in texts]
+        best = min(best, time.process_time() - start)
+    return best, results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=CORPUS_SIZE, help="texts per length (default 2000)")
+    parser.add_argument("--seed", type=int, default=42, help="corpus seed (default 42)")
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds, best kept (default 3)")
+    parser.add_argument("--bands", type=float, nargs="+", default=[0.3, 0.5, 0.7],
+                        help="half-widths of the ambiguous band to try (default 0.3 0.5 0.7)")
+    args = parser.parse_args(argv)
+
+    # Caches disabled so every call does the full analysis
+    full = SentimentService(cache_size=0)
+    full.warmup()
+
+    print(f"{'length':<10}{'band':>7}{'full ms':>9}{'cascade ms':>12}{'CPU saved':>11}"
+          f"{'fallback':>10}{'label agree':>13}")
+    for length in LENGTHS:
+        texts = make_corpus(args.size, length, args.seed)
+        full_cpu, exact = cpu_time(full, texts, args.rounds)
+        for width in args.bands:
+            cascade = SentimentService(cache_size=0, models=full.models, cascade=True,
+                                       cascade_band=(-width, width))
+            cascade_cpu, results = cpu_time(cascade, texts, args.rounds)
+            agreement = sum(a["sentiment"] == b["sentiment"] for a, b in zip(exact, results)) / len(texts)
+            stats = cascade.get_cascade_stats()
+            print(f"{length:<10}{width:>7.2f}{full_cpu / len(texts) * 1000:>9.3f}"
+                  f"{cascade_cpu / len(texts) * 1000:>12.3f}{1 - cascade_cpu / full_cpu:>10.1%}"
+                  f"{stats['fallback_rate']:>10.1%}{agreement:>12.1%}")
+
+
+if __name__ == "__main__":
+    main()
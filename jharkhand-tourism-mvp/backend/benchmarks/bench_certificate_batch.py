@@ -0,0 +1,80 @@
+"""Certificate issuance: one transaction per certificate vs one Merkle-batched transaction.
+
+The same recipients are issued certificates one by one and then as a single
+batch on seeded ``BlockchainService`` instances. The benchmark reports chain
+writes, the blocks needed to confirm them under the block gas limit,
+issuance time, proof size and the time to verify every certificate against
+the anchored root.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_certificate_batch
+    python -m benchmarks.bench_certificate_batch --recipients 10000
+"""
+import argparse
+import json
+import time
+from typing import List, Optional
+
+from app.services.blockchain_service import BlockchainService
+from benchmarks.bench_local_chain import simulated_clock
+
+
+def blocks_to_confirm(service: BlockchainService) -> int:
+    """Seal blocks until nothing is pending; returns how many it took"""
+    blocks = 0
+    while service.confirmer.pending:
+        service.confirmer.confirm_batch()
+        blocks += 1
+    return blocks
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipients", type=int, default=5000, help="certificates to issue (default 5000)")
+    args = parser.parse_args(argv)
+    recipients = [
+        {"recipient_name": f"Tourist {i}", "recipient_wallet": f"0x{i:040x}"}
+        for i in range(args.recipients)
+    ]
+
+    # Room in the mempool for one pending transaction per certificate and no stale eviction
+    # while the simulated clock runs ahead; the mock history's pending transactions go first
+    single = BlockchainService(clock=simulated_clock(), mempool_size=args.recipients + 1000,
+                               mempool_max_age=float("inf"))
+    blocks_to_confirm(single)
+    submitted = single.confirmer.submitted
+    start = time.perf_counter()
+    for recipient in recipients:
+        single.issue_digital_certificate(dict(recipient, achievement="Sarhul Festival"))
+    single_time = time.perf_counter() - start
+    single_writes = single.confirmer.submitted - submitted
+
+    batched = BlockchainService(clock=simulated_clock(), mempool_max_age=float("inf"))
+    blocks_to_confirm(batched)
+    submitted = batched.confirmer.submitted
+    start = time.perf_counter()
+    batch = batched.issue_certificate_batch({"achievement": "Sarhul Festival", "recipients": recipients})
+    batch_time = time.perf_counter() - start
+    batch_writes = batched.confirmer.submitted - submitted
+
+    single_blocks = blocks_to_confirm(single)
+    batch_blocks = blocks_to_confirm(batched)
+    start = time.perf_counter()
+    valid = sum(
+        batched.verify_certificate_proof(issued["certificate"], issued["proof"])["valid"]
+        for issued in batch["certificates"]
+    )
+    verify_time = time.perf_counter() - start
+
+    proof_bytes = sum(len(json.dumps(issued["proof"])) for issued in batch["certificates"]) / args.recipients
+    print(f"one by one: {single_writes} chain transactions in {single_time:.3f} s, "
+          f"{single_blocks} blocks to confirm")
+    print(f"batched:    {batch_writes} chain transaction in {batch_time:.3f} s, "
+          f"{batch_blocks} block to confirm (root {batch['merkle_root'][:18]}...)")
+    print(f"proofs: {len(batch['certificates'][0]['proof'])} steps, {proof_bytes:.0f} bytes on average")
+    print(f"verified {valid}/{args.recipients} certificates against the anchored root in {verify_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
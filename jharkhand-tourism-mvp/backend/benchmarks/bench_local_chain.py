@@ -0,0 +1,77 @@
+"""Throughput of the local chain simulator on seeded, reproducible chain data.
+
+Transactions are submitted to a seeded ``BlockchainService`` and sealed into
+blocks with a simulated clock, so the head hash printed at the end is the
+same on every run with the same arguments. Blocks are packed from the
+gas-price-ordered mempool under the block gas limit; the average fill ratio
+shows how much of each block's gas was used.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_local_chain
+    python -m benchmarks.bench_local_chain --transactions 100000 --gas-limit 30000000
+"""
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from app.services.blockchain_service import BlockchainService
+from app.utils.constants import BLOCKCHAIN_CONSTANTS
+
+# 2024-01-01T00:00:00Z
+START_TIME = 1704067200
+
+
+def simulated_clock(start: float = START_TIME, step: float = 1.0) -> Callable[[], float]:
+    """A clock that moves ``step`` seconds every time it is read"""
+    now = [start]
+
+    def clock() -> float:
+        now[0] += step
+        return now[0]
+    return clock
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=20000, help="transactions to submit (default 20000)")
+    parser.add_argument("--batch-size", type=int, default=500, help="transactions per block (default 500)")
+    parser.add_argument("--gas-limit", type=int, default=BLOCKCHAIN_CONSTANTS["GAS_LIMIT"],
+                        help=f"block gas limit (default {BLOCKCHAIN_CONSTANTS['GAS_LIMIT']})")
+    parser.add_argument("--seed", type=int, default=42, help="mock data seed (default 42)")
+    args = parser.parse_args(argv)
+
+    # Room for every transaction and no stale eviction while the simulated clock runs ahead
+    service = BlockchainService(confirm_batch_size=args.batch_size, seed=args.seed, clock=simulated_clock(),
+                                block_gas_limit=args.gas_limit, mempool_size=args.transactions + 1000,
+                                mempool_max_age=float("inf"))
+    start = time.perf_counter()
+    for i in range(args.transactions):
+        service.create_transaction(f"0x{i % 97:040x}", f"0x{i % 89:040x}", 0.01, {"type": "booking_payment"})
+    submit = time.perf_counter() - start
+
+    start = time.perf_counter()
+    blocks = 0
+    while service.confirmer.pending:
+        service.confirmer.confirm_batch()
+        blocks += 1
+    seal = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid = service.chain.verify()
+    verify = time.perf_counter() - start
+
+    stats = service.chain.get_stats()
+    confirmer = service.confirmer.get_stats()
+    print(f"submitted {args.transactions} transactions in {submit:.3f} s "
+          f"({args.transactions / submit:,.0f} tx/s)")
+    print(f"sealed {blocks} blocks of up to {args.batch_size} tx / {args.gas_limit} gas in {seal:.3f} s "
+          f"({args.transactions / seal:,.0f} tx/s including Merkle roots)")
+    print(f"average block fill ratio {confirmer['block_fill_ratio']['average']:.2%}, "
+          f"mempool peak depth {confirmer['mempool']['max_depth']}")
+    print(f"verified {stats['blocks']} blocks in {verify:.3f} s: {'valid' if valid else 'INVALID'}")
+    print(f"head {stats['height']} {stats['latest_hash']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Benchmark suite for SentimentService on a seeded tourism review corpus.
+
+Reports throughput, p50/p95/p99 latency and peak traced memory per case and
+can write the results as JSON, so runs from two commits can be compared.
+Run from the backend directory:
+
+    python -m benchmarks.bench_sentiment_service --output before.json
+    python -m benchmarks.bench_sentiment_service --compare before.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.services.sentiment_service import SentimentService
+from app.utils.spike_detector import SpikeDetector
+from benchmarks.corpus import LENGTHS, make_corpus, make_feedback
+
+# Items per call of each batched case
+BATCH_SIZE = 100
+
+# Calls used for the (slower) peak memory pass
+MEMORY_CALLS = 50
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_case(name: str, func: Callable[[Any], Any], inputs: List[Any],
+             items_per_call: int = 1, rounds: int = 3) -> Dict[str, Any]:
+    """Time ``func`` on every input (best of ``rounds``), then measure peak memory on a sample"""
+    elapsed, latencies = float("inf"), []
+    for _ in range(max(1, rounds)):
+        round_latencies = []
+        start = time.perf_counter()
+        for item in inputs:
+            call_start = time.perf_counter()
+            func(item)
+            round_latencies.append(time.perf_counter() - call_start)
+        round_elapsed = time.perf_counter() - start
+        if round_elapsed < elapsed:
+            elapsed, latencies = round_elapsed, round_latencies
+
+    tracemalloc.start()
+    for item in inputs[:MEMORY_CALLS]:
+        func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "name": name,
+        "calls": len(inputs),
+        "items_per_sec": round(len(inputs) * items_per_call / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(elapsed / len(inputs) * 1000, 4),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 4),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 4),
+        "peak_memory_kb": round(peak / 1024, 1)
+    }
+
+
+def run_suite(size: int, seed: int, rounds: int = 3) -> List[Dict[str, Any]]:
+    """Run every benchmark case and return their results"""
+    results = []
+
+    def run(*args):
+        results.append(run_case(*args, rounds=rounds))
+
+    # Cache disabled so every call does the full analysis
+    service = SentimentService(cache_size=0)
+    service.warmup()
+
+    for length in LENGTHS:
+        texts = make_corpus(size, length, seed)
+        run(f"analyze_single_text[{length}]", service.analyze_single_text, texts)
+
+    texts = make_corpus(size, "typical", seed)
+    batches = [texts[i:i + BATCH_SIZE] for i in range(0, len(texts), BATCH_SIZE)]
+    run("analyze_batch_texts[typical]", service.analyze_batch_texts, batches, BATCH_SIZE)
+    run("analyze_tourism_context[typical]", service.analyze_tourism_context, texts)
+    run("extract_keywords[typical]", service.extract_keywords, texts)
+
+    cached = SentimentService()
+    cached.warmup()
+    for text in texts:
+        cached.analyze_single_text(text)
+    run("analyze_single_text[cached]", cached.analyze_single_text, texts)
+
+    # Ingest feedback, then time the dashboard reads over the grown corpus
+    feedback_service = SentimentService()
+    feedback_service.warmup()
+    feedback = make_feedback(size, seed)
+    # Ingestion changes state, so it is timed once
+    results.append(run_case("process_feedback", feedback_service.process_feedback, feedback, rounds=1))
+
+    # Spike detector updates on their own, without the analysis in front of them
+    events = [dict(item, id=i, site=f"site-{i % 40}", provider_id=f"provider-{i % 150}",
+                   sentiment="negative" if i % 7 == 0 else "positive")
+              for i, item in enumerate(feedback)]
+    detector = SpikeDetector()
+    results.append(run_case("spike_detector.observe", detector.observe, events, rounds=1))
+
+    reads = {
+        "get_overall_sentiment": feedback_service.get_overall_sentiment,
+        "get_sentiment_by_category": feedback_service.get_sentiment_by_category,
+        "get_sentiment_trends[30]": lambda: feedback_service.get_sentiment_trends(30),
+        "get_improvement_suggestions": feedback_service.get_improvement_suggestions,
+        "get_feedback_topics": feedback_service.get_feedback_topics,
+        "get_aspect_sentiment": feedback_service.get_aspect_sentiment,
+        "get_sentiment_summary": feedback_service.get_sentiment_summary
+    }
+    for name, read in reads.items():
+        run(name, lambda _, read=read: read(), [None] * size)
+
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: List[Dict[str, Any]]):
+    print(f"{'case':<36}{'items/s':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak KiB':>11}")
+    for result in results:
+        print(f"{result['name']:<36}{result['items_per_sec']:>11.1f}{result['p50_ms']:>10.3f}"
+              f"{result['p95_ms']:>10.3f}{result['p99_ms']:>10.3f}{result['peak_memory_kb']:>11.1f}")
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print throughput and p95 changes against a baseline; returns the regression count"""
+    previous = {result["name"]: result for result in baseline.get("results", [])}
+    regressions = 0
+    print(f"\nAgainst {baseline.get('meta', {}).get('commit') or 'baseline'}:")
+    print(f"{'case':<36}{'items/s':>11}{'p95':>10}")
+    for result in results:
+        old = previous.get(result["name"])
+        if old is None or not old["items_per_sec"] or not old["p95_ms"]:
+            continue
+        throughput = result["items_per_sec"] / old["items_per_sec"] - 1
+        p95 = result["p95_ms"] / old["p95_ms"] - 1
+        flag = ""
+        if throughput < -threshold or p95 > threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{result['name']:<36}{throughput:>+10.1%}{p95:>+10.1%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=500, help="texts per case (default 500)")
+    parser.add_argument("--seed", type=int, default=42, help="corpus seed (default 42)")
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds per case, best kept (default 3)")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.size, args.seed, args.rounds)
+    print_results(results)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "size": args.size,
+            "seed": args.seed,
+            "rounds": args.rounds
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
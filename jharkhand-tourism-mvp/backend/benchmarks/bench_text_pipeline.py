@@ -0,0 +1,109 @@
+"""Per-text cost of analyze_single_text before and after the shared text pipeline.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_text_pipeline
+"""
+import random
+import re
+import time
+from typing import Callable, Dict, List
+
+from textblob import TextBlob
+
+from app.services.sentiment_service import SentimentService, STOP_WORDS
+
+REVIEW_SENTENCES = [
+    "The tour guide was very knowledgeable about local culture and heritage.",
+    "Dassam Falls was breathtaking and the view from the top was picturesque.",
+    "Our hotel room was dirty and the staff were rude when we complained.",
+    "Transport from Ranchi was delayed by two hours, which was disappointing.",
+    "The tribal handicrafts marketplace is wonderful and supports local artisans!",
+    "Food at the homestay was authentic, but the portions could be better.",
+    "Tickets felt overpriced for what the site offered.",
+    "Betla National Park is a must visit, we saw elephants and deer.",
+    "The bus was crowded and the driver did not stop at the viewpoint.",
+    "I would recommend improving signage near Hundru Falls, it was hard to find.",
+    "Friendly people, clean streets and a memorable cultural evening.",
+    "Booking on the platform was easy, though the confirmation email never arrived.",
+]
+
+# Approximate word counts of short, typical and long reviews
+REVIEW_LENGTHS = {"short": 15, "typical": 60, "long": 200}
+
+
+def make_reviews(target_words: int, count: int, seed: int = 42) -> List[str]:
+    """Build reproducible reviews of roughly ``target_words`` words"""
+    rng = random.Random(seed)
+    reviews = []
+    for _ in range(count):
+        sentences, words = [], 0
+        while words < target_words:
+            sentence = rng.choice(REVIEW_SENTENCES)
+            sentences.append(sentence)
+            words += len(sentence.split())
+        reviews.append(" ".join(sentences))
+    return reviews
+
+
+def legacy_analyze(service: SentimentService, text: str) -> Dict[str, float]:
+    """The pre-pipeline analysis path: every stage re-reads the raw text"""
+    blob = TextBlob(text)
+    polarity = blob.sentiment.polarity
+    vader = service.sia.polarity_scores(text)
+
+    text_lower = text.lower()
+    counts = [
+        sum(1 for word in service.tourism_keywords[group] if word in text_lower)
+        for group in ("positive", "negative", "improvement")
+    ]
+    aspects = [
+        any(word in text_lower for word in terms)
+        for terms in (["guide", "tour guide", "leader"], ["hotel", "accommodation", "stay", "room"],
+                      ["transport", "vehicle", "car", "bus", "travel"], ["food", "meal", "restaurant", "dining"],
+                      ["place", "location", "site", "destination"], ["price", "cost", "expensive", "cheap", "value"])
+    ]
+    focus = sum(counts) / len(text.split()) * 100
+
+    words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+    word_freq = {}
+    for word in words:
+        if word not in STOP_WORDS:
+            word_freq[word] = word_freq.get(word, 0) + 1
+    sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+
+    return {"score": (polarity + vader["compound"]) / 2, "focus": focus, "aspects": aspects}
+
+
+def time_per_text(func: Callable[[str], object], texts: List[str], rounds: int = 3) -> float:
+    """Best-of-N mean time per text in microseconds"""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, (time.perf_counter() - start) / len(texts))
+    return best * 1e6
+
+
+def main():
+    # No result cache: after the equivalence check every timed call would be a cache hit
+    service = SentimentService(cache_size=0)
+    # Load the TextBlob lexicon before timing anything
+    service.analyze_single_text(REVIEW_SENTENCES[0])
+
+    print(f"{'length':<10}{'legacy us/text':>16}{'pipeline us/text':>18}{'speedup':>10}")
+    for label, words in REVIEW_LENGTHS.items():
+        texts = make_reviews(words, 300)
+
+        for text in texts:
+            expected = legacy_analyze(service, text)["score"]
+            assert abs(service.analyze_single_text(text)["score"] - expected) < 1e-12
+
+        legacy = time_per_text(lambda text: legacy_analyze(service, text), texts)
+        pipeline = time_per_text(service.analyze_single_text, texts)
+        print(f"{label:<10}{legacy:>16.1f}{pipeline:>18.1f}{legacy / pipeline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Contract analytics and history lookups: indexed reads vs scanning every transaction.
+
+Contract transactions are added to a seeded ``BlockchainService`` the way
+its mock history is. Contract analytics is then read from the running per-contract
+totals and compared with the previous full scan of ``mock_transactions``,
+and an address history is paged through with cursors.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_tx_index
+    python -m benchmarks.bench_tx_index --transactions 200000
+"""
+import argparse
+import time
+from typing import Any, Dict, List, Optional
+
+from app.services.blockchain_service import BlockchainService
+from benchmarks.bench_local_chain import simulated_clock
+
+
+def scan_analytics(service: BlockchainService, contract_address: str) -> Dict[str, Any]:
+    """Contract analytics the way they were computed before the index: one pass over every transaction"""
+    contract_transactions = [
+        tx for tx in service.mock_transactions
+        if tx.get("contract_address") == contract_address
+    ]
+    return {
+        "total_transactions": len(contract_transactions),
+        "active_users": len(set(tx["from"] for tx in contract_transactions)),
+        "transaction_volume": sum(tx["value"] for tx in contract_transactions),
+        "gas_used": sum(tx["gas"] for tx in contract_transactions)
+    }
+
+
+def timed(fn, repeat: int) -> float:
+    """Average milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=50000, help="contract transactions to add (default 50000)")
+    parser.add_argument("--senders", type=int, default=5000, help="distinct sender addresses (default 5000)")
+    parser.add_argument("--repeat", type=int, default=20, help="reads per measurement (default 20)")
+    args = parser.parse_args(argv)
+
+    service = BlockchainService(clock=simulated_clock())
+    contracts = [contract["address"] for contract in service.mock_contracts]
+    start = time.perf_counter()
+    for i in range(args.transactions):
+        # Contract transactions shaped like the seeded mock history
+        tx = {
+            "hash": f"0x{i:064x}",
+            "from": f"0x{i % args.senders:040x}",
+            "to": f"0x{i % 89:040x}",
+            "value": 0.01,
+            "gas": 21000 + i % 50000,
+            "gas_price": 25,
+            "timestamp": f"2024-01-01T00:00:{i % 60:02d}",
+            "status": "confirmed",
+            "type": "booking_payment",
+            "contract_address": contracts[i % len(contracts)]
+        }
+        service.mock_transactions.insert(0, tx)
+        service.transaction_index.add(tx)
+    insert = time.perf_counter() - start
+
+    contract = contracts[0]
+    exact = scan_analytics(service, contract)
+    indexed = service.get_contract_analytics(contract)
+    scan_ms = timed(lambda: scan_analytics(service, contract), args.repeat)
+    index_ms = timed(lambda: service.get_contract_analytics(contract), args.repeat)
+    print(f"{len(service.transaction_index):,} indexed transactions, {len(contracts)} contracts "
+          f"(stored and indexed in {insert:.3f} s)")
+    print(f"analytics by scan:  {scan_ms:8.3f} ms  ({exact['total_transactions']} transactions, "
+          f"{exact['active_users']} senders)")
+    print(f"analytics by index: {index_ms:8.3f} ms  ({indexed['total_transactions']} transactions, "
+          f"{indexed['active_users']} senders estimated)")
+
+    address = f"0x{0:040x}"
+    start = time.perf_counter()
+    pages, seen, cursor = 0, 0, None
+    while True:
+        page = service.get_address_transactions(address, cursor, limit=100)
+        pages += 1
+        seen += len(page["transactions"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"address history: {seen} transactions in {pages} pages of 100, {elapsed:.3f} ms "
+          f"({elapsed / pages:.3f} ms per page)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Per-worker memory of the sentiment process pool with and without preloaded models.
+
+Starts the batch engine, analyzes a corpus on every worker, then reports
+each worker's RSS, PSS and USS (see ``app/utils/process_memory.py``). Each
+mode runs in a fresh interpreter so one cannot skew the other. Linux only.
+Run from the backend directory:
+
+    python -m benchmarks.bench_worker_memory --workers 8
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from app.services.sentiment_engine import SentimentBatchEngine
+from app.services.sentiment_service import SentimentService
+from benchmarks.corpus import make_corpus
+
+
+def measure(workers: int, preload: bool, size: int) -> Dict[str, Any]:
+    """Start a pool, analyze ``size`` texts on it and return its memory report"""
+    engine = SentimentBatchEngine(SentimentService(cache_size=0), chunk_size=max(1, size // workers // 4),
+                                  max_workers=workers, preload=preload)
+    engine.start()
+    while not engine.ready:
+        time.sleep(0.1)
+    asyncio.run(engine.analyze_batch(make_corpus(size, "typical", seed=42)))
+    try:
+        return engine.get_memory()
+    finally:
+        engine.shutdown()
+
+
+def run_mode(workers: int, preload: bool, size: int) -> Dict[str, Any]:
+    """Run ``measure`` in a child interpreter"""
+    command = [sys.executable, "-m", "benchmarks.bench_worker_memory", "--workers", str(workers),
+               "--size", str(size), "--json"] + (["--preload"] if preload else [])
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_report(title: str, report: Dict[str, Any]):
+    print(f"\n{title} (parent RSS {report['parent']['rss_kb'] / 1024:.1f} MiB)")
+    print(f"{'pid':>8}{'RSS MiB':>10}{'PSS MiB':>10}{'USS MiB':>10}")
+    for worker in report["workers"]:
+        print(f"{worker['pid']:>8}{worker['rss_kb'] / 1024:>10.1f}{worker['pss_kb'] / 1024:>10.1f}"
+              f"{worker['uss_kb'] / 1024:>10.1f}")
+    print(f"{'total':>8}{report['workers_rss_kb'] / 1024:>10.1f}{'':>10}{report['workers_uss_kb'] / 1024:>10.1f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8, help="pool workers (default 8)")
+    parser.add_argument("--size", type=int, default=4000, help="texts analyzed on the pool (default 4000)")
+    parser.add_argument("--preload", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.json:
+        print(json.dumps(measure(args.workers, args.preload, args.size)))
+        return
+
+    before = run_mode(args.workers, False, args.size)
+    after = run_mode(args.workers, True, args.size)
+    print_report("Per-worker models", before)
+    print_report("Preloaded, shared models", after)
+    saved = before["workers_uss_kb"] - after["workers_uss_kb"]
+    print(f"\nPrivate worker memory: {before['workers_uss_kb'] / 1024:.1f} -> "
+          f"{after['workers_uss_kb'] / 1024:.1f} MiB ({saved / 1024:.1f} MiB saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Seeded synthetic corpus of Jharkhand tourism reviews for benchmarks.
+
+The same seed always yields the same reviews, so timings from different
+commits are measured on identical input.
+"""
+import random
+from typing import Dict, List
+
+PLACES = [
+    "Hundru Falls", "Dassam Falls", "Betla National Park", "Netarhat", "Patratu Valley",
+    "Jonha Falls", "Deoghar", "Parasnath Hill", "Ranchi Lake", "Dalma Wildlife Sanctuary"
+]
+
+ASPECTS = {
+    "guide": ["the tour guide", "our guide", "the local guide"],
+    "accommodation": ["the hotel", "our room", "the homestay", "the stay"],
+    "transport": ["the bus", "the car", "transport from Ranchi", "the travel arrangements"],
+    "food": ["the food", "the restaurant", "every meal", "the local dining"],
+    "price": ["the price", "the ticket cost", "the overall value"],
+    "platform": ["the booking platform", "the app", "the marketplace"]
+}
+
+OPINIONS = {
+    "positive": [
+        "was amazing", "was knowledgeable and friendly", "felt authentic", "was excellent",
+        "was breathtaking", "was very helpful", "made the trip memorable", "was wonderful"
+    ],
+    "negative": [
+        "was disappointing", "was dirty", "was delayed by two hours", "felt overpriced",
+        "was crowded and noisy", "was rude", "was terrible", "was not worth it"
+    ],
+    "neutral": [
+        "was okay", "was as expected", "was average", "could be better organized",
+        "was fine for a short visit"
+    ]
+}
+
+CONNECTORS = ["", "but", "and", "although", "however,"]
+
+SUGGESTIONS = [
+    "I suggest better signage near the entrance.",
+    "They should improve the road to the viewpoint.",
+    "Need more dustbins along the trail.",
+    "I would recommend booking in advance.",
+    ""
+]
+
+# Target word counts of short, typical and long reviews
+LENGTHS = {"short": 12, "typical": 50, "long": 180}
+
+CATEGORIES = list(ASPECTS)
+
+
+def _sentence(rng: random.Random) -> str:
+    aspect = rng.choice(CATEGORIES)
+    mood = rng.choices(["positive", "negative", "neutral"], weights=[5, 3, 2])[0]
+    subject = rng.choice(ASPECTS[aspect])
+    connector = rng.choice(CONNECTORS)
+    clause = f"{subject} at {rng.choice(PLACES)} {rng.choice(OPINIONS[mood])}"
+    if connector:
+        other = rng.choice(["positive", "negative", "neutral"])
+        clause += f" {connector} {rng.choice(ASPECTS[rng.choice(CATEGORIES)])} {rng.choice(OPINIONS[other])}"
+    return clause[0].upper() + clause[1:] + rng.choice([".", "!", ".", "..."])
+
+
+def make_review(rng: random.Random, target_words: int) -> str:
+    """Build one review of roughly ``target_words`` words"""
+    sentences, words = [], 0
+    while words < target_words:
+        sentence = _sentence(rng)
+        sentences.append(sentence)
+        words += len(sentence.split())
+    suggestion = rng.choice(SUGGESTIONS)
+    if suggestion:
+        sentences.append(suggestion)
+    return " ".join(sentences)
+
+
+def make_corpus(count: int, length: str = "typical", seed: int = 42) -> List[str]:
+    """Build ``count`` reproducible reviews of one length class"""
+    rng = random.Random(f"{seed}-{length}")
+    return [make_review(rng, LENGTHS[length]) for _ in range(count)]
+
+
+def make_feedback(count: int, seed: int = 42) -> List[Dict[str, object]]:
+    """Build reproducible feedback submissions of mixed lengths and categories"""
+    rng = random.Random(f"{seed}-feedback")
+    return [
+        {
+            "user": f"visitor{i}",
+            "rating": rng.randint(1, 5),
+            "comment": make_review(rng, LENGTHS[rng.choice(list(LENGTHS))]),
+            "category": rng.choice(CATEGORIES),
+            "language": "en"
+        }
+        for i in range(count)
+    ]
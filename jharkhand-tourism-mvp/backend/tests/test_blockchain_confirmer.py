@@ -0,0 +1,73 @@
+import asyncio
+
+from app.services.blockchain_confirmer import TransactionConfirmer
+from app.utils.local_chain import LocalChain
+
+
+def transaction(i, gas=21000, gas_price=20):
+    return {"hash": f"0x{i:064x}", "from": "0x1", "to": "0x2", "value": 0, "gas": gas, "gas_price": gas_price}
+
+
+async def confirm_in_background(confirmer, transactions, timeout=2.0):
+    confirmer.start()
+    try:
+        for tx in transactions:
+            confirmer.submit(tx)
+        return await asyncio.gather(*(confirmer.wait_for(tx["hash"], timeout) for tx in transactions))
+    finally:
+        running = confirmer.get_stats()["running"]
+        await confirmer.stop()
+        assert running
+
+
+def test_submit_returns_pending_and_background_task_confirms():
+    confirmer = TransactionConfirmer(LocalChain(), block_interval=0.01)
+    results = asyncio.run(confirm_in_background(confirmer, [transaction(1), transaction(2)]))
+    assert [tx["status"] for tx in results] == ["confirmed", "confirmed"]
+    assert confirmer.get_stats()["confirmed"] == 2
+
+
+def test_failing_callback_does_not_stop_confirmation():
+    def on_confirmed(tx):
+        if tx["hash"] == transaction(1)["hash"]:
+            raise KeyError("boom")
+
+    confirmer = TransactionConfirmer(LocalChain(), block_interval=0.01, on_confirmed=on_confirmed)
+    results = asyncio.run(confirm_in_background(confirmer, [transaction(1), transaction(2)]))
+    assert [tx["status"] for tx in results] == ["confirmed", "confirmed"]
+    assert confirmer.errors == 1
+    assert "KeyError" in confirmer.get_stats()["last_error"]
+
+
+def test_failing_block_is_logged_and_the_task_keeps_running(caplog):
+    chain = LocalChain()
+    append_block = chain.append_block
+    calls = []
+
+    def flaky_append_block(transactions, timestamp=None):
+        calls.append(len(transactions))
+        if len(calls) == 1:
+            raise RuntimeError("disk full")
+        return append_block(transactions, timestamp)
+
+    chain.append_block = flaky_append_block
+    confirmer = TransactionConfirmer(chain, block_interval=0.01)
+
+    async def scenario():
+        confirmer.start()
+        first = confirmer.submit(transaction(1))
+        while not confirmer.errors:
+            await asyncio.sleep(0.01)
+        # The failed block's transaction went back to the mempool; it is confirmed with later ones
+        second = confirmer.submit(transaction(2))
+        await confirmer.wait_for(second["hash"], 2.0)
+        alive = confirmer.get_stats()["running"]
+        await confirmer.stop()
+        return [first, second], alive
+
+    results, alive = asyncio.run(scenario())
+    assert alive
+    assert [tx["status"] for tx in results] == ["confirmed", "confirmed"]
+    assert confirmer.get_stats()["confirmed"] == 2
+    assert confirmer.get_stats()["errors"] == 1
+    assert "Confirming a block failed" in caplog.text
@@ -0,0 +1,52 @@
+import pytest
+
+from app.services.sentiment_service import SentimentService
+from app.utils import cache
+from app.utils.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    results = TTLCache(maxsize=10, ttl=60)
+    results.set("a", 1)
+    clock[0] += 59
+    assert results.get("a") == 1
+    clock[0] += 2
+    assert results.get("a") is None
+    stats = results.get_stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"], stats["size"]) == (1, 1, 1, 0)
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    results = TTLCache(maxsize=2, ttl=0)
+    results.set("a", 1)
+    results.set("b", 2)
+    results.get("a")
+    results.set("c", 3)
+    assert results.get("b") is None
+    assert (results.get("a"), results.get("c")) == (1, 3)
+    assert results.get_stats()["evictions"] == 1
+
+
+def test_zero_maxsize_disables_the_cache():
+    results = TTLCache(maxsize=0)
+    results.set("a", 1)
+    assert results.get("a") is None and len(results) == 0
+
+
+def test_analysis_cache_key_ignores_whitespace_but_not_language():
+    service = SentimentService(cache_size=10)
+    first = service.analyze_single_text("Amazing  trip to\nHundru falls")
+    again = service.analyze_single_text("Amazing trip to Hundru falls")
+    assert service.get_cache_stats()["hits"] == 1
+    assert again["text"] == "Amazing trip to Hundru falls"
+    assert again["timestamp"] >= first["timestamp"]
+    assert again is not first
+    service.analyze_single_text("Amazing trip to Hundru falls", "hi")
+    assert service.get_cache_stats()["hits"] == 1
@@ -0,0 +1,60 @@
+import pytest
+
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.text_pipeline import process_text
+
+VOCABULARIES = {
+    "positive": ["friendly", "helpful", "tour guide"],
+    "negative": ["crowded", "expensive", "rude"],
+    "location": ["place", "site"],
+    "accommodation": ["stay", "room"],
+    "transport": ["transport", "car"],
+}
+
+
+@pytest.fixture
+def matcher():
+    return KeywordMatcher(VOCABULARIES)
+
+
+def match(matcher, text):
+    return matcher.match(process_text(text).words)
+
+
+@pytest.mark.parametrize("text", [
+    "unfriendly", "unhelpful", "inexpensive", "website", "replace", "mushroom",
+    "Parasites", "oscars", "scar", "careful", "un-friendly staff", "dis-honest and non-rude",
+])
+def test_words_containing_a_term_do_not_match(matcher, text):
+    assert match(matcher, text) == {}
+
+
+@pytest.mark.parametrize("text, group, term", [
+    ("Friendly guides", "positive", "friendly"),
+    ("our tour guide", "positive", "tour guide"),
+    ("transportation was slow", "transport", "transport"),
+    ("two cars", "transport", "car"),
+    ("an overcrowded market", "negative", "crowded"),
+    ("lovely homestays", "accommodation", "stay"),
+    ("the tribal marketplace", "location", "place"),
+    ("we stayed in a room", "accommodation", "room"),
+])
+def test_whole_words_inflections_and_listed_compounds_match(matcher, text, group, term):
+    assert term in match(matcher, text).get(group, set())
+
+
+def test_multi_word_term_needs_every_word(matcher):
+    assert "tour guide" not in match(matcher, "tour bus guide").get("positive", set())
+
+
+def test_add_and_remove_terms(matcher):
+    assert matcher.add_terms("location", ["waterfall", "site"]) == ["waterfall"]
+    assert match(matcher, "two waterfalls") == {"location": {"waterfall"}}
+    assert matcher.remove_terms("location", ["waterfall"]) == ["waterfall"]
+    assert match(matcher, "two waterfalls") == {}
+
+
+@pytest.mark.parametrize("compounds", [{"unfriendly": "friendly"}, {"disrespect": "respect"}, {"stay": "stay"}])
+def test_compounds_must_have_a_non_negating_prefix(compounds):
+    with pytest.raises(ValueError):
+        KeywordMatcher(VOCABULARIES, compounds=compounds)
@@ -0,0 +1,53 @@
+import json
+import os
+
+import pytest
+
+from app.utils import language_scorers
+from app.utils.language_scorers import LanguageRegistry, normalize_language
+
+
+@pytest.fixture
+def lexicon_dir(tmp_path):
+    (tmp_path / "hi.json").write_text(json.dumps({"lexicon": {"अच्छा": 2.0, "खराब": -2.0}}), encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not a lexicon")
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize("code", ["../etc/passwd", "h", "klingon", "h1", "hi.json"])
+def test_invalid_language_codes_are_rejected(code):
+    with pytest.raises(ValueError):
+        normalize_language(code)
+
+
+@pytest.mark.parametrize("code, expected", [("hi-IN", "hi"), ("Bengali", "bn"), (None, "en"), ("auto", "auto")])
+def test_language_codes_are_normalized(code, expected):
+    assert normalize_language(code) == expected
+
+
+def test_only_listed_lexicon_files_are_available(lexicon_dir):
+    registry = LanguageRegistry(lexicon_dir)
+    assert registry.available() == ["hi"]
+    assert registry.get("hi").polarity_scores("खराब")["compound"] < 0
+    assert registry.get("sat") is None
+    assert registry.get_stats()["requests"] == {"hi": 1}
+
+
+def test_unsupported_languages_do_not_list_the_directory_per_lookup(lexicon_dir, monkeypatch):
+    registry = LanguageRegistry(lexicon_dir)
+    listings = []
+    listdir = os.listdir
+    monkeypatch.setattr(language_scorers.os, "listdir", lambda path: listings.append(path) or listdir(path))
+    for _ in range(100):
+        assert registry.get("sat") is None
+    assert len(listings) == 1
+    assert registry.get_stats()["unsupported"] == 100
+
+
+def test_refresh_picks_up_new_lexicon_files(lexicon_dir):
+    registry = LanguageRegistry(lexicon_dir)
+    assert registry.get("sat") is None
+    with open(os.path.join(lexicon_dir, "sat.json"), "w", encoding="utf-8") as f:
+        json.dump({"lexicon": {"johar": 1.5}}, f)
+    registry.refresh()
+    assert registry.get("sat") is not None
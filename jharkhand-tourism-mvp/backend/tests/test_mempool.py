@@ -0,0 +1,67 @@
+import pytest
+
+from app.utils.constants import BLOCKCHAIN_CONSTANTS
+from app.utils.mempool import MIN_TRANSACTION_GAS, Mempool
+
+GAS_LIMIT = BLOCKCHAIN_CONSTANTS["GAS_LIMIT"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def transaction(name, gas, gas_price):
+    return {"hash": name, "gas": gas, "gas_price": gas_price}
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_block_takes_best_paying_transactions_under_the_gas_limit(clock):
+    pool = Mempool(clock=clock)
+    for i in range(20):
+        pool.add(transaction(f"t{i}", 50000, gas_price=i))
+    block = pool.build_block(GAS_LIMIT)
+    assert sum(tx["gas"] for tx, _ in block) <= GAS_LIMIT
+    assert [tx["hash"] for tx, _ in block] == [f"t{i}" for i in range(19, 19 - GAS_LIMIT // 50000, -1)]
+    assert len(pool) == 20 - len(block)
+
+
+def test_transactions_that_do_not_fit_are_skipped_and_keep_their_place(clock):
+    pool = Mempool(clock=clock)
+    pool.add(transaction("small-high", 100000, gas_price=50))
+    pool.add(transaction("large", 250000, gas_price=40))
+    pool.add(transaction("small-low", 150000, gas_price=10))
+    pool.add(transaction("large-tie", 250000, gas_price=40))
+    block = pool.build_block(GAS_LIMIT)
+    assert [tx["hash"] for tx, _ in block] == ["small-high", "small-low"]
+    assert sum(tx["gas"] for tx, _ in block) <= GAS_LIMIT
+    # Skipped transactions come back in their original order
+    assert [tx["hash"] for tx, _ in pool.build_block(GAS_LIMIT)] == ["large"]
+    assert [tx["hash"] for tx, _ in pool.build_block(GAS_LIMIT)] == ["large-tie"]
+
+
+def test_equal_prices_leave_in_arrival_order_and_max_transactions_caps_the_block(clock):
+    pool = Mempool(clock=clock)
+    for i in range(5):
+        pool.add(transaction(f"t{i}", MIN_TRANSACTION_GAS, gas_price=20))
+    assert [tx["hash"] for tx, _ in pool.build_block(GAS_LIMIT, max_transactions=3)] == ["t0", "t1", "t2"]
+
+
+def test_full_pool_rejects_and_stale_transactions_are_evicted(clock):
+    pool = Mempool(max_size=2, max_age_seconds=10, clock=clock)
+    pool.add(transaction("old", MIN_TRANSACTION_GAS, 1))
+    clock.now = 5
+    pool.add(transaction("new", MIN_TRANSACTION_GAS, 1))
+    with pytest.raises(RuntimeError):
+        pool.add(transaction("extra", MIN_TRANSACTION_GAS, 1))
+    clock.now = 12
+    assert [tx["hash"] for tx in pool.evict_stale()] == ["old"]
+    assert "new" in pool and "old" not in pool
+    assert pool.get_stats()["rejected"] == 1
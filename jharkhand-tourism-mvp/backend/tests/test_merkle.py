@@ -0,0 +1,57 @@
+import pytest
+
+from app.services.blockchain_service import BlockchainService
+from app.utils.merkle import EMPTY_ROOT, merkle_levels, merkle_proof, merkle_root, verify_proof
+
+
+def leaves(n):
+    return [f"certificate-{i}".encode() for i in range(n)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 6, 7, 9, 13, 17])
+def test_every_proof_verifies_against_the_root(size):
+    values = leaves(size)
+    levels = merkle_levels(values)
+    root = merkle_root(values)
+    assert "0x" + levels[-1][0].hex() == root
+    for index, value in enumerate(values):
+        assert verify_proof(value, merkle_proof(levels, index), root)
+
+
+@pytest.mark.parametrize("size", [3, 5, 7])
+def test_proofs_do_not_verify_other_leaves_or_roots(size):
+    values = leaves(size)
+    levels = merkle_levels(values)
+    root = merkle_root(values)
+    last = merkle_proof(levels, size - 1)
+    assert not verify_proof(values[0], last, root)
+    assert not verify_proof(b"forged", last, root)
+    assert not verify_proof(values[-1], last, merkle_root(values[:-1]))
+    tampered = [dict(step, position="right" if step["position"] == "left" else "left") for step in last]
+    assert not verify_proof(values[-1], tampered, root)
+
+
+def test_malformed_proofs_and_indexes():
+    values = leaves(3)
+    levels = merkle_levels(values)
+    root = merkle_root(values)
+    assert not verify_proof(values[0], [{"position": "up", "hash": "0x00"}], root)
+    assert not verify_proof(values[0], [{"hash": "0xzz", "position": "left"}], root)
+    with pytest.raises(ValueError):
+        merkle_proof(levels, 3)
+    assert merkle_root([]) == EMPTY_ROOT
+
+
+def test_batched_certificates_are_valid_once_the_root_is_confirmed():
+    service = BlockchainService()
+    recipients = [{"recipient_name": f"Tourist {i}", "recipient_wallet": f"0x{i:040x}"} for i in range(5)]
+    batch = service.issue_certificate_batch({"achievement": "Sarhul Festival", "recipients": recipients})
+    issued = batch["certificates"][4]
+    pending = service.verify_certificate_proof(issued["certificate"], issued["proof"])
+    assert pending["included"] and not pending["valid"]
+    while service.confirmer.pending:
+        service.confirmer.confirm_batch()
+    for issued in batch["certificates"]:
+        assert service.verify_certificate_proof(issued["certificate"], issued["proof"])["valid"]
+    forged = dict(batch["certificates"][0]["certificate"], recipient_name="Someone Else")
+    assert not service.verify_certificate_proof(forged, batch["certificates"][0]["proof"])["valid"]
@@ -0,0 +1,77 @@
+import asyncio
+import os
+
+import pytest
+
+from app.services.sentiment_backfill import SentimentBackfill
+from app.services.sentiment_service import SentimentService
+
+
+@pytest.fixture
+def service():
+    service = SentimentService(cache_size=0)
+    for i in range(12):
+        service.process_feedback({"comment": f"Visit {i}: the guide was friendly but the bus was late", "rating": 3})
+    return service
+
+
+def run(backfill, resume=True):
+    job = {}
+    asyncio.run(backfill._run(job, resume))
+    return job
+
+
+def interrupt_after(backfill, chunks):
+    analyze = backfill._analyze
+    calls = []
+
+    async def flaky(texts, languages):
+        if len(calls) == chunks:
+            raise RuntimeError("worker died")
+        calls.append(len(texts))
+        return await analyze(texts, languages)
+
+    backfill._analyze = flaky
+
+
+def test_backfill_rescores_everything(service, tmp_path):
+    job = run(SentimentBackfill(service, checkpoint_dir=str(tmp_path), chunk_size=5))
+    assert job["summary"]["rescored"] == len(service.feedback_data)
+    assert job["summary"]["resumed_from"] == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_interrupted_backfill_resumes_from_the_last_chunk(service, tmp_path):
+    backfill = SentimentBackfill(service, checkpoint_dir=str(tmp_path), chunk_size=5)
+    interrupt_after(backfill, 2)
+    with pytest.raises(RuntimeError):
+        run(backfill)
+    job = run(SentimentBackfill(service, checkpoint_dir=str(tmp_path), chunk_size=5))
+    assert job["summary"]["resumed_from"] == 10
+    assert job["summary"]["rescored"] == len(service.feedback_data)
+
+
+def test_checkpoint_is_not_reused_after_the_vocabulary_changes(service, tmp_path):
+    backfill = SentimentBackfill(service, checkpoint_dir=str(tmp_path), chunk_size=5)
+    interrupt_after(backfill, 1)
+    with pytest.raises(RuntimeError):
+        run(backfill)
+    service.add_keywords("positive", ["serene"])
+    job = run(SentimentBackfill(service, checkpoint_dir=str(tmp_path), chunk_size=5))
+    assert job["summary"]["resumed_from"] == 0
+
+
+def test_feedback_added_during_the_backfill_is_folded_in(service, tmp_path):
+    backfill = SentimentBackfill(service, checkpoint_dir=str(tmp_path), chunk_size=5)
+    total = len(service.feedback_data)
+    analyze = backfill._analyze
+
+    async def analyze_and_receive(texts, languages):
+        if len(service.feedback_data) == total:
+            service.process_feedback({"comment": "यह जगह बहुत खराब थी", "rating": 1, "language": "hi"})
+        return await analyze(texts, languages)
+
+    backfill._analyze = analyze_and_receive
+    job = run(backfill)
+    assert job["summary"]["added_during_backfill"] == 1
+    assert job["summary"]["rescored"] == total
@@ -0,0 +1,56 @@
+import pytest
+
+from app.services.sentiment_service import SentimentService
+from app.utils.minhash import MinHashLSH
+
+COMMENT = "The homestay near the waterfall was lovely and our guide was friendly and patient"
+
+
+@pytest.fixture
+def service():
+    return SentimentService(cache_size=100)
+
+
+def test_minhash_finds_near_duplicates_only():
+    index = MinHashLSH(threshold=0.8)
+    assert index.add(1, COMMENT) is None
+    duplicate = index.add(2, COMMENT + "!")
+    assert duplicate is not None and duplicate[0] == 1 and duplicate[1] >= 0.8
+    assert index.add(3, "The bus to Netarhat broke down twice and nobody helped") is None
+
+
+def test_near_duplicate_reuses_the_cluster_result_with_its_own_text_and_timestamp(service):
+    first = service.process_feedback({"comment": COMMENT, "rating": 5})
+    second = service.process_feedback({"comment": COMMENT + "!", "rating": 5})
+    original, reused = first["sentiment_analysis"], second["sentiment_analysis"]
+    assert reused["duplicate_of"] == first["feedback"]["id"]
+    assert reused["sentiment"] == original["sentiment"]
+    assert reused["text"] == COMMENT + "!"
+    assert reused["timestamp"] >= original["timestamp"]
+    assert reused is not original and "duplicate_of" not in original
+
+
+def test_near_duplicate_in_another_language_is_analyzed_in_its_language(service, monkeypatch):
+    service.process_feedback({"comment": COMMENT, "rating": 5})
+    languages = []
+    analyze = service.analyze_single_text
+    monkeypatch.setattr(service, "analyze_single_text",
+                        lambda text, language="en": languages.append(language) or analyze(text, language))
+    result = service.process_feedback({"comment": COMMENT + "!", "rating": 5, "language": "hi"})
+    assert languages[0] == "hi"
+    assert "duplicate_of" not in result["sentiment_analysis"]
+    assert result["feedback"]["language"] == "hi"
+
+
+@pytest.mark.parametrize("change", [
+    lambda service: service.add_keywords("accommodation", ["homestay"]),
+    lambda service: service.set_keyword_vocabulary(service.get_keyword_vocabulary()),
+    lambda service: service.configure_cascade(enabled=True),
+])
+def test_vocabulary_and_cascade_changes_invalidate_cached_results(service, change):
+    service.process_feedback({"comment": COMMENT, "rating": 5})
+    service.analyze_single_text("A wonderful trip to Hundru falls")
+    change(service)
+    assert service.get_cache_stats()["size"] == 0
+    result = service.process_feedback({"comment": COMMENT + "!", "rating": 5})
+    assert "duplicate_of" not in result["sentiment_analysis"]
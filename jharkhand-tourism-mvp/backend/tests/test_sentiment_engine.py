@@ -0,0 +1,53 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.services.sentiment_engine import SentimentBatchEngine
+from app.services.sentiment_service import SentimentService
+from app.utils.language_scorers import LanguageRegistry
+
+TEXTS = ["Amazing trip to Hundru falls", "The bus was late and dirty", "Food was okay", "johar seta bes"]
+
+
+@pytest.fixture
+def service(tmp_path):
+    (tmp_path / "sat.json").write_text(json.dumps({"lexicon": {"bes": 2.5, "baṛic": -2.5}}), encoding="utf-8")
+    return SentimentService(cache_size=0, languages=LanguageRegistry(str(tmp_path), max_bytes=1024 * 1024))
+
+
+@pytest.fixture
+def engine(service):
+    engine = SentimentBatchEngine(service, chunk_size=2, max_workers=2)
+    yield engine
+    engine.shutdown()
+
+
+def wait_ready(engine, timeout=60.0):
+    engine.start()
+    deadline = time.monotonic() + timeout
+    while not engine.ready and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return engine.ready
+
+
+def test_every_worker_warms_up_once(engine):
+    assert wait_ready(engine)
+    workers = engine.workers_ready()
+    assert len(workers) == 2
+    assert len({worker["pid"] for worker in workers}) == 2
+
+
+def test_batch_results_match_single_analysis_in_input_order(engine, service):
+    results = asyncio.run(engine.analyze_batch(TEXTS * 3))
+    expected = [service.analyze_single_text(text)["sentiment"] for text in TEXTS * 3]
+    assert [result["sentiment"] for result in results] == expected
+
+
+def test_workers_use_the_parent_lexicon_registry(engine, service):
+    results = asyncio.run(engine.analyze_batch(TEXTS, "sat"))
+    expected = service.analyze_single_text(TEXTS[-1], "sat")
+    assert results[-1]["sentiment"] == expected["sentiment"] == "positive"
+    assert results[-1]["score"] == expected["score"]
+    assert results[-1]["scorers"] == expected["scorers"]
@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+
+from app.utils.topic_tracker import SpaceSaving, TopicTracker
+
+
+def day(offset):
+    return (datetime.utcnow() - timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+def test_space_saving_keeps_heavy_hitters_within_capacity():
+    summary = SpaceSaving(capacity=3)
+    for topic in ["waterfall"] * 10 + ["guide"] * 6 + ["food", "bus", "hotel", "bus"]:
+        summary.add(topic)
+    top = summary.top(2)
+    assert [entry["topic"] for entry in top] == ["waterfall", "guide"]
+    assert top[0] == {"topic": "waterfall", "count": 10, "error": 0}
+    assert len(summary.counts) == 3
+    assert summary.total == 20
+
+
+def test_windowed_reads_only_count_days_in_the_window():
+    tracker = TopicTracker()
+    tracker.add(["waterfall"] * 5, day=day(10))
+    tracker.add(["guide", "guide"], day=day(1))
+    tracker.add(["waterfall"], day=day(0))
+    assert tracker.top(1)[0]["topic"] == "waterfall"
+    assert tracker.top(2, days=7) == [{"topic": "guide", "count": 2}, {"topic": "waterfall", "count": 1}]
+
+
+def test_windowed_reads_honour_the_category():
+    tracker = TopicTracker()
+    tracker.add(["waterfall", "waterfall"], category="nature", day=day(0))
+    tracker.add(["museum"], category="culture", day=day(0))
+    assert tracker.top(5, category="culture", days=7) == [{"topic": "museum", "count": 1}]
+    assert tracker.top(5, category="unknown", days=7) == []
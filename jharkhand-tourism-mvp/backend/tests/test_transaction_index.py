@@ -0,0 +1,99 @@
+import pytest
+
+from app.services.blockchain_service import BlockchainService
+from app.utils.transaction_index import TransactionIndex
+
+CONTRACT = "0x" + "c" * 40
+
+
+def transaction(i, sender="0xA", contract=CONTRACT, value=1.0):
+    return {"hash": f"0x{i:064x}", "from": sender, "to": "0xB", "value": value, "gas": 21000,
+            "type": "transfer", "timestamp": f"2024-01-01T00:00:{i:02d}", "contract_address": contract}
+
+
+def hashes(page):
+    return [tx["hash"] for tx in page["transactions"]]
+
+
+def test_pages_walk_the_history_newest_first():
+    index = TransactionIndex()
+    for i in range(7):
+        index.add(transaction(i))
+    seen, cursor = [], None
+    while True:
+        page = index.address_history("0xa", cursor, limit=3)
+        seen += hashes(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [transaction(i)["hash"] for i in reversed(range(7))]
+    assert page["total"] == 7
+
+
+def test_cursors_stay_stable_while_new_transactions_arrive():
+    index = TransactionIndex()
+    for i in range(6):
+        index.add(transaction(i))
+    first = index.address_history("0xA", limit=3)
+    for i in range(6, 10):
+        index.add(transaction(i))
+    second = index.address_history("0xA", first["next_cursor"], limit=3)
+    assert hashes(second) == [transaction(i)["hash"] for i in (2, 1, 0)]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["abc", "-1", "99"])
+def test_invalid_cursors_are_rejected(cursor):
+    index = TransactionIndex()
+    index.add(transaction(0))
+    with pytest.raises(ValueError):
+        index.contract_history(CONTRACT, cursor)
+
+
+def test_contract_stats_are_running_totals_and_duplicates_are_ignored():
+    index = TransactionIndex()
+    for i in range(4):
+        index.add(transaction(i, sender=f"0x{i % 2}", value=0.5))
+    index.add(transaction(0))
+    stats = index.contract_stats("0x" + "C" * 40)
+    assert stats["total_transactions"] == 4
+    assert stats["active_users"] == 2
+    assert stats["transaction_volume"] == 2.0
+    assert stats["last_activity"] == "2024-01-01T00:00:03"
+    assert index.contract_stats("0xunknown") is None
+
+
+def test_a_transaction_that_cannot_be_indexed_leaves_the_index_untouched():
+    index = TransactionIndex()
+    index.add(transaction(0))
+    with pytest.raises(ValueError):
+        index.add(dict(transaction(1), value="lots"))
+    assert len(index) == 1
+    assert index.contract_stats(CONTRACT)["total_transactions"] == 1
+    assert index.address_history("0xA")["total"] == 1
+
+
+def test_failed_indexing_withdraws_the_submitted_transaction(monkeypatch):
+    service = BlockchainService()
+    before = (len(service.confirmer.pending), service.confirmer.submitted, len(service.mock_transactions))
+
+    def fail(transaction):
+        raise ValueError("cannot index")
+
+    monkeypatch.setattr(service.transaction_index, "add", fail)
+    with pytest.raises(ValueError):
+        service.create_transaction("0xA", "0xB", 1.0, {"type": "transfer"})
+    assert (len(service.confirmer.pending), service.confirmer.submitted, len(service.mock_transactions)) == before
+
+
+@pytest.mark.parametrize("args", [
+    (None, "0xB", 1.0, {}),
+    ("0xA", "0xB", "1", {}),
+    ("0xA", "0xB", 1.0, []),
+])
+def test_invalid_transactions_are_rejected_before_submitting(args):
+    service = BlockchainService()
+    submitted = service.confirmer.submitted
+    with pytest.raises(ValueError):
+        service.create_transaction(*args)
+    assert service.confirmer.submitted == submitted